@@ -45,7 +45,7 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiInsightsData:
     """Runtime data for UniFi Insights integration (Platinum multi-coordinator)."""
 
@@ -105,6 +105,70 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:  # noqa: ARG00
     return True
 
 
+async def _async_validate_network_client(network_client: UniFiNetworkClient) -> None:
+    """Verify we can authenticate with the Network API by fetching sites."""
+    _LOGGER.debug("Validating Network API connection")
+    try:
+        sites = await network_client.sites.get_all()
+        if not sites:
+            msg = "No sites found - API key may be invalid"
+            _LOGGER.error(msg)
+            raise ConfigEntryAuthFailed(msg)
+        _LOGGER.info("Network API validated successfully, found %d sites", len(sites))
+    except UniFiAuthenticationError as err:
+        msg = "Invalid API key or unable to connect to Network API"
+        _LOGGER.warning(msg)
+        raise ConfigEntryAuthFailed(msg) from err
+
+
+async def _async_validate_protect_client(
+    protect_client: UniFiProtectClient,
+) -> UniFiProtectClient | None:
+    """Verify the Protect API by fetching cameras; return None if unusable."""
+    _LOGGER.debug("Validating Protect API connection")
+    try:
+        cameras = await protect_client.cameras.get_all()
+        if cameras is None or not isinstance(cameras, list):
+            _LOGGER.warning(
+                "Protect API returned invalid data, disabling Protect support"
+            )
+            return None
+        if len(cameras) == 0:
+            # Empty list could be valid (no cameras) or a
+            # normalised API failure. Probe NVR to disambiguate.
+            try:
+                nvr = await protect_client.nvr.get()
+            except (
+                UniFiAuthenticationError,
+                UniFiConnectionError,
+                UniFiTimeoutError,
+            ) as err:
+                _LOGGER.warning(
+                    "Protect API validation failed, disabling Protect support: %s",
+                    err,
+                )
+                return None
+            if not nvr:
+                _LOGGER.warning(
+                    "Protect API returned empty data, disabling Protect support"
+                )
+                return None
+            _LOGGER.info("Protect API validated successfully, no cameras found")
+        else:
+            _LOGGER.info(
+                "UniFi Protect API validated successfully, found %d cameras",
+                len(cameras),
+            )
+    except Exception as err:
+        _LOGGER.warning(
+            "Error validating UniFi Protect API connection, "
+            "continuing without Protect support: %s",
+            err,
+        )
+        return None
+    return protect_client
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: UnifiInsightsConfigEntry
 ) -> bool:
@@ -159,22 +223,6 @@ async def async_setup_entry(
                 session=websession,
             )
 
-        # Verify we can authenticate with Network API by fetching sites
-        _LOGGER.debug("Validating Network API connection")
-        try:
-            sites = await network_client.sites.get_all()
-            if not sites:
-                msg = "No sites found - API key may be invalid"
-                _LOGGER.error(msg)
-                raise ConfigEntryAuthFailed(msg)
-            _LOGGER.info(
-                "Network API validated successfully, found %d sites", len(sites)
-            )
-        except UniFiAuthenticationError as err:
-            msg = "Invalid API key or unable to connect to Network API"
-            _LOGGER.warning(msg)
-            raise ConfigEntryAuthFailed(msg) from err
-
         # Initialize UniFi Protect API client
         protect_client: UniFiProtectClient | None = None
         if is_local:
@@ -196,58 +244,20 @@ async def async_setup_entry(
                 session=websession,
             )
 
-        # Verify UniFi Protect API connection by fetching cameras
-        if protect_client:
-            _LOGGER.debug("Validating Protect API connection")
-            try:
-                cameras = await protect_client.cameras.get_all()
-                if cameras is None or not isinstance(cameras, list):
-                    _LOGGER.warning(
-                        "Protect API returned invalid data, disabling Protect support"
-                    )
-                    protect_client = None
-                elif len(cameras) == 0:
-                    # Empty list could be valid (no cameras) or a
-                    # normalised API failure. Probe NVR to disambiguate.
-                    try:
-                        nvr = await protect_client.nvr.get()
-                    except (
-                        UniFiAuthenticationError,
-                        UniFiConnectionError,
-                        UniFiTimeoutError,
-                    ) as err:
-                        _LOGGER.warning(
-                            "Protect API validation failed, "
-                            "disabling Protect support: %s",
-                            err,
-                        )
-                        protect_client = None
-                    else:
-                        if not nvr:
-                            _LOGGER.warning(
-                                "Protect API returned empty data, "
-                                "disabling Protect support"
-                            )
-                            protect_client = None
-                        else:
-                            _LOGGER.info(
-                                "Protect API validated successfully, no cameras found"
-                            )
-                else:
-                    _LOGGER.info(
-                        "UniFi Protect API validated successfully, found %d cameras",
-                        len(cameras),
-                    )
-            except Exception as err:
-                _LOGGER.warning(
-                    "Error validating UniFi Protect API connection, "
-                    "continuing without Protect support: %s",
-                    err,
-                )
-                protect_client = None
-
-    # Note: UniFiAuthenticationError is already handled in the inner try block
-    # at lines 176-179, which converts it to ConfigEntryAuthFailed
+        # Protect is validated while the Network check runs so the round trips
+        # overlap; a failed Network check cancels it
+        protect_validation = asyncio.create_task(
+            _async_validate_protect_client(protect_client)
+        )
+        try:
+            await _async_validate_network_client(network_client)
+        except BaseException:
+            protect_validation.cancel()
+            raise
+        protect_client = await protect_validation
+
+    # Note: UniFiAuthenticationError is already handled in
+    # _async_validate_network_client, which converts it to ConfigEntryAuthFailed
     except UniFiConnectionError as err:
         _LOGGER.warning("Connection error: %s", err)
         msg = f"Error communicating with UniFi API: {err}"
@@ -345,26 +355,27 @@ async def async_unload_entry(
     if unload_ok and hasattr(entry, "runtime_data") and entry.runtime_data:
         data = entry.runtime_data
         _LOGGER.debug("Closing API clients")
-        if data.protect_client:
-            # Stop WebSocket if active (on protect coordinator)
-            if data.protect_coordinator:
-                websocket_task = getattr(
-                    data.protect_coordinator, "websocket_task", None
-                )
-                if websocket_task:
-                    websocket_task.cancel()
-            # Close Protect client (await the async close)
-            try:
-                await data.protect_client.close()
-            except Exception as err:
-                _LOGGER.debug("Error closing Protect client: %s", err)
-
-        # Close Network client (await the async close)
-        if data.network_client:
-            try:
-                await data.network_client.close()
-            except Exception as err:
-                _LOGGER.debug("Error closing Network client: %s", err)
+        # Stop WebSocket if active (on protect coordinator)
+        if data.protect_client and data.protect_coordinator:
+            websocket_task = getattr(data.protect_coordinator, "websocket_task", None)
+            if websocket_task:
+                websocket_task.cancel()
+
+        # Close both clients together; one failing must not skip the other
+        clients = [
+            (name, client)
+            for name, client in (
+                ("Protect", data.protect_client),
+                ("Network", data.network_client),
+            )
+            if client
+        ]
+        results = await asyncio.gather(
+            *(client.close() for _, client in clients), return_exceptions=True
+        )
+        for (name, _), result in zip(clients, results, strict=True):
+            if isinstance(result, Exception):
+                _LOGGER.debug("Error closing %s client: %s", name, result)
 
     return unload_ok
 
@@ -2,25 +2,43 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
 import re
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from functools import partial
 from http import HTTPStatus
 from types import TracebackType
-from typing import Any, Self
+from typing import Any, NoReturn, Self
 
 import aiohttp
+import orjson
 from yarl import URL
 
 from .auth import ApiKeyAuth, LocalAuth
 from .const import (
+    CIRCUIT_BREAKER_COOLDOWN,
+    CIRCUIT_BREAKER_THRESHOLD,
+    CONNECTOR_LIMIT,
+    CONNECTOR_LIMIT_PER_HOST,
     CONTENT_TYPE_JSON,
     DEFAULT_CONNECT_TIMEOUT,
     DEFAULT_RATE_LIMIT_RETRY_AFTER,
     DEFAULT_TIMEOUT,
+    ETAG_CACHE_MAX_ENTRIES,
     HEADER_ACCEPT,
     HEADER_CONTENT_TYPE,
+    HEADER_ETAG,
+    HEADER_IF_NONE_MATCH,
     HEADER_USER_AGENT,
+    KEEPALIVE_TIMEOUT,
+    REQUEST_RETRY_ATTEMPTS,
+    REQUEST_RETRY_BASE_DELAY,
+    REQUEST_RETRY_JITTER,
     USER_AGENT,
 )
 from .exceptions import (
@@ -35,18 +53,26 @@ from .exceptions import (
 _LOGGER = logging.getLogger(__name__)
 
 _SENSITIVE_KEYS_RE = re.compile(
-    r'"(?:password|psk|passphrase|token|apiKey|api_key|secret|credential|'
-    r'x-api-key|authorization|code|voucher|fingerprint)"\s*:\s*"[^"]*"',
+    r'("(?:password|psk|passphrase|token|apiKey|api_key|secret|credential|'
+    r'x-api-key|authorization|code|voucher|fingerprint)"\s*):\s*"[^"]*"',
     re.IGNORECASE,
 )
 
+# Gateway errors raised while the console restarts or reloads an application
+_TRANSIENT_STATUS_CODES = frozenset(
+    {
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    }
+)
+
 
 def _redact(text: str) -> str:
     """Replace sensitive JSON field values with a redaction placeholder."""
-    return _SENSITIVE_KEYS_RE.sub(
-        lambda m: m.group(0).rsplit(":", 1)[0] + ': "**REDACTED**"',
-        text,
-    )
+    # A template replacement keeps the substitution in C; the captured key also
+    # stops a colon inside the value from leaking part of it
+    return _SENSITIVE_KEYS_RE.sub(r'\1: "**REDACTED**"', text)
 
 
 class BaseUniFiClient(ABC):
@@ -85,6 +111,22 @@ class BaseUniFiClient(ABC):
             connect=connect_timeout,
         )
         self._closed = False
+        # Auth is immutable, so the default headers are built once
+        self._headers: dict[str, str] = {
+            HEADER_USER_AGENT: USER_AGENT,
+            HEADER_CONTENT_TYPE: CONTENT_TYPE_JSON,
+            HEADER_ACCEPT: CONTENT_TYPE_JSON,
+            **auth.get_headers(),
+        }
+        self._inflight: dict[tuple[str, frozenset[Any]], asyncio.Task[Any]] = {}
+        # Last ETag and body per GET, used to revalidate with If-None-Match;
+        # least recently used first, capped at ETAG_CACHE_MAX_ENTRIES
+        self._etag_cache: OrderedDict[
+            tuple[str, frozenset[Any]], tuple[str, bytes]
+        ] = OrderedDict()
+        # Consecutive transport failures and when the open circuit may be probed
+        self._breaker_failures = 0
+        self._breaker_open_until = 0.0
 
     @property
     def base_url(self) -> URL:
@@ -107,6 +149,9 @@ class BaseUniFiClient(ABC):
         if self._session is None or self._session.closed:
             connector = aiohttp.TCPConnector(
                 ssl=self._get_ssl_context(),
+                limit=CONNECTOR_LIMIT,
+                limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
             )
             self._session = aiohttp.ClientSession(
                 connector=connector,
@@ -132,16 +177,10 @@ class BaseUniFiClient(ABC):
         Get default headers for requests.
 
         Returns:
-            Dictionary of headers.
+            A copy of the default headers that the caller may modify.
 
         """
-        headers = {
-            HEADER_USER_AGENT: USER_AGENT,
-            HEADER_CONTENT_TYPE: CONTENT_TYPE_JSON,
-            HEADER_ACCEPT: CONTENT_TYPE_JSON,
-        }
-        headers.update(self._auth.get_headers())
-        return headers
+        return dict(self._headers)
 
     def _build_url(self, path: str) -> URL:
         """
@@ -186,13 +225,143 @@ class BaseUniFiClient(ABC):
             UniFiResponseError: If API returns an error.
             UniFiTimeoutError: If request times out.
 
+        """
+        # Concurrent identical GETs share a single HTTP round trip
+        if method != "GET" or json_data is not None or headers:
+            return await self._send_request(
+                method, path, params=params, json_data=json_data, headers=headers
+            )
+
+        key = self._request_key(path, params)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._send_request(method, path, params=params, cache_key=key)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one cancelled caller does not cancel the others' request
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _request_key(
+        path: str, params: dict[str, Any] | None
+    ) -> tuple[str, frozenset[Any]]:
+        """Return a hashable key identifying a GET request."""
+        return path, frozenset(params.items()) if params else frozenset()
+
+    async def _send_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        cache_key: tuple[str, frozenset[Any]] | None = None,
+    ) -> dict[str, Any] | list[Any] | None:
+        """
+        Send an HTTP request to the API.
+
+        Args:
+            method: HTTP method.
+            path: API path.
+            params: Query parameters.
+            json_data: JSON body data.
+            headers: Additional headers.
+            cache_key: Request key from _request_key, built once by the caller;
+                enables ETag revalidation when given.
+
+        Returns:
+            Response data as dict, list, or None.
+
+        """
+        # aiohttp copies the headers, so the shared defaults can be passed as is
+        request_headers = {**self._headers, **headers} if headers else self._headers
+
+        if cache_key is not None and (cached := self._etag_cache.get(cache_key)):
+            request_headers = {**request_headers, HEADER_IF_NONE_MATCH: cached[0]}
+
+        handler = partial(self._handle_response, cache_key=cache_key)
+        attempt = 0
+        while True:
+            try:
+                return await self._raw_request(
+                    method,
+                    path,
+                    handler,
+                    params=params,
+                    json_data=json_data,
+                    headers=request_headers,
+                )
+            except (UniFiConnectionError, UniFiTimeoutError, UniFiResponseError) as err:
+                attempt += 1
+                # Only GETs are safe to repeat without side effects
+                if (
+                    method != "GET"
+                    or attempt >= REQUEST_RETRY_ATTEMPTS
+                    or not self._is_transient_error(err)
+                ):
+                    raise
+                delay = REQUEST_RETRY_BASE_DELAY * 2 ** (attempt - 1)
+                delay *= 1 + random.uniform(0, REQUEST_RETRY_JITTER)  # noqa: S311
+                _LOGGER.debug(
+                    "Retrying %s %s in %.1fs after error: %s", method, path, delay, err
+                )
+                await asyncio.sleep(delay)
+
+    def _is_transient_error(self, err: Exception) -> bool:
+        """
+        Return whether a failed request is worth retrying right away.
+
+        Args:
+            err: The error raised for the request.
+
+        Returns:
+            True for gateway errors, and for connection errors and timeouts
+            while the circuit breaker is still closed.
+
+        """
+        if isinstance(err, UniFiResponseError):
+            return err.status_code in _TRANSIENT_STATUS_CODES
+        return self._breaker_failures < CIRCUIT_BREAKER_THRESHOLD
+
+    async def _raw_request[ResponseResult](
+        self,
+        method: str,
+        path: str,
+        handler: Callable[[aiohttp.ClientResponse], Awaitable[ResponseResult]],
+        *,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+        headers: dict[str, str],
+    ) -> ResponseResult:
+        """
+        Send an HTTP request and map transport failures to UniFi errors.
+
+        JSON and binary requests both go through here, so they share the
+        circuit breaker and the connection error handling.
+
+        Args:
+            method: HTTP method.
+            path: API path.
+            handler: Coroutine turning the response into the result.
+            params: Query parameters.
+            json_data: JSON body data.
+            headers: Complete request headers.
+
+        Returns:
+            The result of the handler.
+
+        Raises:
+            UniFiConnectionError: If connection fails.
+            UniFiTimeoutError: If request times out.
+
         """
         session = await self._ensure_session()
         url = self._build_url(path)
 
-        request_headers = self._get_headers()
-        if headers:
-            request_headers.update(headers)
+        self._check_circuit(url)
 
         _LOGGER.debug(
             "Making %s request to %s",
@@ -206,29 +375,75 @@ class BaseUniFiClient(ABC):
                 url,
                 params=params,
                 json=json_data,
-                headers=request_headers,
+                headers=headers,
+                # Per request, so the limits also apply to a shared session
+                timeout=self._timeout,
             ) as response:
-                return await self._handle_response(response)
+                result = await handler(response)
 
         except aiohttp.ClientConnectorError as err:
+            self._record_transport_failure()
             msg = f"Failed to connect to {url}: {err}"
             raise UniFiConnectionError(msg) from err
         except TimeoutError as err:
+            self._record_transport_failure()
             msg = f"Request to {url} timed out"
             raise UniFiTimeoutError(msg) from err
         except aiohttp.ClientError as err:
+            self._record_transport_failure()
             msg = f"Request to {url} failed: {err}"
             raise UniFiConnectionError(msg) from err
 
+        self._record_transport_success()
+        return result
+
+    def _check_circuit(self, url: URL) -> None:
+        """
+        Fail fast while the controller is known to be unreachable.
+
+        Once the cooldown has passed, a single request is let through as a
+        probe; the circuit stays open for everyone else until it completes.
+
+        Args:
+            url: The URL about to be requested.
+
+        Raises:
+            UniFiConnectionError: If the circuit is open.
+
+        """
+        if self._breaker_failures < CIRCUIT_BREAKER_THRESHOLD:
+            return
+        now = time.monotonic()
+        if now < self._breaker_open_until:
+            msg = (
+                f"Skipping request to {url}: controller unreachable after "
+                f"{self._breaker_failures} consecutive failures"
+            )
+            raise UniFiConnectionError(msg)
+        self._breaker_open_until = now + CIRCUIT_BREAKER_COOLDOWN
+
+    def _record_transport_failure(self) -> None:
+        """Count a transport failure and open the circuit at the threshold."""
+        self._breaker_failures += 1
+        if self._breaker_failures >= CIRCUIT_BREAKER_THRESHOLD:
+            self._breaker_open_until = time.monotonic() + CIRCUIT_BREAKER_COOLDOWN
+
+    def _record_transport_success(self) -> None:
+        """Close the circuit after a request reached the controller."""
+        self._breaker_failures = 0
+
     async def _handle_response(
         self,
         response: aiohttp.ClientResponse,
+        *,
+        cache_key: tuple[str, frozenset[Any]] | None = None,
     ) -> dict[str, Any] | list[Any] | None:
         """
         Handle API response.
 
         Args:
             response: The aiohttp response.
+            cache_key: Key to revalidate and store the response body under.
 
         Returns:
             Response data.
@@ -241,16 +456,67 @@ class BaseUniFiClient(ABC):
 
         """
         status = response.status
-        response_text = await response.text()
-
+        if (
+            status == HTTPStatus.NOT_MODIFIED
+            and cache_key is not None
+            and (cached := self._etag_cache.get(cache_key))
+        ):
+            # Unchanged since the last request, so reuse the stored body
+            body = cached[1]
+        else:
+            body = await response.read()
+
+        # The body is only decoded to text for logging and error reporting
         if _LOGGER.isEnabledFor(logging.DEBUG):
-            redacted_body = _redact(response_text)[:500] if response_text else "empty"
+            redacted_body = (
+                _redact(body.decode(errors="replace"))[:500] if body else "empty"
+            )
             _LOGGER.debug(
                 "Response status: %s, body: %s",
                 status,
                 redacted_body,
             )
 
+        # Successes dominate, so they only pay for a single comparison
+        if status >= HTTPStatus.BAD_REQUEST:
+            self._raise_for_status(response, body)
+
+        if not body:
+            return None
+
+        if cache_key is not None and (etag := response.headers.get(HEADER_ETAG)):
+            etag_cache = self._etag_cache
+            etag_cache[cache_key] = (etag, body)
+            etag_cache.move_to_end(cache_key)
+            if len(etag_cache) > ETAG_CACHE_MAX_ENTRIES:
+                etag_cache.popitem(last=False)
+
+        # orjson parses the raw bytes directly, skipping a UTF-8 decode
+        try:
+            data: dict[str, Any] | list[Any] = orjson.loads(body)
+            return data
+        except orjson.JSONDecodeError:
+            redacted_response = _redact(body.decode(errors="replace"))[:200]
+            _LOGGER.warning("Response is not JSON: %s", redacted_response)
+            return None
+
+    @staticmethod
+    def _raise_for_status(response: aiohttp.ClientResponse, body: bytes) -> NoReturn:
+        """
+        Raise the error matching an unsuccessful response.
+
+        Args:
+            response: The aiohttp response.
+            body: The response body.
+
+        Raises:
+            UniFiAuthenticationError: If authentication fails.
+            UniFiNotFoundError: If resource not found.
+            UniFiRateLimitError: If rate limited.
+            UniFiResponseError: For any other error status.
+
+        """
+        status = response.status
         if status == HTTPStatus.UNAUTHORIZED:
             raise UniFiAuthenticationError("Authentication failed. Check your API key.")
 
@@ -263,7 +529,7 @@ class BaseUniFiClient(ABC):
             raise UniFiNotFoundError(
                 "Resource not found",
                 status_code=status,
-                response_body=response_text,
+                response_body=body.decode(errors="replace"),
             )
 
         if status == HTTPStatus.TOO_MANY_REQUESTS:
@@ -271,32 +537,35 @@ class BaseUniFiClient(ABC):
             raise UniFiRateLimitError(
                 "Rate limited by API",
                 status_code=status,
-                response_body=response_text,
+                response_body=body.decode(errors="replace"),
                 retry_after=int(retry_after)
                 if retry_after
                 else DEFAULT_RATE_LIMIT_RETRY_AFTER,
             )
 
-        if status >= HTTPStatus.BAD_REQUEST:
-            message = f"API error (status {status})"
-            raise UniFiResponseError(
-                message,
-                status_code=status,
-                response_body=response_text,
-            )
+        message = f"API error (status {status})"
+        raise UniFiResponseError(
+            message,
+            status_code=status,
+            response_body=body.decode(errors="replace"),
+        )
 
-        if not response_text:
-            return None
+    @staticmethod
+    def _unwrap_list(response: dict[str, Any] | list[Any] | None) -> list[Any]:
+        """
+        Extract the list payload from a response.
 
-        try:
-            data: dict[str, Any] | list[Any] = await response.json()
-            return data
-        except (ValueError, aiohttp.ContentTypeError):
-            redacted_response = (
-                _redact(response_text)[:200] if response_text else "empty"
-            )
-            _LOGGER.warning("Response is not JSON: %s", redacted_response)
-            return None
+        Args:
+            response: Response data, either a bare list or a ``data`` envelope.
+
+        Returns:
+            The listed items, or an empty list if the response holds none.
+
+        """
+        data = (
+            response.get("data", response) if isinstance(response, dict) else response
+        )
+        return data if isinstance(data, list) else []
 
     async def _get(
         self,
@@ -46,9 +46,38 @@ PROTECT_INTEGRATION_PATH: Final[str] = "/proxy/protect/integration/v1"
 DEFAULT_TIMEOUT: Final[int] = 30
 DEFAULT_CONNECT_TIMEOUT: Final[int] = 10
 
+# Connection pooling for clients that create their own session
+CONNECTOR_LIMIT: Final[int] = 32
+CONNECTOR_LIMIT_PER_HOST: Final[int] = 16
+KEEPALIVE_TIMEOUT: Final[int] = 75
+
 # Rate limiting
 DEFAULT_RATE_LIMIT_RETRY_AFTER: Final[int] = 60
 
+# Circuit breaker: consecutive transport failures before requests fail fast,
+# and how long (in seconds) to wait before letting a probe request through
+CIRCUIT_BREAKER_THRESHOLD: Final[int] = 5
+CIRCUIT_BREAKER_COOLDOWN: Final[int] = 30
+
+# Retries for idempotent requests that hit a transient error: total attempts,
+# first delay in seconds (doubled per retry) and the random jitter fraction
+REQUEST_RETRY_ATTEMPTS: Final[int] = 3
+REQUEST_RETRY_BASE_DELAY: Final[float] = 0.5
+REQUEST_RETRY_JITTER: Final[float] = 0.5
+
+# Most GET responses kept for ETag revalidation; least recently used go first
+ETAG_CACHE_MAX_ENTRIES: Final[int] = 256
+
+# Seconds without WebSocket traffic before a ping is sent; the connection is
+# closed if the pong does not arrive within half that time
+WS_HEARTBEAT_INTERVAL: Final[float] = 30.0
+
+# Longest delay in seconds between WebSocket reconnect attempts
+WS_RECONNECT_MAX_DELAY: Final[float] = 120.0
+
+# Pagination
+MAX_CONCURRENT_PAGE_REQUESTS: Final[int] = 4
+
 # User agent - uses version from single source of truth
 USER_AGENT: Final[str] = f"unifi-official-api/{__version__}"
 
@@ -57,6 +86,8 @@ HEADER_CONTENT_TYPE: Final[str] = "Content-Type"
 HEADER_ACCEPT: Final[str] = "Accept"
 HEADER_USER_AGENT: Final[str] = "User-Agent"
 HEADER_API_KEY: Final[str] = "X-API-Key"
+HEADER_ETAG: Final[str] = "ETag"
+HEADER_IF_NONE_MATCH: Final[str] = "If-None-Match"
 
 # Content types
 CONTENT_TYPE_JSON: Final[str] = "application/json"
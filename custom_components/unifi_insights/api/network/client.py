@@ -120,6 +120,22 @@ class UniFiNetworkClient(BaseUniFiClient):
 
         self._connection_type = connection_type
         self._console_id = console_id
+        # Path prefixes are fixed for the client's lifetime. REMOTE without a
+        # console ID leaves them unset so that building a path raises.
+        self._api_prefix: str | None = None
+        self._legacy_prefix: str | None = None
+        if connection_type == ConnectionType.LOCAL:
+            # Local: /proxy/network/integration/v1 and /proxy/network/api
+            self._api_prefix = NETWORK_INTEGRATION_PATH
+            self._legacy_prefix = NETWORK_LEGACY_PATH
+        elif console_id:
+            # Remote: /v1/connector/consoles/{consoleId}/network/...
+            # The connector adds /proxy/ when forwarding to the console, so strip it.
+            connector = f"/v1/connector/consoles/{console_id}"
+            api_path = NETWORK_INTEGRATION_PATH.removeprefix("/proxy")
+            legacy_path = NETWORK_LEGACY_PATH.removeprefix("/proxy")
+            self._api_prefix = f"{connector}{api_path}"
+            self._legacy_prefix = f"{connector}{legacy_path}"
 
         # Initialize endpoints
         self._devices = DevicesEndpoint(self)
@@ -144,12 +160,12 @@ class UniFiNetworkClient(BaseUniFiClient):
         """Return the console ID (for REMOTE connections)."""
         return self._console_id
 
-    def _require_console_id(self) -> str:
-        """Return the configured console ID or raise when it is missing."""
-        if self._connection_type == ConnectionType.REMOTE and not self._console_id:
+    @staticmethod
+    def _require_prefix(prefix: str | None) -> str:
+        """Return a path prefix or raise when the console ID is missing."""
+        if prefix is None:
             raise ValueError("console_id is required for REMOTE connection type")
-
-        return self._console_id or ""
+        return prefix
 
     def build_api_path(self, endpoint: str) -> str:
         """
@@ -166,16 +182,7 @@ class UniFiNetworkClient(BaseUniFiClient):
         if not endpoint.startswith("/"):
             endpoint = f"/{endpoint}"
 
-        if self._connection_type == ConnectionType.LOCAL:
-            # Local: /proxy/network/integration/v1{endpoint}
-            return f"{NETWORK_INTEGRATION_PATH}{endpoint}"
-
-        console_id = self._require_console_id()
-
-        # Remote: /v1/connector/consoles/{consoleId}/network/integration/v1{endpoint}
-        # The connector adds /proxy/ when forwarding to the console, so strip it.
-        connector_path = NETWORK_INTEGRATION_PATH.removeprefix("/proxy")
-        return f"/v1/connector/consoles/{console_id}{connector_path}{endpoint}"
+        return f"{self._require_prefix(self._api_prefix)}{endpoint}"
 
     def build_legacy_api_path(self, site_name: str, endpoint: str) -> str:
         """
@@ -196,17 +203,7 @@ class UniFiNetworkClient(BaseUniFiClient):
         if not endpoint.startswith("/"):
             endpoint = f"/{endpoint}"
 
-        if self._connection_type == ConnectionType.LOCAL:
-            return f"{NETWORK_LEGACY_PATH}/s/{site_name}{endpoint}"
-
-        console_id = self._require_console_id()
-
-        # The connector adds /proxy/ when forwarding to the console, so strip it.
-        connector_path = NETWORK_LEGACY_PATH.removeprefix("/proxy")
-        return (
-            f"/v1/connector/consoles/{console_id}"
-            f"{connector_path}/s/{site_name}{endpoint}"
-        )
+        return f"{self._require_prefix(self._legacy_prefix)}/s/{site_name}{endpoint}"
 
     def build_legacy_global_api_path(self, endpoint: str) -> str:
         """
@@ -222,13 +219,7 @@ class UniFiNetworkClient(BaseUniFiClient):
         if not endpoint.startswith("/"):
             endpoint = f"/{endpoint}"
 
-        if self._connection_type == ConnectionType.LOCAL:
-            return f"{NETWORK_LEGACY_PATH}{endpoint}"
-
-        console_id = self._require_console_id()
-        # The connector adds /proxy/ when forwarding to the console, so strip it.
-        connector_path = NETWORK_LEGACY_PATH.removeprefix("/proxy")
-        return f"/v1/connector/consoles/{console_id}{connector_path}{endpoint}"
+        return f"{self._require_prefix(self._legacy_prefix)}{endpoint}"
 
     @property
     def devices(self) -> DevicesEndpoint:
@@ -318,16 +309,8 @@ class UniFiNetworkClient(BaseUniFiClient):
             raise ValueError("get_hosts is only available for REMOTE connections")
 
         response = await self._get("/v1/hosts")
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [item for item in data if isinstance(item, dict)]
-
-        return []
+        data = self._unwrap_list(response)
+        return [item for item in data if isinstance(item, dict)]
 
     async def get_application_info(self) -> ApplicationInfo:
         """
@@ -52,15 +52,8 @@ class ACLEndpoint:
 
         response = await self._client._get(path, params=params)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [ACLRule.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [ACLRule.model_validate(item) for item in data]
 
     async def get(self, site_id: str, rule_id: str) -> ACLRule:
         """
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Any
 
+from ...const import MAX_CONCURRENT_PAGE_REQUESTS
 from ...exceptions import UniFiResponseError
 from ..models import Client
 
@@ -61,37 +63,45 @@ class ClientsEndpoint:
                 params["filter"] = filter_str
             return await self._fetch_page(path, params if params else None)
 
-        # Auto-paginate: fetch all pages
+        # Auto-paginate: the first page reports the total, so the remaining
+        # offsets are known up front and fetched concurrently
         page_size = 100
-        current_offset = 0
-        all_clients: list[Client] = []
+        params = {"offset": 0, "limit": page_size}
+        if filter_str:
+            params["filter"] = filter_str
 
-        while True:
-            params = {"offset": current_offset, "limit": page_size}
-            if filter_str:
-                params["filter"] = filter_str
+        response = await self._client._get(path, params=params)
+        if not isinstance(response, dict):
+            return []
 
-            response = await self._client._get(path, params=params)
-            if response is None:
-                break
+        data = response.get("data", response)
+        all_clients = (
+            [Client.model_validate(item) for item in data]
+            if isinstance(data, list)
+            else []
+        )
 
-            if not isinstance(response, dict):
-                break
+        total_count = response.get("totalCount")
+        count = response.get("count", 0)
+        if not isinstance(total_count, int) or not isinstance(count, int) or count == 0:
+            return all_clients
+        # Most sites fit in a single page, so skip the fan-out setup entirely
+        if total_count <= count:
+            return all_clients
 
-            data = response.get("data", response)
-            if isinstance(data, list):
-                all_clients.extend(
-                    Client.model_validate(item) for item in data
-                )
+        # Step by the returned count in case the controller caps the limit
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGE_REQUESTS)
 
-            total_count = response.get("totalCount")
-            count = response.get("count", 0)
-            if total_count is None or not isinstance(count, int) or count == 0:
-                break
+        async def fetch_page(page_offset: int) -> list[Client]:
+            page_params = {**params, "offset": page_offset}
+            async with semaphore:
+                return await self._fetch_page(path, page_params)
 
-            current_offset += count
-            if current_offset >= total_count:
-                break
+        pages = await asyncio.gather(
+            *(fetch_page(o) for o in range(count, total_count, count))
+        )
+        for page in pages:
+            all_clients.extend(page)
 
         return all_clients
 
@@ -103,15 +113,8 @@ class ClientsEndpoint:
         """Fetch a single page of clients."""
         response = await self._client._get(path, params=params)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [Client.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [Client.model_validate(item) for item in data]
 
     async def get_active_legacy(self, site_name: str) -> list[dict[str, Any]]:
         """
@@ -131,15 +134,8 @@ class ClientsEndpoint:
         path = self._client.build_legacy_api_path(site_name, "/stat/sta")
         response = await self._client._get(path)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [item for item in data if isinstance(item, dict)]
-        return []
+        data = self._client._unwrap_list(response)
+        return [item for item in data if isinstance(item, dict)]
 
     async def get(self, site_id: str, client_id: str) -> Client:
         """
@@ -55,15 +55,8 @@ class DevicesEndpoint:
         path = self._client.build_api_path(f"/sites/{site_id}/devices")
         response = await self._client._get(path, params=params if params else None)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [Device.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [Device.model_validate(item) for item in data]
 
     async def get(self, site_id: str, device_id: str) -> Device:
         """
@@ -191,15 +184,8 @@ class DevicesEndpoint:
         path = self._client.build_api_path("/pending-devices")
         response = await self._client._get(path, params=params if params else None)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [Device.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [Device.model_validate(item) for item in data]
 
     async def get_statistics(
         self,
@@ -56,15 +56,8 @@ class DNSEndpoint:
 
         response = await self._client._get(path, params=params)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [DNSPolicy.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [DNSPolicy.model_validate(item) for item in data]
 
     async def get(self, site_id: str, policy_id: str) -> DNSPolicy:
         """
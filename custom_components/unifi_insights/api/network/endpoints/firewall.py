@@ -57,15 +57,8 @@ class FirewallEndpoint:
         path = self._client.build_api_path(f"/sites/{site_id}/firewall/zones")
         response = await self._client._get(path, params=params if params else None)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [FirewallZone.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [FirewallZone.model_validate(item) for item in data]
 
     async def get_zone(self, site_id: str, zone_id: str) -> FirewallZone:
         """
@@ -229,17 +222,10 @@ class FirewallEndpoint:
 
         return all_rules
 
-    @staticmethod
-    def _parse_rules_response(response: Any) -> list[FirewallRule]:
+    def _parse_rules_response(self, response: Any) -> list[FirewallRule]:
         """Parse a firewall policies API response into a list of rules."""
-        if response is None:
-            return []
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [FirewallRule.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [FirewallRule.model_validate(item) for item in data]
 
     async def get_rule(self, site_id: str, rule_id: str) -> FirewallRule:
         """
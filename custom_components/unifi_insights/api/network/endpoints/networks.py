@@ -55,15 +55,8 @@ class NetworksEndpoint:
         path = self._client.build_api_path(f"/sites/{site_id}/networks")
         response = await self._client._get(path, params=params if params else None)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [Network.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [Network.model_validate(item) for item in data]
 
     async def get(self, site_id: str, network_id: str) -> Network:
         """
@@ -63,15 +63,8 @@ class ResourcesEndpoint:
         path = self._client.build_api_path(f"/sites/{site_id}/wans")
         response = await self._client._get(path, params=params if params else None)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [WANInterface.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [WANInterface.model_validate(item) for item in data]
 
     # VPN Tunnels
 
@@ -107,15 +100,8 @@ class ResourcesEndpoint:
         path = self._client.build_api_path(f"/sites/{site_id}/vpn/tunnels")
         response = await self._client._get(path, params=params if params else None)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [VPNTunnel.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [VPNTunnel.model_validate(item) for item in data]
 
     # VPN Servers
 
@@ -151,15 +137,8 @@ class ResourcesEndpoint:
         path = self._client.build_api_path(f"/sites/{site_id}/vpn/servers")
         response = await self._client._get(path, params=params if params else None)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [VPNServer.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [VPNServer.model_validate(item) for item in data]
 
     # RADIUS Profiles
 
@@ -195,15 +174,8 @@ class ResourcesEndpoint:
         path = self._client.build_api_path(f"/sites/{site_id}/radius/profiles")
         response = await self._client._get(path, params=params if params else None)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [RADIUSProfile.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [RADIUSProfile.model_validate(item) for item in data]
 
     # Device Tags
 
@@ -239,12 +211,5 @@ class ResourcesEndpoint:
         path = self._client.build_api_path(f"/sites/{site_id}/device-tags")
         response = await self._client._get(path, params=params if params else None)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [DeviceTag.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [DeviceTag.model_validate(item) for item in data]
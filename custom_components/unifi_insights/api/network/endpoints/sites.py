@@ -53,15 +53,8 @@ class SitesEndpoint:
         path = self._client.build_api_path("/sites")
         response = await self._client._get(path, params=params if params else None)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [Site.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [Site.model_validate(item) for item in data]
 
     async def get(self, site_id: str) -> Site:
         """
@@ -64,15 +64,8 @@ class TrafficEndpoint:
         path = self._client.build_api_path(f"/sites/{site_id}/traffic-matching-lists")
         response = await self._client._get(path, params=params if params else None)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [TrafficMatchingList.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [TrafficMatchingList.model_validate(item) for item in data]
 
     async def get_list(self, site_id: str, list_id: str) -> TrafficMatchingList:
         """
@@ -202,15 +195,8 @@ class TrafficEndpoint:
         path = self._client.build_api_path(f"/sites/{site_id}/dpi/categories")
         response = await self._client._get(path)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [DPICategory.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [DPICategory.model_validate(item) for item in data]
 
     async def get_dpi_applications(self, site_id: str) -> list[DPIApplication]:
         """
@@ -226,15 +212,8 @@ class TrafficEndpoint:
         path = self._client.build_api_path(f"/sites/{site_id}/dpi/applications")
         response = await self._client._get(path)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [DPIApplication.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [DPIApplication.model_validate(item) for item in data]
 
     async def get_countries(self, site_id: str) -> list[Country]:
         """
@@ -250,12 +229,5 @@ class TrafficEndpoint:
         path = self._client.build_api_path(f"/sites/{site_id}/geo/countries")
         response = await self._client._get(path)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [Country.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [Country.model_validate(item) for item in data]
@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Final
 
 from ..models.voucher import Voucher
 
 if TYPE_CHECKING:
     from ..client import UniFiNetworkClient
 
+# API field names for the optional voucher settings, in create() argument order
+_VOUCHER_OPTION_KEYS: Final = (
+    "name",
+    "authorizedGuestLimit",
+    "timeLimitMinutes",
+    "dataUsageLimitMBytes",
+    "rxRateLimitKbps",
+    "txRateLimitKbps",
+)
+
 
 class VouchersEndpoint:
     """Endpoint for managing hotspot vouchers."""
@@ -52,15 +62,8 @@ class VouchersEndpoint:
 
         response = await self._client._get(path, params=params)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [Voucher.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [Voucher.model_validate(item) for item in data]
 
     async def get(self, site_id: str, voucher_id: str) -> Voucher:
         """
@@ -117,19 +120,20 @@ class VouchersEndpoint:
 
         """
         path = self._client.build_api_path(f"/sites/{site_id}/hotspot/vouchers")
+        options = zip(
+            _VOUCHER_OPTION_KEYS,
+            (
+                name,
+                authorized_guest_limit,
+                time_limit_minutes,
+                data_usage_limit_mbytes,
+                rx_rate_limit_kbps,
+                tx_rate_limit_kbps,
+            ),
+            strict=True,
+        )
         data: dict[str, Any] = {"count": count}
-        if name is not None:
-            data["name"] = name
-        if authorized_guest_limit is not None:
-            data["authorizedGuestLimit"] = authorized_guest_limit
-        if time_limit_minutes is not None:
-            data["timeLimitMinutes"] = time_limit_minutes
-        if data_usage_limit_mbytes is not None:
-            data["dataUsageLimitMBytes"] = data_usage_limit_mbytes
-        if rx_rate_limit_kbps is not None:
-            data["rxRateLimitKbps"] = rx_rate_limit_kbps
-        if tx_rate_limit_kbps is not None:
-            data["txRateLimitKbps"] = tx_rate_limit_kbps
+        data.update((key, value) for key, value in options if value is not None)
 
         response = await self._client._post(path, json_data=data)
 
@@ -62,15 +62,8 @@ class WifiEndpoint:
         path = self._client.build_legacy_api_path(site_name, "/rest/wlanconf")
         response = await self._client._get(path)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [item for item in data if isinstance(item, dict)]
-        return []
+        data = self._client._unwrap_list(response)
+        return [item for item in data if isinstance(item, dict)]
 
     async def get_all(
         self,
@@ -104,15 +97,8 @@ class WifiEndpoint:
         path = self._client.build_api_path(f"/sites/{site_id}/wifi/broadcasts")
         response = await self._client._get(path, params=params if params else None)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [WifiNetwork.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [WifiNetwork.model_validate(item) for item in data]
 
     async def get(self, site_id: str, wifi_id: str) -> WifiNetwork:
         """
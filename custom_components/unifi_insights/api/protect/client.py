@@ -11,11 +11,13 @@ from ..base import BaseUniFiClient
 from ..const import (
     DEFAULT_CONNECT_TIMEOUT,
     DEFAULT_TIMEOUT,
+    HEADER_ACCEPT,
+    HEADER_CONTENT_TYPE,
     PROTECT_API_BASE_URL,
     PROTECT_INTEGRATION_PATH,
     ConnectionType,
 )
-from ..exceptions import UniFiConnectionError, UniFiTimeoutError
+from ..exceptions import UniFiConnectionError
 from .endpoints import (
     ApplicationEndpoint,
     CamerasEndpoint,
@@ -128,6 +130,22 @@ class UniFiProtectClient(BaseUniFiClient):
 
         self._connection_type = connection_type
         self._console_id = console_id
+        # The connection prefix is fixed for the client's lifetime
+        if connection_type == ConnectionType.LOCAL:
+            # Local: /proxy/protect/integration/v1
+            # Note: LOCAL Protect API does NOT use /sites/{site_id} prefix
+            self._api_prefix = PROTECT_INTEGRATION_PATH
+        else:
+            # Remote: /v1/connector/consoles/{consoleId}/protect/integration/v1
+            # The connector adds /proxy/ when forwarding to the console, so strip
+            # it. Protect API does not use site-scoped paths (unlike Network API).
+            connector_path = PROTECT_INTEGRATION_PATH.removeprefix("/proxy")
+            self._api_prefix = f"/v1/connector/consoles/{console_id}{connector_path}"
+        # Binary downloads accept any content type and send no JSON body
+        self._binary_headers = {
+            **{k: v for k, v in self._headers.items() if k != HEADER_CONTENT_TYPE},
+            HEADER_ACCEPT: "*/*",
+        }
 
         # Initialize endpoints
         self._cameras = CamerasEndpoint(self)
@@ -170,16 +188,7 @@ class UniFiProtectClient(BaseUniFiClient):
         if not endpoint.startswith("/"):
             endpoint = f"/{endpoint}"
 
-        if self._connection_type == ConnectionType.LOCAL:
-            # Local: /proxy/protect/integration/v1{endpoint}
-            # Note: LOCAL Protect API does NOT use /sites/{site_id} prefix
-            return f"{PROTECT_INTEGRATION_PATH}{endpoint}"
-        # Remote: /v1/connector/consoles/{consoleId}/protect/integration/v1{endpoint}
-        # The connector adds /proxy/ when forwarding to the console, so strip it.
-        # Protect API does not use site-scoped paths (unlike Network API).
-        connector_path = PROTECT_INTEGRATION_PATH.removeprefix("/proxy")
-        base = f"/v1/connector/consoles/{self._console_id}"
-        return f"{base}{connector_path}{endpoint}"
+        return f"{self._api_prefix}{endpoint}"
 
     @property
     def cameras(self) -> CamerasEndpoint:
@@ -257,14 +266,7 @@ class UniFiProtectClient(BaseUniFiClient):
 
         """
         response = await self._get(self.build_api_path("/sites"))
-        if response is None:
-            return []
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return data
-        return []
+        return self._unwrap_list(response)
 
     async def get_host_id(self) -> str:
         """
@@ -315,29 +317,32 @@ class UniFiProtectClient(BaseUniFiClient):
             UniFiTimeoutError: If request times out.
 
         """
-        session = await self._ensure_session()
-        url = self._build_url(path)
-        headers = self._get_headers()
-        # Remove JSON content type for binary requests
-        headers.pop("Content-Type", None)
-        headers["Accept"] = "*/*"
-
-        try:
-            async with session.get(
-                url,
-                params=params,
-                headers=headers,
-            ) as response:
-                if response.status >= 400:
-                    text = await response.text()
-                    raise UniFiConnectionError(
-                        f"Failed to fetch binary data: {response.status} - {text}"
-                    )
-                return await response.read()
-
-        except aiohttp.ClientConnectorError as err:
-            raise UniFiConnectionError(f"Failed to connect to {url}: {err}") from err
-        except TimeoutError as err:
-            raise UniFiTimeoutError(f"Request to {url} timed out") from err
-        except aiohttp.ClientError as err:
-            raise UniFiConnectionError(f"Request to {url} failed: {err}") from err
+        return await self._raw_request(
+            "GET",
+            path,
+            self._read_binary,
+            params=params,
+            headers=self._binary_headers,
+        )
+
+    @staticmethod
+    async def _read_binary(response: aiohttp.ClientResponse) -> bytes:
+        """
+        Read a binary response body.
+
+        Args:
+            response: The aiohttp response.
+
+        Returns:
+            Binary response data.
+
+        Raises:
+            UniFiConnectionError: If the API returns an error status.
+
+        """
+        if response.status >= 400:
+            text = await response.text()
+            raise UniFiConnectionError(
+                f"Failed to fetch binary data: {response.status} - {text}"
+            )
+        return await response.read()
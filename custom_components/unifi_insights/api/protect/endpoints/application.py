@@ -62,15 +62,8 @@ class ApplicationEndpoint:
         path = self._client.build_api_path(f"/files/{file_type.value}", site_id)
         response = await self._client._get(path)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [DeviceFile.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [DeviceFile.model_validate(item) for item in data]
 
     async def upload_file(
         self,
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Final
 
 from pydantic import ValidationError
 
@@ -15,6 +15,9 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Query string for full-HD snapshots; the parameter never varies
+_HIGH_QUALITY_SNAPSHOT_PARAMS: Final[dict[str, str]] = {"highQuality": "true"}
+
 
 class CamerasEndpoint:
     """Endpoint for managing UniFi Protect cameras."""
@@ -43,14 +46,7 @@ class CamerasEndpoint:
         path = self._client.build_api_path("/cameras", site_id)
         response = await self._client._get(path)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if not isinstance(data, list):
-            return []
+        data = self._client._unwrap_list(response)
 
         cameras: list[Camera] = []
         for item in data:
@@ -161,12 +157,10 @@ class CamerasEndpoint:
             The snapshot image bytes.
 
         """
-        params: dict[str, Any] = {}
-        if high_quality:
-            params["highQuality"] = "true"
-
         path = self._client.build_api_path(f"/cameras/{camera_id}/snapshot", site_id)
-        return await self._client._get_binary(path, params=params or None)
+        return await self._client._get_binary(
+            path, params=_HIGH_QUALITY_SNAPSHOT_PARAMS if high_quality else None
+        )
 
     async def restart(self, camera_id: str, site_id: str | None = None) -> bool:
         """
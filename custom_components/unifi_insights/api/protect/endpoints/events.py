@@ -65,15 +65,8 @@ class EventsEndpoint:
 
         response = await self._client._get(path, params=params)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [Event.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [Event.model_validate(item) for item in data]
 
     async def get(self, event_id: str, site_id: str | None = None) -> Event:
         """
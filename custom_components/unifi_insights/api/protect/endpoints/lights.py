@@ -42,14 +42,7 @@ class LightsEndpoint:
         path = self._client.build_api_path("/lights", site_id)
         response = await self._client._get(path)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if not isinstance(data, list):
-            return []
+        data = self._client._unwrap_list(response)
 
         lights: list[Light] = []
         for item in data:
@@ -37,15 +37,8 @@ class LiveViewsEndpoint:
         path = self._client.build_api_path("/liveviews", site_id)
         response = await self._client._get(path)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if isinstance(data, list):
-            return [LiveView.model_validate(item) for item in data]
-        return []
+        data = self._client._unwrap_list(response)
+        return [LiveView.model_validate(item) for item in data]
 
     async def get(self, liveview_id: str, site_id: str | None = None) -> LiveView:
         """
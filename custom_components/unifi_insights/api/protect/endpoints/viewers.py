@@ -42,14 +42,7 @@ class ViewersEndpoint:
         path = self._client.build_api_path("/viewers", site_id)
         response = await self._client._get(path)
 
-        if response is None:
-            return []
-
-        data = (
-            response.get("data", response) if isinstance(response, dict) else response
-        )
-        if not isinstance(data, list):
-            return []
+        data = self._client._unwrap_list(response)
 
         viewers: list[Viewer] = []
         for item in data:
@@ -3,16 +3,56 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import random
 from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
+import orjson
+
+from ..const import WS_HEARTBEAT_INTERVAL, WS_RECONNECT_MAX_DELAY
+from ..exceptions import UniFiConnectionError
 
 if TYPE_CHECKING:
     from .client import UniFiProtectClient
 
+# Channels served under /ea/hosts/{host_id}/sites/{site_id}/subscribe/
+_SUBSCRIPTION_TYPES = frozenset({"devices", "events"})
+
+# Frame types that end a subscription's message stream
+_STREAM_END_TYPES = frozenset({aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSED})
+
+
+def _subscription_path(host_id: str, site_id: str, subscription_type: str) -> str:
+    """Return the endpoint path of a WebSocket subscription channel."""
+    return f"/ea/hosts/{host_id}/sites/{site_id}/subscribe/{subscription_type}"
+
+
+def _reconnect_delay(base_delay: float, previous_delay: float) -> float:
+    """Return the delay before the next reconnect using decorrelated jitter."""
+    # Drawn between the base and three times the previous delay, so clients
+    # dropped together spread out instead of retrying on a shared schedule
+    upper = max(base_delay, previous_delay * 3)
+    return min(random.uniform(base_delay, upper), WS_RECONNECT_MAX_DELAY)  # noqa: S311
+
+
+async def _iter_messages(
+    ws: aiohttp.ClientWebSocketResponse,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield decoded JSON messages until the WebSocket closes or errors."""
+    text = aiohttp.WSMsgType.TEXT
+    async for msg in ws:
+        msg_type = msg.type
+        if msg_type == text:
+            try:
+                data = orjson.loads(msg.data)
+            except orjson.JSONDecodeError:
+                continue
+            yield data
+        elif msg_type in _STREAM_END_TYPES:
+            break
+
 
 class ProtectWebSocket:
     """
@@ -50,66 +90,71 @@ class ProtectWebSocket:
         self._ws: aiohttp.ClientWebSocketResponse | None = None
         self._running = False
 
-    async def _connect(
-        self, path: str
-    ) -> aiohttp.ClientWebSocketResponse:  # pragma: no cover
+    async def _connect(self, path: str) -> aiohttp.ClientWebSocketResponse:
         """
         Establish WebSocket connection.
 
+        The handshake shares the client's circuit breaker, so no connection is
+        attempted while the controller is known to be unreachable, and a
+        successful API poll lets the next reconnect through again.
+
         Args:
             path: WebSocket endpoint path.
 
         Returns:
             WebSocket connection.
 
+        Raises:
+            UniFiConnectionError: If the circuit breaker is open.
+
         """
         session = await self._client._ensure_session()
-        url = str(self._client._build_url(path)).replace("https://", "wss://")
-        headers = self._client._get_headers()
-
-        ws = await session.ws_connect(url, headers=headers)
+        http_url = self._client._build_url(path)
+        self._client._check_circuit(http_url)
+        url = str(http_url).replace("https://", "wss://")
+        # ws_connect copies headers into its own multidict, so the client's
+        # defaults are passed as is rather than copied again on every reconnect
+        headers = self._client._headers
+
+        # aiohttp pushes the heartbeat back on every received message, so a busy
+        # connection is never pinged and a silent one is detected and closed
+        try:
+            ws = await session.ws_connect(
+                url, headers=headers, heartbeat=WS_HEARTBEAT_INTERVAL
+            )
+        except (aiohttp.ClientConnectionError, TimeoutError):
+            self._client._record_transport_failure()
+            raise
+        self._client._record_transport_success()
         return ws
 
     @asynccontextmanager
-    async def subscribe_devices(  # pragma: no cover
+    async def _subscribe(  # pragma: no cover
         self,
         host_id: str,
         site_id: str,
+        subscription_type: str,
     ) -> AsyncIterator[AsyncIterator[dict[str, Any]]]:
         """
-        Subscribe to device update messages.
+        Subscribe to one of the Protect WebSocket channels.
 
         Args:
             host_id: The host ID.
             site_id: The site ID.
+            subscription_type: Type of subscription ("devices" or "events").
 
         Yields:
-            Async iterator of device update messages.
-
-        Example:
-            async with client.websocket.subscribe_devices(host_id, site_id) as updates:
-                async for update in updates:
-                    print(f"Device update: {update}")
+            Async iterator of decoded messages.
 
         """
-        path = f"/ea/hosts/{host_id}/sites/{site_id}/subscribe/devices"
+        path = _subscription_path(host_id, site_id, subscription_type)
         ws = await self._connect(path)
         self._running = True
 
         async def message_iterator() -> AsyncIterator[dict[str, Any]]:
             try:
-                async for msg in ws:
-                    if msg.type == aiohttp.WSMsgType.TEXT:
-                        try:
-                            data = json.loads(msg.data)
-                            yield data
-                        except json.JSONDecodeError:
-                            continue
-                    elif msg.type in (
-                        aiohttp.WSMsgType.ERROR,
-                        aiohttp.WSMsgType.CLOSED,
-                    ):
-                        break
+                async for data in _iter_messages(ws):
+                    yield data
             finally:
                 self._running = False
 
@@ -119,6 +164,31 @@ class ProtectWebSocket:
             self._running = False
             await ws.close()
 
+    @asynccontextmanager
+    async def subscribe_devices(  # pragma: no cover
+        self,
+        host_id: str,
+        site_id: str,
+    ) -> AsyncIterator[AsyncIterator[dict[str, Any]]]:
+        """
+        Subscribe to device update messages.
+
+        Args:
+            host_id: The host ID.
+            site_id: The site ID.
+
+        Yields:
+            Async iterator of device update messages.
+
+        Example:
+            async with client.websocket.subscribe_devices(host_id, site_id) as updates:
+                async for update in updates:
+                    print(f"Device update: {update}")
+
+        """
+        async with self._subscribe(host_id, site_id, "devices") as messages:
+            yield messages
+
     @asynccontextmanager
     async def subscribe_events(  # pragma: no cover
         self,
@@ -141,32 +211,8 @@ class ProtectWebSocket:
                     print(f"Event: {event}")
 
         """
-        path = f"/ea/hosts/{host_id}/sites/{site_id}/subscribe/events"
-        ws = await self._connect(path)
-        self._running = True
-
-        async def message_iterator() -> AsyncIterator[dict[str, Any]]:
-            try:
-                async for msg in ws:
-                    if msg.type == aiohttp.WSMsgType.TEXT:
-                        try:
-                            data = json.loads(msg.data)
-                            yield data
-                        except json.JSONDecodeError:
-                            continue
-                    elif msg.type in (
-                        aiohttp.WSMsgType.ERROR,
-                        aiohttp.WSMsgType.CLOSED,
-                    ):
-                        break
-            finally:
-                self._running = False
-
-        try:
-            yield message_iterator()
-        finally:
-            self._running = False
-            await ws.close()
+        async with self._subscribe(host_id, site_id, "events") as messages:
+            yield messages
 
     async def subscribe_with_callback(
         self,
@@ -187,44 +233,42 @@ class ProtectWebSocket:
             subscription_type: Type of subscription ("devices" or "events").
             callback: Function to call for each message.
             reconnect: Whether to automatically reconnect on disconnect.
-            reconnect_delay: Delay in seconds before reconnecting.
+            reconnect_delay: Shortest delay in seconds before a reconnect;
+                consecutive failed connections draw longer, randomized delays.
 
         """
-        if subscription_type not in ("devices", "events"):
+        if subscription_type not in _SUBSCRIPTION_TYPES:
             raise ValueError("subscription_type must be 'devices' or 'events'")
 
+        path = _subscription_path(host_id, site_id, subscription_type)
         self._running = True  # pragma: no cover
+        delay = 0.0  # pragma: no cover
 
         while self._running:  # pragma: no cover
             try:
-                path = (
-                    f"/ea/hosts/{host_id}/sites/{site_id}/subscribe/{subscription_type}"
-                )
                 ws = await self._connect(path)
+                # Connected, so the next disconnect starts from the base delay
+                delay = 0.0
 
-                async for msg in ws:
+                async for data in _iter_messages(ws):
                     if not self._running:
                         break
-                    if msg.type == aiohttp.WSMsgType.TEXT:
-                        try:
-                            data = json.loads(msg.data)
-                            callback(data)
-                        except json.JSONDecodeError:
-                            continue
-                    elif msg.type in (
-                        aiohttp.WSMsgType.ERROR,
-                        aiohttp.WSMsgType.CLOSED,
-                    ):
-                        break
+                    callback(data)
 
                 await ws.close()
 
-            except (aiohttp.ClientError, asyncio.CancelledError):
+            except (
+                aiohttp.ClientError,
+                TimeoutError,
+                UniFiConnectionError,
+                asyncio.CancelledError,
+            ):
                 # Expected during disconnects or cancellations; allow reconnection logic below
                 pass
 
             if self._running and reconnect:
-                await asyncio.sleep(reconnect_delay)
+                delay = _reconnect_delay(reconnect_delay, delay)
+                await asyncio.sleep(delay)
             else:
                 break
 
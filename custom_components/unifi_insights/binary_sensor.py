@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Final
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -107,40 +107,31 @@ def _is_smart_detect_active(camera_data: dict[str, Any], detect_type: str) -> bo
     return detect_type in last_types
 
 
-def _is_doorbell_camera(camera_data: dict[str, Any]) -> bool:
-    """Check if a camera is a doorbell camera."""
-    # Check camera type metadata set by the API client
-    camera_type = camera_data.get("_camera_type") or ""
-    if camera_type in [
+_DOORBELL_CAMERA_TYPES: Final = frozenset(
+    {
         CAMERA_TYPE_DOORBELL,
         CAMERA_TYPE_DOORBELL_WITH_PACKAGE_DETECTION,
         CAMERA_TYPE_DOORBELL_MAIN,
         CAMERA_TYPE_DOORBELL_PACKAGE,
-    ]:
+    }
+)
+_DOORBELL_NAME_INDICATORS: Final = ("doorbell", "door bell", "front door", "entrance")
+
+
+def _is_doorbell_camera(camera_data: dict[str, Any]) -> bool:
+    """Check if a camera is a doorbell camera."""
+    # Check camera type metadata set by the API client
+    if camera_data.get("_camera_type") in _DOORBELL_CAMERA_TYPES:
         return True
 
-    # Fallback: Check camera type field from API (handle None safely)
-    api_camera_type = (camera_data.get("type") or "").lower()
-    if any(
-        doorbell_type in api_camera_type
-        for doorbell_type in [
-            "doorbell",
-            "g4-doorbell",
-            "ai-doorbell",
-            "g4doorbell",
-            "aidoorbell",
-        ]
-    ):
+    # Fallback: Check camera type field from API (handle None safely).
+    # Every known doorbell model type (G4/AI Doorbell, ...) contains "doorbell".
+    if "doorbell" in (camera_data.get("type") or "").lower():
         return True
 
     # Fallback: Check camera name for doorbell indicators
     camera_name = (camera_data.get("name") or "").lower()
-    return bool(
-        any(
-            doorbell_name in camera_name
-            for doorbell_name in ["doorbell", "door bell", "front door", "entrance"]
-        )
-    )
+    return any(indicator in camera_name for indicator in _DOORBELL_NAME_INDICATORS)
 
 
 @dataclass
@@ -604,6 +595,11 @@ class UnifiPortBinarySensor(UnifiInsightsEntity, BinarySensorEntity):
 
     def _find_port_data(self) -> dict[str, Any] | None:
         """Find port data for this sensor's port index."""
+        port_index = self.coordinator.data.get("port_index")
+        if isinstance(port_index, dict):
+            port = port_index.get((self._site_id, self._device_id, self._port_idx))
+            return dict(port) if port is not None else None
+
         device_data = (
             self.coordinator.data.get("devices", {})
             .get(self._site_id, {})
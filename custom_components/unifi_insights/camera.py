@@ -167,13 +167,11 @@ class UnifiProtectCamera(UnifiProtectEntity, Camera):
 
         # Fall back to configured base URL host
         if not nvr_host and self.coordinator.protect_client:
-            base_url = str(self.coordinator.protect_client.base_url)
-            if "://" in base_url:
-                nvr_host = (
-                    base_url.split("://")[1]
-                    .split("/", maxsplit=1)[0]
-                    .split(":", maxsplit=1)[0]
-                )
+            # The client parses its base URL once; reuse that instead of
+            # re-splitting the string for every stream request
+            base_url = self.coordinator.protect_client.base_url
+            if base_url:
+                nvr_host = base_url.host
 
         if not nvr_host:
             _LOGGER.warning(
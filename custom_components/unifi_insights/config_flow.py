@@ -14,6 +14,7 @@ from homeassistant.config_entries import (
 )
 from homeassistant.const import CONF_API_KEY, CONF_HOST, CONF_VERIFY_SSL
 from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.selector import (
     SelectOptionDict,
     SelectSelector,
@@ -135,6 +136,7 @@ class UnifiInsightsConfigFlow(ConfigFlow, domain=DOMAIN):
             auth=auth,
             connection_type=ConnectionType.REMOTE,
             timeout=30,
+            session=async_get_clientsession(self.hass),
         ) as network_client:
             hosts = await network_client.get_hosts()
 
@@ -152,6 +154,7 @@ class UnifiInsightsConfigFlow(ConfigFlow, domain=DOMAIN):
             connection_type=ConnectionType.REMOTE,
             console_id=console_id,
             timeout=30,
+            session=async_get_clientsession(self.hass),
         ) as network_client:
             sites = await network_client.sites.get_all()
 
@@ -201,9 +204,10 @@ class UnifiInsightsConfigFlow(ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             try:
                 # Create authentication object for local connection
+                verify_ssl = user_input.get(CONF_VERIFY_SSL, False)
                 auth = LocalAuth(
                     api_key=user_input[CONF_API_KEY],
-                    verify_ssl=user_input.get(CONF_VERIFY_SSL, False),
+                    verify_ssl=verify_ssl,
                 )
 
                 # Use context manager to ensure proper cleanup
@@ -212,6 +216,7 @@ class UnifiInsightsConfigFlow(ConfigFlow, domain=DOMAIN):
                     base_url=user_input[CONF_HOST],
                     connection_type=ConnectionType.LOCAL,
                     timeout=30,
+                    session=async_get_clientsession(self.hass, verify_ssl=verify_ssl),
                 ) as network_client:
                     # Validate by fetching sites
                     sites = await network_client.sites.get_all()
@@ -394,15 +399,19 @@ class UnifiInsightsConfigFlow(ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             try:
                 if connection_type == CONNECTION_TYPE_LOCAL:
+                    verify_ssl = reauth_entry.data.get(CONF_VERIFY_SSL, False)
                     auth = LocalAuth(
                         api_key=user_input[CONF_API_KEY],
-                        verify_ssl=reauth_entry.data.get(CONF_VERIFY_SSL, False),
+                        verify_ssl=verify_ssl,
                     )
                     async with UniFiNetworkClient(
                         auth=auth,
                         base_url=reauth_entry.data.get(CONF_HOST, DEFAULT_API_HOST),
                         connection_type=ConnectionType.LOCAL,
                         timeout=30,
+                        session=async_get_clientsession(
+                            self.hass, verify_ssl=verify_ssl
+                        ),
                     ) as network_client:
                         sites = await network_client.sites.get_all()
                         if sites:
@@ -479,15 +488,19 @@ class UnifiInsightsConfigFlow(ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             try:
                 if connection_type == CONNECTION_TYPE_LOCAL:
+                    verify_ssl = user_input.get(CONF_VERIFY_SSL, False)
                     auth = LocalAuth(
                         api_key=user_input[CONF_API_KEY],
-                        verify_ssl=user_input.get(CONF_VERIFY_SSL, False),
+                        verify_ssl=verify_ssl,
                     )
                     async with UniFiNetworkClient(
                         auth=auth,
                         base_url=user_input[CONF_HOST],
                         connection_type=ConnectionType.LOCAL,
                         timeout=30,
+                        session=async_get_clientsession(
+                            self.hass, verify_ssl=verify_ssl
+                        ),
                     ) as network_client:
                         sites = await network_client.sites.get_all()
                         if sites:
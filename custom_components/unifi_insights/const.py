@@ -1,12 +1,16 @@
 """Constants for the UniFi Insights integration."""
 
 from datetime import timedelta
-from typing import Final
+from typing import Any, Final
 
 DOMAIN = "unifi_insights"
 
 MANUFACTURER: Final = "Ubiquiti Inc."
 
+# Shared, never-mutated fallback for nested ``dict.get`` lookups so a miss
+# does not allocate a new empty dict
+EMPTY_DICT: Final[dict[str, Any]] = {}
+
 # Connection types
 CONF_CONNECTION_TYPE: Final = "connection_type"
 CONF_CONSOLE_ID: Final = "console_id"
@@ -35,6 +39,16 @@ SCAN_INTERVAL_CONFIG = timedelta(minutes=5)
 SCAN_INTERVAL_PROTECT = timedelta(seconds=30)
 # Legacy alias for backward compatibility
 SCAN_INTERVAL_NORMAL = SCAN_INTERVAL_DEVICE
+# Longest delay before retrying after consecutive failed updates
+SCAN_INTERVAL_MAX_BACKOFF = timedelta(minutes=5)
+# Random extra delay (fraction of the base delay) added to spread out retries
+RETRY_JITTER: Final = 0.5
+# Maximum number of devices whose stats are fetched at the same time
+MAX_CONCURRENT_DEVICE_REQUESTS: Final = 8
+# Most recent WebSocket events kept per event type (oldest are evicted first)
+MAX_STORED_EVENTS_PER_TYPE: Final = 100
+# WebSocket events not updated for this long are dropped from the event store
+STORED_EVENT_TTL = timedelta(minutes=5)
 
 UNIFI_API_HEADERS = {"Accept": "application/json", "Content-Type": "application/json"}
 
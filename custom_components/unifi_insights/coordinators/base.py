@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import random
 from datetime import timedelta  # noqa: TC003
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Any
@@ -13,7 +14,12 @@ from homeassistant.helpers.update_coordinator import (
     UpdateFailed,
 )
 
-from custom_components.unifi_insights.const import DOMAIN
+from custom_components.unifi_insights.api import UniFiRateLimitError
+from custom_components.unifi_insights.const import (
+    DOMAIN,
+    RETRY_JITTER,
+    SCAN_INTERVAL_MAX_BACKOFF,
+)
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -56,6 +62,7 @@ class UnifiBaseCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.network_client = network_client
         self.protect_client = protect_client
         self._available = True
+        self._failure_streak = 0
         self.data: dict[str, Any] = {}
 
     @property
@@ -89,6 +96,18 @@ class UnifiBaseCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return {k: v for k, v in model.__dict__.items() if not k.startswith("_")}
         return {}
 
+    def _backoff_delay(self) -> float:
+        """Return a jittered retry delay that doubles per consecutive failure."""
+        # last_update_success still reflects the previous refresh at this point
+        if self.last_update_success:
+            self._failure_streak = 1
+        else:
+            self._failure_streak += 1
+        base = self.update_interval.total_seconds() if self.update_interval else 30
+        delay = base * 2 ** (self._failure_streak - 1)
+        delay *= 1 + random.uniform(0, RETRY_JITTER)  # noqa: S311
+        return min(delay, SCAN_INTERVAL_MAX_BACKOFF.total_seconds())
+
     def _handle_auth_error(self, err: UniFiAuthenticationError) -> None:
         """Handle authentication error."""
         self._available = False
@@ -99,27 +118,36 @@ class UnifiBaseCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Handle connection error."""
         self._available = False
         msg = f"Error communicating with API: {err}"
-        raise UpdateFailed(msg) from err
+        raise UpdateFailed(msg, retry_after=self._backoff_delay()) from err
 
     def _handle_timeout_error(self, err: UniFiTimeoutError) -> None:
         """Handle timeout error."""
         self._available = False
         _LOGGER.warning("Timeout during update: %s", err)
         msg = f"Timeout: {err}"
-        raise UpdateFailed(msg) from err
+        raise UpdateFailed(msg, retry_after=self._backoff_delay()) from err
 
     def _handle_response_error(self, err: UniFiResponseError) -> None:
         """Handle API response error."""
         self._available = False
+        msg = f"API error: {err}"
+        if isinstance(err, UniFiRateLimitError) and err.retry_after:
+            # Honor Retry-After, with jitter so coordinators don't retry together
+            _LOGGER.warning("Rate limited during update: %s", err)
+            jitter = random.uniform(0, RETRY_JITTER)  # noqa: S311
+            retry_after = err.retry_after * (1 + jitter)
+            raise UpdateFailed(msg, retry_after=retry_after) from err
+
         status_code = getattr(err, "status_code", None)
         if (
             isinstance(status_code, int)
             and status_code >= HTTPStatus.INTERNAL_SERVER_ERROR
         ):
             _LOGGER.warning("Server error during update: %s", err)
-        else:
-            _LOGGER.exception("API error during update")
-        msg = f"API error: {err}"
+            raise UpdateFailed(msg, retry_after=self._backoff_delay()) from err
+
+        # Other client errors won't resolve by retrying sooner or later
+        _LOGGER.exception("API error during update")
         raise UpdateFailed(msg) from err
 
     def _handle_generic_error(self, err: Exception) -> None:
@@ -308,13 +308,15 @@ class UnifiConfigCoordinator(UnifiBaseCoordinator):
                     self.data["firewall_rules"][site_id] = {}
 
             self._available = True
-            _LOGGER.debug(
-                "Config coordinator: Update complete - %d sites, %d WiFi configs, "
-                "%d firewall rules",
-                len(self.data["sites"]),
-                sum(len(w) for w in self.data["wifi"].values()),
-                sum(len(rules) for rules in self.data["firewall_rules"].values()),
-            )
+            # The totals walk every site, so only count them when they are logged
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Config coordinator: Update complete - %d sites, %d WiFi configs, "
+                    "%d firewall rules",
+                    len(self.data["sites"]),
+                    sum(len(w) for w in self.data["wifi"].values()),
+                    sum(len(rules) for rules in self.data["firewall_rules"].values()),
+                )
 
             return self.data
 
@@ -16,7 +16,12 @@ from custom_components.unifi_insights.api import (
     UniFiResponseError,
     UniFiTimeoutError,
 )
-from custom_components.unifi_insights.const import DOMAIN, SCAN_INTERVAL_DEVICE
+from custom_components.unifi_insights.const import (
+    DOMAIN,
+    MAX_CONCURRENT_DEVICE_REQUESTS,
+    SCAN_INTERVAL_CONFIG,
+    SCAN_INTERVAL_DEVICE,
+)
 
 from .base import UnifiBaseCoordinator
 
@@ -62,9 +67,15 @@ class UnifiDeviceCoordinator(UnifiBaseCoordinator):
         )
         self.config_coordinator = config_coordinator
         # Map integration site IDs to classic ("legacy") site names used by the
-        # /api/s/{site} endpoints. Populated on each update and reused for
-        # classic-API client actions (block/unblock/reconnect/forget).
+        # /api/s/{site} endpoints. Refetched at the config refresh interval and
+        # reused for classic-API client actions (block/unblock/reconnect/forget).
         self._legacy_site_names: dict[str, str] = {}
+        # Site IDs the legacy mapping was resolved for and when it expires
+        self._legacy_site_names_key: tuple[str, ...] = ()
+        self._legacy_site_names_expiry = 0.0
+        # Bounds per-device stats fetches across all sites so large sites do
+        # not open more connections than the shared session's pool allows
+        self._device_semaphore = asyncio.Semaphore(MAX_CONCURRENT_DEVICE_REQUESTS)
         # Track previous device IDs for stale device cleanup (Gold requirement)
         self._previous_network_device_ids: set[str] = set()
         # Track previous port byte counts for rate computation
@@ -75,6 +86,8 @@ class UnifiDeviceCoordinator(UnifiBaseCoordinator):
             "clients": {},
             "stats": {},
             "vouchers": {},
+            "port_index": {},
+            "available_port_keys": set(),
             "last_update": None,
         }
 
@@ -377,6 +390,65 @@ class UnifiDeviceCoordinator(UnifiBaseCoordinator):
             )
             return device_id, device_dict, {}
 
+    async def _process_device_bounded(
+        self,
+        site_id: str,
+        device_dict: dict[str, Any],
+        clients: list[dict[str, Any]],
+        legacy_site_name: str | None = None,
+    ) -> tuple[str, dict[str, Any], dict[str, Any]]:
+        """Process a single device once a concurrent request slot is free."""
+        async with self._device_semaphore:
+            return await self._process_device(
+                site_id, device_dict, clients, legacy_site_name
+            )
+
+    async def _async_get_legacy_site_names(self, site_ids: list[str]) -> dict[str, str]:
+        """
+        Return the legacy site name mapping for the given site IDs.
+
+        Sites rarely change, so the mapping is only refetched once it is older
+        than the config refresh interval or the set of site IDs changes.
+        """
+        key = tuple(site_ids)
+        now = time.monotonic()
+        if key == self._legacy_site_names_key and now < self._legacy_site_names_expiry:
+            return self._legacy_site_names
+
+        try:
+            legacy_sites = await self.network_client.sites.get_legacy_all()
+        except Exception as err:
+            _LOGGER.debug(
+                "Device coordinator: Unable to fetch legacy site mapping: %s",
+                err,
+            )
+            return {}
+
+        self._legacy_site_names = self._map_legacy_site_names(site_ids, legacy_sites)
+        self._legacy_site_names_key = key
+        self._legacy_site_names_expiry = now + SCAN_INTERVAL_CONFIG.total_seconds()
+        return self._legacy_site_names
+
+    async def _fetch_legacy_site_devices(
+        self, site_id: str, legacy_site_name: str | None
+    ) -> list[dict[str, Any]]:
+        """Fetch legacy device data for a site, returning [] when unavailable."""
+        if legacy_site_name is None:
+            return []
+        try:
+            return await self.network_client.devices.get_legacy_site_devices(
+                legacy_site_name
+            )
+        except Exception as err:
+            _LOGGER.debug(
+                "Device coordinator: Failed to fetch legacy device data "
+                "for site %s (%s): %s",
+                site_id,
+                legacy_site_name,
+                err,
+            )
+            return []
+
     async def _process_site(
         self, site_id: str, legacy_site_name: str | None = None
     ) -> (
@@ -389,30 +461,13 @@ class UnifiDeviceCoordinator(UnifiBaseCoordinator):
     ):
         """Process a single site's devices and clients."""
         try:
-            # Get devices and clients in parallel using new API
-            devices_task = self.network_client.devices.get_all(site_id)
-            clients_task = self.network_client.clients.get_all(site_id)
-            devices_models, clients_models = await asyncio.gather(
-                devices_task, clients_task
+            # Get devices, clients and legacy device data in parallel
+            devices_models, clients_models, legacy_devices = await asyncio.gather(
+                self.network_client.devices.get_all(site_id),
+                self.network_client.clients.get_all(site_id),
+                self._fetch_legacy_site_devices(site_id, legacy_site_name),
             )
 
-            legacy_devices: list[dict[str, Any]] = []
-            if legacy_site_name is not None:
-                try:
-                    legacy_devices = (
-                        await self.network_client.devices.get_legacy_site_devices(
-                            legacy_site_name
-                        )
-                    )
-                except Exception as err:
-                    _LOGGER.debug(
-                        "Device coordinator: Failed to fetch legacy device data "
-                        "for site %s (%s): %s",
-                        site_id,
-                        legacy_site_name,
-                        err,
-                    )
-
             # Convert model objects to dictionaries
             devices = [self._model_to_dict(d) for d in devices_models]
             clients = [self._model_to_dict(c) for c in clients_models]
@@ -442,7 +497,7 @@ class UnifiDeviceCoordinator(UnifiBaseCoordinator):
             )
 
             # Log sample device keys for debugging data format issues
-            if devices:
+            if devices and _LOGGER.isEnabledFor(logging.DEBUG):
                 sample_device = devices[0]
                 _LOGGER.debug(
                     "Device coordinator: Sample device keys for site %s: %s",
@@ -452,7 +507,7 @@ class UnifiDeviceCoordinator(UnifiBaseCoordinator):
 
             # Process devices in parallel (get stats)
             tasks = [
-                self._process_device(
+                self._process_device_bounded(
                     site_id,
                     device,
                     clients,
@@ -507,16 +562,7 @@ class UnifiDeviceCoordinator(UnifiBaseCoordinator):
                 len(site_ids),
             )
 
-            legacy_site_names: dict[str, str] = {}
-            try:
-                legacy_sites = await self.network_client.sites.get_legacy_all()
-                legacy_site_names = self._map_legacy_site_names(site_ids, legacy_sites)
-                self._legacy_site_names = legacy_site_names
-            except Exception as err:
-                _LOGGER.debug(
-                    "Device coordinator: Unable to fetch legacy site mapping: %s",
-                    err,
-                )
+            legacy_site_names = await self._async_get_legacy_site_names(site_ids)
 
             # Process all sites in parallel
             tasks = [
@@ -544,6 +590,9 @@ class UnifiDeviceCoordinator(UnifiBaseCoordinator):
             # Compute per-port byte rates from deltas
             self._compute_port_rates()
 
+            # Index ports for O(1) lookups from per-port entities
+            self._index_ports()
+
             self._available = True
             self.data["last_update"] = datetime.now(tz=UTC)
 
@@ -631,6 +680,43 @@ class UnifiDeviceCoordinator(UnifiBaseCoordinator):
                 if port_rates:
                     stats["port_rates"] = port_rates
 
+    def _index_ports(self) -> None:
+        """
+        Index every device port by (site_id, device_id, port_idx).
+
+        Builds ``port_index`` mapping each key to its port dict and
+        ``available_port_keys`` holding the keys of ports whose link is UP.
+        """
+        port_index: dict[tuple[str, str, int], dict[str, Any]] = {}
+        available: set[tuple[str, str, int]] = set()
+
+        for site_id, devices in self.data.get("devices", {}).items():
+            for device_id, device in devices.items():
+                if not isinstance(device, dict):
+                    continue
+                ports = device.get("ports", [])
+                if not ports:
+                    interfaces = device.get("interfaces", {})
+                    if isinstance(interfaces, dict):
+                        ports = interfaces.get("ports", [])
+                if not isinstance(ports, list):
+                    continue
+                for port in ports:
+                    if not isinstance(port, dict):
+                        continue
+                    port_idx = port.get("idx") or port.get("port_idx")
+                    if port_idx is None:
+                        continue
+                    key = (site_id, device_id, port_idx)
+                    # Keep the first match, as a linear scan of the list would
+                    if port_index.setdefault(key, port) is not port:
+                        continue
+                    if port.get("state") == "UP":
+                        available.add(key)
+
+        self.data["port_index"] = port_index
+        self.data["available_port_keys"] = available
+
     def _cleanup_stale_devices(self) -> None:
         """Remove stale network devices from the device registry (Gold requirement)."""
         device_registry = dr.async_get(self.hass)
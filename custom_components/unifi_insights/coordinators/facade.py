@@ -23,6 +23,7 @@ from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from custom_components.unifi_insights.api import UniFiError
 from custom_components.unifi_insights.const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
@@ -42,6 +43,7 @@ class UnifiFacadeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     - devices: from device_coordinator
     - clients: from device_coordinator
     - stats: from device_coordinator
+    - port_index, available_port_keys: from device_coordinator
     - wifi: from config_coordinator
     - protect: from protect_coordinator (cameras, lights, sensors, etc.)
     - last_update: combined from all coordinators
@@ -110,6 +112,10 @@ class UnifiFacadeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "clients": self._device_coordinator.data.get("clients", {}),
             "stats": self._device_coordinator.data.get("stats", {}),
             "vouchers": self._device_coordinator.data.get("vouchers", {}),
+            "port_index": self._device_coordinator.data.get("port_index", {}),
+            "available_port_keys": self._device_coordinator.data.get(
+                "available_port_keys", set()
+            ),
             # From protect coordinator
             "protect": (
                 self._protect_coordinator.data
@@ -197,6 +203,10 @@ class UnifiFacadeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return await action(*args, **kwargs)
         except HomeAssistantError:
             raise
+        except (UniFiError, TimeoutError) as err:
+            # Expected API/transport failures: no traceback needed
+            _LOGGER.warning("%s: %s", error_message, err)
+            raise HomeAssistantError(error_message) from err
         except Exception as err:
             _LOGGER.exception("%s", error_message)
             raise HomeAssistantError(error_message) from err
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
@@ -23,7 +26,10 @@ from custom_components.unifi_insights.const import (
     DEVICE_TYPE_SENSOR,
     DEVICE_TYPE_VIEWER,
     DOMAIN,
+    EMPTY_DICT,
+    MAX_STORED_EVENTS_PER_TYPE,
     SCAN_INTERVAL_PROTECT,
+    STORED_EVENT_TTL,
 )
 
 from .base import UnifiBaseCoordinator
@@ -37,6 +43,8 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+_STORED_EVENT_TTL_SECONDS = STORED_EVENT_TTL.total_seconds()
+
 
 class UnifiProtectCoordinator(UnifiBaseCoordinator):
     """
@@ -69,6 +77,10 @@ class UnifiProtectCoordinator(UnifiBaseCoordinator):
             name="protect",
             update_interval=SCAN_INTERVAL_PROTECT,
         )
+        # Last update time of each stored event, least recently updated first
+        self._event_updated_at: OrderedDict[tuple[str, str], float] = OrderedDict()
+        # Set while a listener update for buffered WebSocket messages is pending
+        self._listener_update_scheduled = False
         # Track previous device IDs for stale device cleanup (Gold requirement)
         self._previous_protect_device_ids: dict[str, set[str]] = {
             "cameras": set(),
@@ -135,7 +147,7 @@ class UnifiProtectCoordinator(UnifiBaseCoordinator):
         )
 
         if model_key == DEVICE_TYPE_CAMERA:
-            existing_camera = self.data["cameras"].get(device_id, {})
+            existing_camera = self.data["cameras"].get(device_id, EMPTY_DICT)
             merged_camera = {
                 **existing_camera,
                 **device_data,
@@ -143,47 +155,50 @@ class UnifiProtectCoordinator(UnifiBaseCoordinator):
             self.data["cameras"][device_id] = self._normalize_camera_data(merged_camera)
         elif model_key == DEVICE_TYPE_LIGHT:
             self.data["lights"][device_id] = {
-                **self.data["lights"].get(device_id, {}),
+                **self.data["lights"].get(device_id, EMPTY_DICT),
                 **device_data,
             }
         elif model_key == DEVICE_TYPE_SENSOR:
             self.data["sensors"][device_id] = {
-                **self.data["sensors"].get(device_id, {}),
+                **self.data["sensors"].get(device_id, EMPTY_DICT),
                 **device_data,
             }
         elif model_key == DEVICE_TYPE_NVR:
             self.data["nvrs"][device_id] = {
-                **self.data["nvrs"].get(device_id, {}),
+                **self.data["nvrs"].get(device_id, EMPTY_DICT),
                 **device_data,
             }
         elif model_key == DEVICE_TYPE_VIEWER:
             self.data["viewers"][device_id] = {
-                **self.data["viewers"].get(device_id, {}),
+                **self.data["viewers"].get(device_id, EMPTY_DICT),
                 **device_data,
             }
         elif model_key == DEVICE_TYPE_CHIME:
             self.data["chimes"][device_id] = {
-                **self.data["chimes"].get(device_id, {}),
+                **self.data["chimes"].get(device_id, EMPTY_DICT),
                 **device_data,
             }
 
-        self.async_update_listeners()
+        self._async_schedule_listener_update()
 
     def _normalize_camera_data(self, camera: dict[str, Any]) -> dict[str, Any]:
-        """Normalize camera fields across alias and legacy payload shapes."""
-        normalized = dict(camera)
+        """
+        Normalize camera fields in place and return the same dict.
 
-        feature_flags = normalized.get("featureFlags")
+        Fields are unified across alias and legacy payload shapes. Callers
+        pass a freshly built dict, so mutating it is safe.
+        """
+        feature_flags = camera.get("featureFlags")
         if not isinstance(feature_flags, dict):
-            legacy_feature_flags = normalized.get("feature_flags")
+            legacy_feature_flags = camera.get("feature_flags")
             feature_flags = (
                 legacy_feature_flags if isinstance(legacy_feature_flags, dict) else {}
             )
-        normalized["featureFlags"] = feature_flags
+        camera["featureFlags"] = feature_flags
 
-        smart_detect_types = normalized.get("smartDetectTypes")
+        smart_detect_types = camera.get("smartDetectTypes")
         if not isinstance(smart_detect_types, list):
-            legacy_smart_detect_types = normalized.get("smart_detect_types")
+            legacy_smart_detect_types = camera.get("smart_detect_types")
             if isinstance(legacy_smart_detect_types, list):
                 smart_detect_types = legacy_smart_detect_types
             else:
@@ -195,32 +210,32 @@ class UnifiProtectCoordinator(UnifiBaseCoordinator):
                         if isinstance(feature_flag_types, list)
                         else []
                     )
-        normalized["smartDetectTypes"] = smart_detect_types
+        camera["smartDetectTypes"] = smart_detect_types
 
-        is_ptz = normalized.get("isPtz")
+        is_ptz = camera.get("isPtz")
         if not isinstance(is_ptz, bool):
-            legacy_is_ptz = normalized.get("is_ptz")
+            legacy_is_ptz = camera.get("is_ptz")
             if isinstance(legacy_is_ptz, bool):
                 is_ptz = legacy_is_ptz
             else:
                 is_ptz = bool(
-                    normalized.get("hasPtz")
+                    camera.get("hasPtz")
                     or feature_flags.get("hasPtz")
                     or feature_flags.get("has_ptz")
                 )
-        normalized["isPtz"] = is_ptz
-        normalized["hasPtz"] = is_ptz
+        camera["isPtz"] = is_ptz
+        camera["hasPtz"] = is_ptz
 
-        last_smart_detect_types = normalized.get("lastSmartDetectTypes")
+        last_smart_detect_types = camera.get("lastSmartDetectTypes")
         if not isinstance(last_smart_detect_types, list):
-            normalized["lastSmartDetectTypes"] = []
+            camera["lastSmartDetectTypes"] = []
 
-        if "lastMotion" not in normalized:
-            normalized["lastMotion"] = 0
-        if "lastRing" not in normalized:
-            normalized["lastRing"] = 0
+        if "lastMotion" not in camera:
+            camera["lastMotion"] = 0
+        if "lastRing" not in camera:
+            camera["lastRing"] = 0
 
-        return normalized
+        return camera
 
     @callback
     def _handle_event_update(self, event_type: str, event_data: dict[str, Any]) -> None:
@@ -235,49 +250,97 @@ class UnifiProtectCoordinator(UnifiBaseCoordinator):
             event_id,
         )
 
-        # Store event data
-        if event_type not in self.data["events"]:
-            self.data["events"][event_type] = {}
-
-        self.data["events"][event_type][event_id] = event_data
+        # Store event data, keeping only the most recent events per type
+        events: OrderedDict[str, dict[str, Any]] = self.data["events"].setdefault(
+            event_type, OrderedDict()
+        )
+        # move_to_end is a no-op for a new key, so no membership test is needed
+        events[event_id] = event_data
+        events.move_to_end(event_id)
+        if len(events) > MAX_STORED_EVENTS_PER_TYPE:
+            events.popitem(last=False)
+        self._expire_events(event_type, event_id)
 
         # Update device last event time if applicable
         device_id = event_data.get("device")
         if device_id:
             self._process_event_for_device(event_type, event_data, device_id)
 
+        self._async_schedule_listener_update()
+
+    @callback
+    def _async_schedule_listener_update(self) -> None:
+        """
+        Notify listeners once for all WebSocket messages handled this loop pass.
+
+        Messages already buffered on the socket are handled back to back, so a
+        burst updates the facade and every entity once instead of per message.
+        """
+        if self._listener_update_scheduled:
+            return
+        self._listener_update_scheduled = True
+        self.hass.loop.call_soon(self._async_flush_listener_update)
+
+    @callback
+    def _async_flush_listener_update(self) -> None:
+        """Run the listener update scheduled for buffered WebSocket messages."""
+        self._listener_update_scheduled = False
         self.async_update_listeners()
 
+    def _expire_events(self, event_type: str, event_id: str) -> None:
+        """Record an event update and drop events older than the TTL."""
+        now = time.monotonic()
+        updated_at = self._event_updated_at
+        key = (event_type, event_id)
+        updated_at[key] = now
+        updated_at.move_to_end(key)
+
+        # Oldest entries come first, so stop at the first one still fresh
+        cutoff = now - _STORED_EVENT_TTL_SECONDS
+        stored_events = self.data["events"]
+        while (oldest := next(iter(updated_at.items())))[1] < cutoff:
+            updated_at.popitem(last=False)
+            expired_type, expired_id = oldest[0]
+            if (events := stored_events.get(expired_type)) is not None:
+                events.pop(expired_id, None)
+
     def _process_event_for_device(
         self, event_type: str, event_data: dict[str, Any], device_id: str
     ) -> None:
         """Process event data and update relevant device."""
+        camera = self.data["cameras"].get(device_id)
+
         # Check if this is a camera motion event
-        if event_type == "motion" and device_id in self.data["cameras"]:
-            self.data["cameras"][device_id]["lastMotionStart"] = event_data.get("start")
-            self.data["cameras"][device_id]["lastMotionEnd"] = event_data.get("end")
-            self.data["cameras"][device_id]["lastSmartDetectTypes"] = []
+        if event_type == "motion" and camera is not None:
+            event_start = event_data.get("start")
+            event_end = event_data.get("end")
+            camera["lastMotionStart"] = event_start
+            camera["lastMotionEnd"] = event_end
+            camera["lastSmartDetectTypes"] = []
             _LOGGER.info(
                 "Protect coordinator: Motion event for camera %s: start=%s, end=%s",
                 device_id,
-                event_data.get("start"),
-                event_data.get("end"),
+                event_start,
+                event_end,
             )
 
         # Check if this is a light motion event
-        elif event_type == "motion" and device_id in self.data["lights"]:
-            self.data["lights"][device_id]["lastMotionStart"] = event_data.get("start")
-            self.data["lights"][device_id]["lastMotionEnd"] = event_data.get("end")
+        elif event_type == "motion" and (
+            light := self.data["lights"].get(device_id)
+        ) is not None:
+            light["lastMotionStart"] = event_data.get("start")
+            light["lastMotionEnd"] = event_data.get("end")
 
         # Check if this is a smart detection event
-        elif event_type == "smartDetectZone" and device_id in self.data["cameras"]:
-            smart_detect_types = event_data.get("smartDetectTypes", [])
+        elif event_type == "smartDetectZone" and camera is not None:
+            # Only allocate an empty list when the event carries no types
+            smart_detect_types = event_data.get("smartDetectTypes") or []
             event_start = event_data.get("start", 0)
             event_end = event_data.get("end")
 
-            self.data["cameras"][device_id]["lastMotionStart"] = event_start
-            self.data["cameras"][device_id]["lastMotionEnd"] = event_end
-            self.data["cameras"][device_id]["lastSmartDetectTypes"] = smart_detect_types
+            camera["lastMotionStart"] = event_start
+            camera["lastMotionEnd"] = event_end
+            camera["lastSmartDetectTypes"] = smart_detect_types
 
             _LOGGER.info(
                 "Protect coordinator: Smart detection for camera %s: %s "
@@ -289,14 +352,16 @@ class UnifiProtectCoordinator(UnifiBaseCoordinator):
             )
 
         # Check if this is a doorbell ring event
-        elif event_type == "ring" and device_id in self.data["cameras"]:
-            self.data["cameras"][device_id]["lastRingStart"] = event_data.get("start")
-            self.data["cameras"][device_id]["lastRingEnd"] = event_data.get("end")
+        elif event_type == "ring" and camera is not None:
+            event_start = event_data.get("start")
+            event_end = event_data.get("end")
+            camera["lastRingStart"] = event_start
+            camera["lastRingEnd"] = event_end
             _LOGGER.info(
                 "Protect coordinator: Doorbell ring for camera %s: start=%s, end=%s",
                 device_id,
-                event_data.get("start"),
-                event_data.get("end"),
+                event_start,
+                event_end,
             )
 
     async def _async_update_data(self) -> dict[str, Any]:
@@ -308,26 +373,16 @@ class UnifiProtectCoordinator(UnifiBaseCoordinator):
         try:
             _LOGGER.debug("Protect coordinator: Fetching Protect data")
 
-            # Fetch cameras
-            await self._fetch_cameras()
-
-            # Fetch lights
-            await self._fetch_lights()
-
-            # Fetch sensors
-            await self._fetch_sensors()
-
-            # Fetch NVR
-            await self._fetch_nvr()
-
-            # Fetch chimes
-            await self._fetch_chimes()
-
-            # Fetch viewers
-            await self._fetch_viewers()
-
-            # Fetch liveviews
-            await self._fetch_liveviews()
+            # Each fetch fills its own data key, so the requests run concurrently
+            await asyncio.gather(
+                self._fetch_cameras(),
+                self._fetch_lights(),
+                self._fetch_sensors(),
+                self._fetch_nvr(),
+                self._fetch_chimes(),
+                self._fetch_viewers(),
+                self._fetch_liveviews(),
+            )
 
             self._available = True
             self.data["last_update"] = datetime.now(tz=UTC)
@@ -523,7 +578,7 @@ class UnifiProtectCoordinator(UnifiBaseCoordinator):
             "viewers",
             "chimes",
         ]:
-            current_ids: set[str] = set(self.data.get(device_type, {}).keys())
+            current_ids: set[str] = set(self.data.get(device_type, EMPTY_DICT).keys())
             previous_ids = self._previous_protect_device_ids.get(device_type, set())
 
             stale_ids = previous_ids - current_ids
@@ -552,20 +607,20 @@ class UnifiProtectCoordinator(UnifiBaseCoordinator):
 
     def get_camera(self, camera_id: str) -> dict[str, Any] | None:
         """Get camera data by ID."""
-        result = self.data.get("cameras", {}).get(camera_id)
+        result = self.data.get("cameras", EMPTY_DICT).get(camera_id)
         return result if isinstance(result, dict) else None
 
     def get_light(self, light_id: str) -> dict[str, Any] | None:
         """Get light data by ID."""
-        result = self.data.get("lights", {}).get(light_id)
+        result = self.data.get("lights", EMPTY_DICT).get(light_id)
         return result if isinstance(result, dict) else None
 
     def get_sensor(self, sensor_id: str) -> dict[str, Any] | None:
         """Get sensor data by ID."""
-        result = self.data.get("sensors", {}).get(sensor_id)
+        result = self.data.get("sensors", EMPTY_DICT).get(sensor_id)
         return result if isinstance(result, dict) else None
 
     def get_nvr(self, nvr_id: str) -> dict[str, Any] | None:
         """Get NVR data by ID."""
-        result = self.data.get("nvrs", {}).get(nvr_id)
+        result = self.data.get("nvrs", EMPTY_DICT).get(nvr_id)
         return result if isinstance(result, dict) else None
@@ -21,12 +21,16 @@ from .const import (
     DEVICE_TYPE_NVR,
     DEVICE_TYPE_SENSOR,
     DOMAIN,
+    EMPTY_DICT,
     MANUFACTURER,
 )
 from .coordinators import UnifiFacadeCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Model prefixes of devices suggested for the "Network" area
+_NETWORK_MODEL_PREFIXES = ("usw", "switch", "uap", "ap", "udm", "usg")
+
 
 def get_field(data: dict[str, Any], *keys: str, default: Any = None) -> Any:
     """
@@ -36,8 +40,8 @@ def get_field(data: dict[str, Any], *keys: str, default: Any = None) -> Any:
     Skips keys whose value is None so that fallback keys are still checked.
     """
     for key in keys:
-        if key in data and data[key] is not None:
-            return data[key]
+        if (value := data.get(key)) is not None:
+            return value
     return default
 
 
@@ -117,6 +121,65 @@ async def async_call_coordinator_action[ActionResult](
         raise HomeAssistantError(error_message) from err
 
 
+def build_network_device_info(
+    coordinator: UnifiFacadeCoordinator, site_id: str, device_id: str
+) -> DeviceInfo:
+    """Build the device info for a UniFi Network device."""
+    # Get device data
+    device_data = coordinator.data["devices"][site_id][device_id]
+    device_name = get_field(device_data, "name", default=f"UniFi Device {device_id}")
+    ip_address = get_field(device_data, "ipAddress", "ip_address", "ip", default="")
+
+    # Create device info for individual device
+    device_info: dict[str, Any] = {
+        "identifiers": {(DOMAIN, f"{site_id}_{device_id}")},
+        "name": f"{device_name} ({ip_address})" if ip_address else device_name,
+        "manufacturer": MANUFACTURER,
+        "model": get_field(device_data, "model", default="Unknown Model"),
+        "sw_version": get_field(
+            device_data, "firmwareVersion", "firmware_version", "version"
+        ),
+        "configuration_url": (
+            f"{coordinator.network_client.base_url}/network/devices/{device_id}"
+        ),
+    }
+
+    # Add network connections
+    if mac := get_field(device_data, "macAddress", "mac_address", "mac"):
+        device_info["connections"] = {(CONNECTION_NETWORK_MAC, mac)}
+
+    # Add hardware version based on device features
+    hw_info = []
+
+    # Get port count
+    if (ports := device_data.get("port_table", [])) and isinstance(ports, list):
+        port_count = len(ports)
+        if port_count > 0:
+            hw_info.append(f"{port_count} Ports")
+
+    # Get radio info
+    if (radio_table := device_data.get("radio_table", [])) and isinstance(
+        radio_table, list
+    ):
+        for radio in radio_table:
+            if not isinstance(radio, dict):
+                continue
+            radio_name = radio.get("name", "")
+            radio_type = radio.get("radio", "")
+            if radio_name and radio_type:
+                hw_info.append(f"{radio_name} ({radio_type})")
+
+    if hw_info:
+        device_info["hw_version"] = " | ".join(hw_info)
+
+    # Set suggested area based on device type
+    model = device_data.get("model", "").lower()
+    if model.startswith(_NETWORK_MODEL_PREFIXES):
+        device_info["suggested_area"] = "Network"
+
+    return DeviceInfo(**device_info)  # type: ignore[typeddict-item]
+
+
 class UnifiInsightsEntity(CoordinatorEntity[UnifiFacadeCoordinator]):
     """Base class for UniFi Insights entities."""
 
@@ -128,6 +191,8 @@ class UnifiInsightsEntity(CoordinatorEntity[UnifiFacadeCoordinator]):
         description: EntityDescription,
         site_id: str,
         device_id: str,
+        *,
+        device_info: DeviceInfo | None = None,
     ) -> None:
         """Initialize the entity."""
         super().__init__(coordinator)
@@ -135,67 +200,13 @@ class UnifiInsightsEntity(CoordinatorEntity[UnifiFacadeCoordinator]):
         self._site_id = site_id
         self._device_id = device_id
 
-        # Get device data
-        device_data = coordinator.data["devices"][site_id][device_id]
-        device_name = get_field(
-            device_data, "name", default=f"UniFi Device {device_id}"
-        )
-        ip_address = get_field(device_data, "ipAddress", "ip_address", "ip", default="")
-
         # Set unique ID
         self._attr_unique_id = f"{site_id}_{device_id}_{description.key}"
 
-        # Create device info for individual device
-        device_info: dict[str, Any] = {
-            "identifiers": {(DOMAIN, f"{site_id}_{device_id}")},
-            "name": f"{device_name} ({ip_address})" if ip_address else device_name,
-            "manufacturer": MANUFACTURER,
-            "model": get_field(device_data, "model", default="Unknown Model"),
-            "sw_version": get_field(
-                device_data, "firmwareVersion", "firmware_version", "version"
-            ),
-            "configuration_url": (
-                f"{coordinator.network_client.base_url}/network/devices/{device_id}"
-            ),
-        }
-
-        # Add network connections
-        if mac := get_field(device_data, "macAddress", "mac_address", "mac"):
-            device_info["connections"] = {(CONNECTION_NETWORK_MAC, mac)}
-
-        # Add hardware version based on device features
-        hw_info = []
-
-        # Get port count
-        if (ports := device_data.get("port_table", [])) and isinstance(ports, list):
-            port_count = len(ports)
-            if port_count > 0:
-                hw_info.append(f"{port_count} Ports")
-
-        # Get radio info
-        if (radio_table := device_data.get("radio_table", [])) and isinstance(
-            radio_table, list
-        ):
-            for radio in radio_table:
-                if not isinstance(radio, dict):
-                    continue
-                radio_name = radio.get("name", "")
-                radio_type = radio.get("radio", "")
-                if radio_name and radio_type:
-                    hw_info.append(f"{radio_name} ({radio_type})")
-
-        if hw_info:
-            device_info["hw_version"] = " | ".join(hw_info)
-
-        # Set suggested area based on device type
-        model = device_data.get("model", "").lower()
-        if any(
-            model.startswith(prefix)
-            for prefix in ("usw", "switch", "uap", "ap", "udm", "usg")
-        ):
-            device_info["suggested_area"] = "Network"
-
-        self._attr_device_info = DeviceInfo(**device_info)  # type: ignore[typeddict-item]
+        # Entities of one device can share a prebuilt device info
+        if device_info is None:
+            device_info = build_network_device_info(coordinator, site_id, device_id)
+        self._attr_device_info = device_info
 
     @property
     def device_info(self) -> DeviceInfo | None:
@@ -206,7 +217,9 @@ class UnifiInsightsEntity(CoordinatorEntity[UnifiFacadeCoordinator]):
     def available(self) -> bool:
         """Return True if entity is available."""
         device_data = (
-            self.coordinator.data["devices"].get(self._site_id, {}).get(self._device_id)
+            self.coordinator.data["devices"]
+            .get(self._site_id, EMPTY_DICT)
+            .get(self._device_id)
         )
         if not device_data:
             return False
@@ -216,7 +229,9 @@ class UnifiInsightsEntity(CoordinatorEntity[UnifiFacadeCoordinator]):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         device_data = (
-            self.coordinator.data["devices"].get(self._site_id, {}).get(self._device_id)
+            self.coordinator.data["devices"]
+            .get(self._site_id, EMPTY_DICT)
+            .get(self._device_id)
         )
         if not device_data:
             self._attr_available = False
@@ -229,14 +244,14 @@ class UnifiInsightsEntity(CoordinatorEntity[UnifiFacadeCoordinator]):
     @property
     def device_data(self) -> dict[str, Any] | None:
         """Return device data."""
-        devices = self.coordinator.data["devices"].get(self._site_id, {})
+        devices = self.coordinator.data["devices"].get(self._site_id, EMPTY_DICT)
         result = devices.get(self._device_id)
         return result if isinstance(result, dict) else None
 
     @property
     def device_stats(self) -> dict[str, Any] | None:
         """Return device statistics."""
-        stats = self.coordinator.data["stats"].get(self._site_id, {})
+        stats = self.coordinator.data["stats"].get(self._site_id, EMPTY_DICT)
         result = stats.get(self._device_id)
         return result if isinstance(result, dict) else None
 
@@ -258,9 +273,13 @@ class UnifiProtectEntity(CoordinatorEntity[UnifiFacadeCoordinator]):
         self._device_type = device_type
         self._device_id = device_id
         self._entity_type = entity_type
+        # Key of this device type's bucket in coordinator.data["protect"]
+        self._protect_bucket = f"{device_type}s"
 
         # Get device data
-        device_data = coordinator.data["protect"][f"{device_type}s"].get(device_id, {})
+        device_data = coordinator.data["protect"][self._protect_bucket].get(
+            device_id, {}
+        )
         device_name = device_data.get(
             "name", f"UniFi {device_type.capitalize()} {device_id}"
         )
@@ -292,7 +311,7 @@ class UnifiProtectEntity(CoordinatorEntity[UnifiFacadeCoordinator]):
         # This ensures devices like UDM-Pro show as a single device in HA
         # Use the original device ID for MAC lookup in case of dual-camera
         lookup_device_id = original_device_id if parent_camera_id else device_id
-        lookup_device_data = coordinator.data["protect"][f"{device_type}s"].get(
+        lookup_device_data = coordinator.data["protect"][self._protect_bucket].get(
             lookup_device_id, device_data
         )
 
@@ -414,7 +433,7 @@ class UnifiProtectEntity(CoordinatorEntity[UnifiFacadeCoordinator]):
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        device_data = self.coordinator.data["protect"][f"{self._device_type}s"].get(
+        device_data = self.coordinator.data["protect"][self._protect_bucket].get(
             self._device_id
         )
         if not device_data or not isinstance(device_data, dict):
@@ -443,7 +462,7 @@ class UnifiProtectEntity(CoordinatorEntity[UnifiFacadeCoordinator]):
     @property
     def device_data(self) -> dict[str, Any] | None:
         """Return device data."""
-        data = self.coordinator.data["protect"][f"{self._device_type}s"].get(
+        data = self.coordinator.data["protect"][self._protect_bucket].get(
             self._device_id
         )
         return data if isinstance(data, dict) else None
@@ -43,10 +43,16 @@ from .const import (
     DEVICE_TYPE_NVR,
     DEVICE_TYPE_SENSOR,
     DOMAIN,
+    EMPTY_DICT,
     MANUFACTURER,
 )
 from .coordinators import UnifiFacadeCoordinator
-from .entity import UnifiInsightsEntity, UnifiProtectEntity, get_field
+from .entity import (
+    UnifiInsightsEntity,
+    UnifiProtectEntity,
+    build_network_device_info,
+    get_field,
+)
 from .entity import get_client_type as _get_client_type
 
 if TYPE_CHECKING:
@@ -194,6 +200,14 @@ def _has_protect_stat(
     return check
 
 
+def _get_protect_stat_value(data: dict[str, Any], stat_key: str) -> Any:
+    """Return stats[stat_key]["value"] from Protect sensor data, if present."""
+    try:
+        return data["stats"][stat_key]["value"]
+    except (KeyError, TypeError):
+        return None
+
+
 PROTECT_SENSOR_TYPES: tuple[UnifiProtectSensorEntityDescription, ...] = (
     # Temperature sensor
     UnifiProtectSensorEntityDescription(
@@ -531,6 +545,15 @@ SENSOR_TYPES: tuple[UnifiInsightsSensorEntityDescription, ...] = (
     ),
 )
 
+# SENSOR_TYPES flattened to (description, key, required_feature) so the
+# per-device setup loop doesn't re-read the same description attributes
+_SENSOR_TYPES_FLAT: tuple[
+    tuple[UnifiInsightsSensorEntityDescription, str, str | None], ...
+] = tuple(
+    (description, description.key, description.required_feature)
+    for description in SENSOR_TYPES
+)
+
 # Port sensor descriptions for UniFi switches
 # These are templates - actual sensors are created dynamically per port
 PORT_SENSOR_TYPES: tuple[UnifiInsightsSensorEntityDescription, ...] = (
@@ -687,6 +710,90 @@ def _get_port_label(port: dict[str, Any], port_idx: int) -> str:
     return f"Port {port_idx}"
 
 
+def _build_port_specs(
+    devices: dict[str, dict[str, Any]],
+) -> dict[tuple[str, str], list[tuple[Any, str, bool, bool]]]:
+    """
+    Flatten the active ports of every device into port sensor specs.
+
+    Each spec is ``(port_idx, port_label, has_poe, has_sfp)``. It reads the
+    live coordinator data, so it must run on the event loop.
+    """
+    specs: dict[tuple[str, str], list[tuple[Any, str, bool, bool]]] = {}
+    for site_id, site_devices in devices.items():
+        for device_id, device_data in site_devices.items():
+            # Port data can come from:
+            # 1. device_data["ports"] - merged from legacy port_table by coordinator
+            # 2. device_data["interfaces"]["ports"] - new API format (dict)
+            ports = device_data.get("ports", [])
+            if not ports:
+                interfaces = get_field(device_data, "interfaces", default={})
+                if isinstance(interfaces, dict):
+                    ports = get_field(interfaces, "ports", default=[])
+            if not ports:
+                continue
+
+            device_name = device_data.get("name", device_id)
+            _LOGGER.debug(
+                "Device %s has %d ports, creating port sensors",
+                device_name,
+                len(ports),
+            )
+
+            device_specs = specs[(site_id, device_id)] = []
+            for port in ports:
+                port_idx = get_field(port, "idx", "index", "port_idx")
+                if port_idx is None:
+                    continue
+
+                # Only create sensors for active ports (state = "UP")
+                port_state = get_field(port, "state", "status", default="DOWN")
+                if str(port_state).upper() != "UP":
+                    _LOGGER.debug(
+                        "Skipping port %d on device %s - port state is %s (not UP)",
+                        port_idx,
+                        device_name,
+                        port_state,
+                    )
+                    continue
+
+                # Determine port label from legacy data
+                port_label = _get_port_label(port, port_idx)
+
+                # Create PoE power sensor only for ports where a PoE
+                # device is actually connected and drawing power. Skip
+                # PoE-capable ports with non-PoE devices attached.
+                poe_data = get_field(port, "poe", default={})
+                poe_marker = False
+                if isinstance(poe_data, dict):
+                    # "good" indicates successful PoE negotiation
+                    if poe_data.get("good"):
+                        poe_marker = True
+                    else:
+                        # Fallback: check actual power draw > 0
+                        for pw_key in ("power", "watts"):
+                            pw = poe_data.get(pw_key)
+                            try:
+                                if pw is not None and float(pw) > 0:
+                                    poe_marker = True
+                                    break
+                            except ValueError, TypeError:
+                                pass
+
+                if not poe_marker:
+                    norm = get_field(port, "poe_power_w")
+                    try:
+                        poe_marker = norm is not None and float(norm) > 0
+                    except ValueError, TypeError:
+                        poe_marker = False
+
+                has_sfp = str(port.get("media", "")).startswith("SFP") and bool(
+                    port.get("sfp_found")
+                )
+                device_specs.append((port_idx, port_label, poe_marker, has_sfp))
+    return specs
+
+
 # WAN sensor descriptions for UniFi gateways
 WAN_SENSOR_TYPES: tuple[UnifiInsightsSensorEntityDescription, ...] = (
     # WAN IP Address
@@ -816,7 +923,6 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up sensors for UniFi Insights integration."""
-    _ = hass
     _LOGGER.debug("Setting up UniFi Insights sensors")
 
     # Migrate existing entities to pick up new suggested_unit_of_measurement
@@ -824,8 +930,16 @@ async def async_setup_entry(
 
     coordinator: UnifiFacadeCoordinator = config_entry.runtime_data.coordinator
     entities: list[SensorEntity] = []
+    # Unique IDs of every entity handed to HA, used for stale port cleanup
+    created_uids: set[str | None] = set()
+
+    # Built on the loop: the coordinator mutates this data in place, so a
+    # worker thread could see it change mid-walk
+    port_specs = _build_port_specs(coordinator.data["devices"])
 
-    # Add sensors for each device in each site
+    # Add sensors for each device in each site. Entities are handed to HA
+    # one site at a time so large deployments don't register everything
+    # in a single burst.
     for site_id, devices in coordinator.data["devices"].items():
         _LOGGER.debug("Processing site %s with %d devices", site_id, len(devices))
         site_data = coordinator.get_site(site_id)
@@ -838,6 +952,8 @@ async def async_setup_entry(
                 coordinator.data.get("devices", {}).get(site_id, {}).get(device_id, {})
             )
             device_name = device_data.get("name", device_id)
+            # Built once and shared by every sensor of this device
+            device_info = build_network_device_info(coordinator, site_id, device_id)
             # Get device features for filtering (e.g., ['switching'], ['accessPoint'])
             device_features = device_data.get("features", [])
             if not isinstance(device_features, list):
@@ -852,22 +968,22 @@ async def async_setup_entry(
                 device_features,
             )
 
-            for description in SENSOR_TYPES:
+            for description, key, required_feature in _SENSOR_TYPES_FLAT:
                 # Skip sensor if it requires a specific feature the device doesn't have
                 if (
-                    description.required_feature is not None
-                    and description.required_feature not in device_features
+                    required_feature is not None
+                    and required_feature not in device_features
                 ):
                     _LOGGER.debug(
                         "Skipping sensor %s for %s - needs feature %s",
-                        description.key,
+                        key,
                         device_name,
-                        description.required_feature,
+                        required_feature,
                     )
                     continue
 
                 if (
-                    description.key == "general_temperature"
+                    key == "general_temperature"
                     and get_network_device_temperature(device_data) is None
                     and not get_field(
                         device_data,
@@ -878,13 +994,13 @@ async def async_setup_entry(
                 ):
                     _LOGGER.debug(
                         "Skipping sensor %s for %s - no temperature data",
-                        description.key,
+                        key,
                         device_name,
                     )
                     continue
 
                 # Only create uplink rate sensors if uplink data exists
-                if description.key in ("tx_rate", "rx_rate"):
+                if key in ("tx_rate", "rx_rate"):
                     stats = (
                         coordinator.data.get("stats", {})
                         .get(site_id, {})
@@ -908,13 +1024,13 @@ async def async_setup_entry(
                     if not has_uplink and not has_top_level:
                         _LOGGER.debug(
                             "Skipping sensor %s for %s - no uplink rate data",
-                            description.key,
+                            key,
                             device_name,
                         )
                         continue
 
                 # Only create Total PoE Power sensor if coordinator
-                if description.key == "poe_total_power":
+                if key == "poe_total_power":
                     stats = (
                         coordinator.data.get("stats", {})
                         .get(site_id, {})
@@ -939,169 +1055,119 @@ async def async_setup_entry(
                         description=description,
                         site_id=site_id,
                         device_id=device_id,
+                        device_info=device_info,
                     )
                 )
 
-            # Add port sensors for switches with port interfaces
-            # Port data can come from:
-            # 1. device_data["ports"] - merged from legacy port_table by coordinator
-            # 2. device_data["interfaces"]["ports"] - new API format (dict)
-            ports = device_data.get("ports", [])
-            if not ports:
-                interfaces = get_field(device_data, "interfaces", default={})
-                if isinstance(interfaces, dict):
-                    ports = get_field(interfaces, "ports", default=[])
-            if ports:
-                _LOGGER.debug(
-                    "Device %s has %d ports, creating port sensors",
-                    device_name,
-                    len(ports),
-                )
-
-                for port in ports:
-                    port_idx = get_field(port, "idx", "index", "port_idx")
-                    if port_idx is None:
-                        continue
-
-                    # Only create sensors for active ports (state = "UP")
-                    port_state = get_field(port, "state", "status", default="DOWN")
-                    if str(port_state).upper() != "UP":
-                        _LOGGER.debug(
-                            "Skipping port %d on device %s - port state is %s (not UP)",
-                            port_idx,
-                            device_name,
-                            port_state,
-                        )
-                        continue
-
-                    # Determine port label from legacy data
-                    port_label = _get_port_label(port, port_idx)
-                    is_sfp = str(port.get("media", "")).startswith("SFP")
-
-                    # Create PoE power sensor only for ports where a PoE
-                    # device is actually connected and drawing power. Skip
-                    # PoE-capable ports with non-PoE devices attached.
-                    poe_data = get_field(port, "poe", default={})
-                    poe_marker = False
-                    if isinstance(poe_data, dict):
-                        # "good" indicates successful PoE negotiation
-                        if poe_data.get("good"):
-                            poe_marker = True
-                        else:
-                            # Fallback: check actual power draw > 0
-                            for pw_key in ("power", "watts"):
-                                pw = poe_data.get(pw_key)
-                                try:
-                                    if pw is not None and float(pw) > 0:
-                                        poe_marker = True
-                                        break
-                                except ValueError, TypeError:
-                                    pass
-
-                    if not poe_marker:
-                        norm = get_field(port, "poe_power_w")
-                        try:
-                            poe_marker = norm is not None and float(norm) > 0
-                        except ValueError, TypeError:
-                            poe_marker = False
-
-                    if poe_marker:
-                        poe_desc = PORT_SENSOR_TYPES[0]  # PoE power sensor
-                        entities.append(
-                            UnifiPortSensor(
-                                coordinator=coordinator,
-                                description=poe_desc,
-                                site_id=site_id,
-                                device_id=device_id,
-                                port_idx=port_idx,
-                                port_label=port_label,
-                            )
-                        )
-
-                    # Create speed sensor for all active ports
-                    speed_desc = PORT_SENSOR_TYPES[1]  # Port speed sensor
+            # Add port sensors for the active ports found during flattening
+            device_port_specs = port_specs.get((site_id, device_id), [])
+            for port_idx, port_label, poe_marker, has_sfp in device_port_specs:
+                # One placeholder dict shared by every sensor of this port
+                port_placeholders = {"port_label": port_label}
+                if poe_marker:
+                    poe_desc = PORT_SENSOR_TYPES[0]  # PoE power sensor
                     entities.append(
                         UnifiPortSensor(
                             coordinator=coordinator,
-                            description=speed_desc,
+                            description=poe_desc,
                             site_id=site_id,
                             device_id=device_id,
+                            device_info=device_info,
                             port_idx=port_idx,
                             port_label=port_label,
+                            translation_placeholders=port_placeholders,
                         )
                     )
 
-                    # Create TX/RX sensors for all active ports
-                    tx_desc = PORT_SENSOR_TYPES[2]  # TX sensor
-                    rx_desc = PORT_SENSOR_TYPES[3]  # RX sensor
-                    entities.append(
-                        UnifiPortSensor(
-                            coordinator=coordinator,
-                            description=tx_desc,
-                            site_id=site_id,
-                            device_id=device_id,
-                            port_idx=port_idx,
-                            port_label=port_label,
-                        )
+                # Create speed sensor for all active ports
+                speed_desc = PORT_SENSOR_TYPES[1]  # Port speed sensor
+                entities.append(
+                    UnifiPortSensor(
+                        coordinator=coordinator,
+                        description=speed_desc,
+                        site_id=site_id,
+                        device_id=device_id,
+                        device_info=device_info,
+                        port_idx=port_idx,
+                        port_label=port_label,
+                        translation_placeholders=port_placeholders,
                     )
-                    entities.append(
-                        UnifiPortSensor(
-                            coordinator=coordinator,
-                            description=rx_desc,
-                            site_id=site_id,
-                            device_id=device_id,
-                            port_idx=port_idx,
-                            port_label=port_label,
-                        )
+                )
+
+                # Create TX/RX sensors for all active ports
+                tx_desc = PORT_SENSOR_TYPES[2]  # TX sensor
+                rx_desc = PORT_SENSOR_TYPES[3]  # RX sensor
+                entities.append(
+                    UnifiPortSensor(
+                        coordinator=coordinator,
+                        description=tx_desc,
+                        site_id=site_id,
+                        device_id=device_id,
+                        device_info=device_info,
+                        port_idx=port_idx,
+                        port_label=port_label,
+                        translation_placeholders=port_placeholders,
                     )
+                )
+                entities.append(
+                    UnifiPortSensor(
+                        coordinator=coordinator,
+                        description=rx_desc,
+                        site_id=site_id,
+                        device_id=device_id,
+                        device_info=device_info,
+                        port_idx=port_idx,
+                        port_label=port_label,
+                        translation_placeholders=port_placeholders,
+                    )
+                )
 
-                    # Create TX/RX rate sensors for all active ports
-                    tx_rate_desc = PORT_RATE_SENSOR_TYPES[0]
-                    rx_rate_desc = PORT_RATE_SENSOR_TYPES[1]
-                    entities.append(
-                        UnifiPortSensor(
-                            coordinator=coordinator,
-                            description=tx_rate_desc,
-                            site_id=site_id,
-                            device_id=device_id,
-                            port_idx=port_idx,
-                            port_label=port_label,
-                        )
+                # Create TX/RX rate sensors for all active ports
+                tx_rate_desc = PORT_RATE_SENSOR_TYPES[0]
+                rx_rate_desc = PORT_RATE_SENSOR_TYPES[1]
+                entities.append(
+                    UnifiPortSensor(
+                        coordinator=coordinator,
+                        description=tx_rate_desc,
+                        site_id=site_id,
+                        device_id=device_id,
+                        device_info=device_info,
+                        port_idx=port_idx,
+                        port_label=port_label,
+                        translation_placeholders=port_placeholders,
                     )
-                    entities.append(
+                )
+                entities.append(
+                    UnifiPortSensor(
+                        coordinator=coordinator,
+                        description=rx_rate_desc,
+                        site_id=site_id,
+                        device_id=device_id,
+                        device_info=device_info,
+                        port_idx=port_idx,
+                        port_label=port_label,
+                        translation_placeholders=port_placeholders,
+                    )
+                )
+
+                # Create SFP module sensors for SFP/SFP+ ports
+                if has_sfp:
+                    entities.extend(
                         UnifiPortSensor(
                             coordinator=coordinator,
-                            description=rx_rate_desc,
+                            description=sfp_desc,
                             site_id=site_id,
                             device_id=device_id,
+                            device_info=device_info,
                             port_idx=port_idx,
                             port_label=port_label,
+                            translation_placeholders=port_placeholders,
                         )
+                        for sfp_desc in SFP_SENSOR_TYPES
                     )
 
-                    # Create SFP module sensors for SFP/SFP+ ports
-                    if is_sfp and port.get("sfp_found"):
-                        entities.extend(
-                            UnifiPortSensor(
-                                coordinator=coordinator,
-                                description=sfp_desc,
-                                site_id=site_id,
-                                device_id=device_id,
-                                port_idx=port_idx,
-                                port_label=port_label,
-                            )
-                            for sfp_desc in SFP_SENSOR_TYPES
-                        )
-
-            # Build set of active (UP) port indices for filtering
-            active_port_indices: set[int] = set()
-            for port in ports:
-                p_idx = get_field(port, "idx", "index", "port_idx")
-                if p_idx is None:
-                    continue
-                p_state = get_field(port, "state", "status", default="DOWN")
-                if str(p_state).upper() == "UP":
-                    active_port_indices.add(int(p_idx))
+            # Set of active (UP) port indices for filtering
+            active_port_indices = {int(port_idx) for port_idx, *_ in device_port_specs}
 
             # Fallback: create PoE power sensors from stats
             # when interfaces.ports is unavailable
@@ -1115,6 +1181,7 @@ async def async_setup_entry(
                 _device_id: str = device_id,
                 _device_features: dict[str, Any] = device_features,
                 _active_ports: set[int] = active_port_indices,
+                _device_info: DeviceInfo = device_info,
             ) -> None:
                 """Create per-port sensors from stats."""
                 if "switching" not in _device_features:
@@ -1171,6 +1238,7 @@ async def async_setup_entry(
                                 site_id=_site_id,
                                 device_id=_device_id,
                                 port_idx=port_idx_int,
+                                device_info=_device_info,
                             )
                         )
                         existing_uids.add(uid)
@@ -1204,10 +1272,17 @@ async def async_setup_entry(
                         description=description,
                         site_id=site_id,
                         device_id=device_id,
+                        device_info=device_info,
                     )
                     for description in WAN_SENSOR_TYPES
                 )
 
+        if entities:
+            _LOGGER.debug("Adding %d sensors for site %s", len(entities), site_id)
+            created_uids.update(getattr(e, "unique_id", None) for e in entities)
+            async_add_entities(entities)
+            entities = []
+
     # Add site-level client count sensors
     for site_id in coordinator.data.get("clients", {}):
         _LOGGER.debug("Creating site-level client count sensors for site %s", site_id)
@@ -1296,11 +1371,11 @@ async def async_setup_entry(
                         )
                     )
 
-    _LOGGER.info("Adding %d UniFi Insights sensors", len(entities))
+    created_uids.update(getattr(e, "unique_id", None) for e in entities)
+    _LOGGER.info("Adding %d UniFi Insights sensors", len(created_uids))
     async_add_entities(entities)
 
     # Clean up stale port entities from previous runs
-    created_uids = {getattr(e, "unique_id", None) for e in entities}
     ent_reg = er.async_get(hass)
     stale = [
         entry
@@ -1325,9 +1400,13 @@ class UnifiInsightsSensor(UnifiInsightsEntity, SensorEntity):
         description: UnifiInsightsSensorEntityDescription,
         site_id: str,
         device_id: str,
+        *,
+        device_info: DeviceInfo | None = None,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, description, site_id, device_id)
+        super().__init__(
+            coordinator, description, site_id, device_id, device_info=device_info
+        )
 
         _LOGGER.debug(
             "Initializing %s sensor for device %s in site %s",
@@ -1339,52 +1418,57 @@ class UnifiInsightsSensor(UnifiInsightsEntity, SensorEntity):
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
+        data = self.coordinator.data
+        site_id = self._site_id
+        device_id = self._device_id
+        description = self.entity_description
+        key = description.key
+
         # Special handling for sensors that come from device data (not stats)
-        if self.entity_description.key in [
+        if key in [
             "firmware_version",
             "wan_ip",
             "general_temperature",
         ]:
-            device = (
-                self.coordinator.data["devices"]
-                .get(self._site_id, {})
-                .get(self._device_id)
-            )
+            try:
+                device = data["devices"][site_id][device_id]
+            except (KeyError, TypeError):
+                device = None
             if not device:
                 _LOGGER.debug(
                     "No device data available for %s sensor (device %s in site %s)",
-                    self.entity_description.key,
-                    self._device_id,
-                    self._site_id,
+                    key,
+                    device_id,
+                    site_id,
                 )
                 return None
-            value = self.entity_description.value_fn(device)  # type: ignore[misc]
+            value = description.value_fn(device)  # type: ignore[misc]
         else:
             # For all other sensors, use stats data
-            if (
-                not self.coordinator.data["stats"]
-                .get(self._site_id, {})
-                .get(self._device_id)
-            ):
+            try:
+                stats = data["stats"][site_id][device_id]
+            except (KeyError, TypeError):
+                stats = None
+            if not stats:
                 _LOGGER.debug(
                     "No stats available for sensor %s (device %s in site %s)",
-                    self.entity_description.key,
-                    self._device_id,
-                    self._site_id,
+                    key,
+                    device_id,
+                    site_id,
                 )
                 return None
 
-            stats = self.coordinator.data["stats"][self._site_id][self._device_id]
-            value = self.entity_description.value_fn(stats)  # type: ignore[misc]
+            value = description.value_fn(stats)  # type: ignore[misc]
 
-        _LOGGER.debug(
-            "Sensor %s for device %s in site %s updated to %s %s",
-            self.entity_description.key,
-            self._device_id,
-            self._site_id,
-            value,
-            self.native_unit_of_measurement or "",
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Sensor %s for device %s in site %s updated to %s %s",
+                key,
+                device_id,
+                site_id,
+                value,
+                self.native_unit_of_measurement or "",
+            )
 
         return value
 
@@ -1402,19 +1486,26 @@ class UnifiPortSensor(UnifiInsightsEntity, SensorEntity):
         device_id: str,
         port_idx: int,
         port_label: str | None = None,
+        *,
+        device_info: DeviceInfo | None = None,
+        translation_placeholders: dict[str, str] | None = None,
     ) -> None:
         """Initialize the port sensor."""
-        super().__init__(coordinator, description, site_id, device_id)
+        super().__init__(
+            coordinator, description, site_id, device_id, device_info=device_info
+        )
         self._port_idx = port_idx
 
-        # Use port label (e.g. "SFP+ 1") or fall back to "Port {idx}"
-        label = port_label or f"Port {port_idx}"
-
         # Provide the {port_label} placeholder used in the per-port translation
         # strings (e.g. "{port_label} TX"). This produces unique, descriptive
         # names per metric (e.g. "Port 1 TX", "Port 1 RX") instead of every
-        # sensor for a port sharing the same name.
-        self._attr_translation_placeholders = {"port_label": label}
+        # sensor for a port sharing the same name. Setup passes one dict shared
+        # by all sensors of a port.
+        if translation_placeholders is None:
+            # Use port label (e.g. "SFP+ 1") or fall back to "Port {idx}"
+            label = port_label or f"Port {port_idx}"
+            translation_placeholders = {"port_label": label}
+        self._attr_translation_placeholders = translation_placeholders
 
         # Create unique ID with port index (stable, doesn't change with rename)
         self._attr_unique_id = f"{device_id}_{description.key}_{port_idx}"
@@ -1430,51 +1521,37 @@ class UnifiPortSensor(UnifiInsightsEntity, SensorEntity):
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
+        data = self.coordinator.data
+        site_id = self._site_id
+        device_id = self._device_id
+        port_idx = self._port_idx
+        key = self.entity_description.key
+
         # Get device data to access port information
-        device_data = (
-            self.coordinator.data.get("devices", {})
-            .get(self._site_id, {})
-            .get(self._device_id, {})
-        )
+        try:
+            device_data = data["devices"][site_id][device_id]
+        except (KeyError, TypeError):
+            device_data = None
 
         if not device_data:
             _LOGGER.debug(
                 "No device data available for port sensor %s (device %s in site %s)",
-                self.entity_description.key,
-                self._device_id,
-                self._site_id,
+                key,
+                device_id,
+                site_id,
             )
             return None
 
-        # Find the port data
-        # Port data can come from:
-        # 1. device_data["ports"] - merged from legacy port_table by coordinator
-        # 2. device_data["interfaces"]["ports"] - new API format (dict)
-        ports = device_data.get("ports", [])
-        if not ports:
-            interfaces = device_data.get("interfaces", {})
-            ports = interfaces.get("ports", []) if isinstance(interfaces, dict) else []
-        port_data = None
-        for port in ports:
-            idx = port.get("idx") or port.get("port_idx")
-            if idx == self._port_idx:
-                port_data = port
-                break
+        port_data = self._find_port(device_data)
 
         if not port_data:
             # PoE power can be sourced from stats when interfaces.ports is unavailable
-            if self.entity_description.key == "port_poe_power":
-                stats = (
-                    self.coordinator.data.get("stats", {})
-                    .get(self._site_id, {})
-                    .get(self._device_id, {})
-                )
-                if isinstance(stats, dict):
+            if key == "port_poe_power":
+                stats = self._get_stats()
+                if stats is not None:
                     poe_ports = stats.get("poe_ports")
                     if isinstance(poe_ports, dict):
-                        watts = poe_ports.get(self._port_idx) or poe_ports.get(
-                            str(self._port_idx)
-                        )
+                        watts = poe_ports.get(port_idx) or poe_ports.get(str(port_idx))
                         if isinstance(watts, (int, float)):
                             return float(watts)
                         if isinstance(watts, str):
@@ -1484,55 +1561,43 @@ class UnifiPortSensor(UnifiInsightsEntity, SensorEntity):
                                 return None
 
             # TX/RX bytes can be sourced from stats when interfaces.ports is unavailable
-            if self.entity_description.key in ("port_tx_bytes", "port_rx_bytes"):
-                stats = (
-                    self.coordinator.data.get("stats", {})
-                    .get(self._site_id, {})
-                    .get(self._device_id, {})
-                )
-                if isinstance(stats, dict):
+            if key in ("port_tx_bytes", "port_rx_bytes"):
+                stats = self._get_stats()
+                if stats is not None:
                     port_bytes = stats.get("port_bytes")
                     if isinstance(port_bytes, dict):
-                        pb = port_bytes.get(self._port_idx) or port_bytes.get(
-                            str(self._port_idx)
-                        )
+                        pb = port_bytes.get(port_idx) or port_bytes.get(str(port_idx))
                         if isinstance(pb, dict):
                             v = (
                                 pb.get("tx_bytes")
-                                if self.entity_description.key == "port_tx_bytes"
+                                if key == "port_tx_bytes"
                                 else pb.get("rx_bytes")
                             )
                             if isinstance(v, (int, float)):
                                 return int(v)
 
             # TX/RX rate sourced from stats when interfaces.ports is unavailable
-            if self.entity_description.key in ("port_tx_rate", "port_rx_rate"):
+            if key in ("port_tx_rate", "port_rx_rate"):
                 return self._get_port_rate_value()
 
             _LOGGER.debug(
                 "No port data available for port %d on device %s",
-                self._port_idx,
-                self._device_id,
+                port_idx,
+                device_id,
             )
             return None
 
         # Port TX/RX rate always comes from computed stats, not port data
-        if self.entity_description.key in ("port_tx_rate", "port_rx_rate"):
+        if key in ("port_tx_rate", "port_rx_rate"):
             return self._get_port_rate_value()
 
         # Prefer PoE watts from coordinator stats when available
-        if self.entity_description.key == "port_poe_power":
-            stats = (
-                self.coordinator.data.get("stats", {})
-                .get(self._site_id, {})
-                .get(self._device_id, {})
-            )
-            if isinstance(stats, dict):
+        if key == "port_poe_power":
+            stats = self._get_stats()
+            if stats is not None:
                 poe_ports = stats.get("poe_ports")
                 if isinstance(poe_ports, dict):
-                    watts = poe_ports.get(self._port_idx) or poe_ports.get(
-                        str(self._port_idx)
-                    )
+                    watts = poe_ports.get(port_idx) or poe_ports.get(str(port_idx))
                     if isinstance(watts, (int, float)):
                         return float(watts)
                     if isinstance(watts, str):
@@ -1542,27 +1607,17 @@ class UnifiPortSensor(UnifiInsightsEntity, SensorEntity):
                             return None
 
         # TX/RX bytes from coordinator stats
-        if self.entity_description.key in ["port_tx_bytes", "port_rx_bytes"]:
-            stats = (
-                self.coordinator.data.get("stats", {})
-                .get(self._site_id, {})
-                .get(self._device_id, {})
-            )
-            if not isinstance(stats, dict):
+        if key in ["port_tx_bytes", "port_rx_bytes"]:
+            stats = self._get_stats()
+            if stats is None:
                 return None
 
-            counter_key = (
-                "tx_bytes"
-                if self.entity_description.key == "port_tx_bytes"
-                else "rx_bytes"
-            )
+            counter_key = "tx_bytes" if key == "port_tx_bytes" else "rx_bytes"
 
             # 1) Preferred: legacy-mapped per-port counters
             port_bytes = stats.get("port_bytes")
             if isinstance(port_bytes, dict):
-                pb = port_bytes.get(self._port_idx) or port_bytes.get(
-                    str(self._port_idx)
-                )
+                pb = port_bytes.get(port_idx) or port_bytes.get(str(port_idx))
                 if isinstance(pb, dict):
                     v = pb.get(counter_key)
                     if isinstance(v, (int, float)):
@@ -1571,7 +1626,7 @@ class UnifiPortSensor(UnifiInsightsEntity, SensorEntity):
             # 2) Optional fallback: upstream per-port counters dict
             port_data = stats.get("port_data")
             if isinstance(port_data, dict):
-                pb = port_data.get(self._port_idx) or port_data.get(str(self._port_idx))
+                pb = port_data.get(port_idx) or port_data.get(str(port_idx))
                 if isinstance(pb, dict):
                     v = pb.get(counter_key)
                     if isinstance(v, (int, float)):
@@ -1582,129 +1637,100 @@ class UnifiPortSensor(UnifiInsightsEntity, SensorEntity):
         # Use value_fn to extract the value
         value = self.entity_description.value_fn(port_data)  # type: ignore[misc]
 
-        _LOGGER.debug(
-            "Port sensor %s for port %d on device %s updated to %s %s",
-            self.entity_description.key,
-            self._port_idx,
-            self._device_id,
-            value,
-            self.native_unit_of_measurement or "",
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Port sensor %s for port %d on device %s updated to %s %s",
+                key,
+                port_idx,
+                device_id,
+                value,
+                self.native_unit_of_measurement or "",
+            )
 
         return value
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        # PoE power availability based on coordinator stats
-        if self.entity_description.key == "port_poe_power":
-            if not self.coordinator.last_update_success:
-                return False
-            stats = (
-                self.coordinator.data.get("stats", {})
-                .get(self._site_id, {})
-                .get(self._device_id, {})
-            )
-            if isinstance(stats, dict):
-                poe_ports = stats.get("poe_ports")
-                if isinstance(poe_ports, dict):
+        # Port sensors are available if the device is available AND the port is UP
+        if not self.coordinator.last_update_success:
+            return False
+
+        data = self.coordinator.data
+        site_id = self._site_id
+        device_id = self._device_id
+        port_idx = self._port_idx
+        key = self.entity_description.key
+
+        if key in (
+            "port_poe_power",
+            "port_tx_bytes",
+            "port_rx_bytes",
+            "port_tx_rate",
+            "port_rx_rate",
+        ):
+            stats = self._get_stats()
+            if stats is not None:
+                # PoE power availability based on coordinator stats
+                if key == "port_poe_power":
                     # If the device provides poe_ports at all,
                     # keep PoE power sensors available
                     # (link state may be DOWN while PoE is
                     # disabled or idle).
-                    return True
-            # Fall through to standard port-state availability logic
-
-        # TX/RX availability based on coordinator stats
-        if self.entity_description.key in ("port_tx_bytes", "port_rx_bytes"):
-            if not self.coordinator.last_update_success:
-                return False
-            stats = (
-                self.coordinator.data.get("stats", {})
-                .get(self._site_id, {})
-                .get(self._device_id, {})
-            )
-            if isinstance(stats, dict):
-                port_bytes = stats.get("port_bytes")
-                if isinstance(port_bytes, dict):
-                    pb = port_bytes.get(self._port_idx) or port_bytes.get(
-                        str(self._port_idx)
-                    )
-                    if isinstance(pb, dict):
+                    if isinstance(stats.get("poe_ports"), dict):
                         return True
-            # Fall through to standard port-state availability logic
-
-        # TX/RX rate availability based on computed port_rates
-        if self.entity_description.key in ("port_tx_rate", "port_rx_rate"):
-            if not self.coordinator.last_update_success:
-                return False
-            stats = (
-                self.coordinator.data.get("stats", {})
-                .get(self._site_id, {})
-                .get(self._device_id, {})
-            )
-            if isinstance(stats, dict):
-                port_rates = stats.get("port_rates")
-                if isinstance(port_rates, dict):
-                    pr = port_rates.get(self._port_idx) or port_rates.get(
-                        str(self._port_idx)
+                else:
+                    # TX/RX counters and rates based on coordinator stats
+                    per_port = stats.get(
+                        "port_bytes"
+                        if key in ("port_tx_bytes", "port_rx_bytes")
+                        else "port_rates"
                     )
-                    if isinstance(pr, dict):
-                        return True
+                    if isinstance(per_port, dict):
+                        pb = per_port.get(port_idx) or per_port.get(str(port_idx))
+                        if isinstance(pb, dict):
+                            return True
             # Fall through to standard port-state availability logic
 
-        # Port sensors are available if the device is available AND the port is UP
-        if not self.coordinator.last_update_success:
-            return False
+        # Fast path: the coordinator indexes every port whose link is UP.
+        # SFP info sensors stay available regardless of port state, so they
+        # still need the port lookup below.
+        available_port_keys = data.get("available_port_keys")
+        if isinstance(available_port_keys, set) and not key.startswith("port_sfp_"):
+            return (site_id, device_id, port_idx) in available_port_keys
 
         # Get device data
-        devices = self.coordinator.data.get("devices", {})
-        if not isinstance(devices, dict):
+        try:
+            device_data = data["devices"][site_id][device_id]
+        except (KeyError, TypeError):
             return False
-        site_devices = devices.get(self._site_id, {})
-        if not isinstance(site_devices, dict):
-            return False
-        device_data = site_devices.get(self._device_id, {})
         if not device_data or not isinstance(device_data, dict):
             return False
 
-        # Find the port data
-        # Check device_data["ports"] first (from legacy merge),
-        # fall back to interfaces["ports"]
-        port_list = device_data.get("ports", [])
-        if not port_list:
-            interfaces = device_data.get("interfaces", {})
-            if isinstance(interfaces, dict):
-                port_list = interfaces.get("ports", [])
-        if not isinstance(port_list, list):
-            return False
-
-        port_data = None
-        for port in port_list:
-            idx = port.get("idx") or port.get("port_idx")
-            if idx == self._port_idx:
-                port_data = port
-                break
-
+        port_data = self._find_port(device_data)
         if not port_data:
             return False
 
         # SFP info sensors stay available regardless of port state
-        if self.entity_description.key.startswith("port_sfp_"):
+        if key.startswith("port_sfp_"):
             return True
 
         # Port sensor is only available if port state is UP
         port_state = port_data.get("state", "DOWN")
         return isinstance(port_state, str) and port_state == "UP"
 
+    def _get_stats(self) -> dict[str, Any] | None:
+        """Return coordinator stats for this sensor's device, if present."""
+        try:
+            stats = self.coordinator.data["stats"][self._site_id][self._device_id]
+        except (KeyError, TypeError):
+            return None
+        return stats if isinstance(stats, dict) else None
+
     def _get_port_rate_value(self) -> StateType:
         """Get the computed port byte rate as bits/sec."""
-        stats = (
-            self.coordinator.data.get("stats", {})
-            .get(self._site_id, {})
-            .get(self._device_id, {})
-        )
-        if not isinstance(stats, dict):
+        stats = self._get_stats()
+        if stats is None:
             return None
 
         port_rates = stats.get("port_rates")
@@ -1727,26 +1753,45 @@ class UnifiPortSensor(UnifiInsightsEntity, SensorEntity):
         # Convert bytes/sec to bits/sec (native unit)
         return round(float(bytes_per_sec) * 8)
 
-    def _find_port_data(self) -> dict[str, Any] | None:
-        """Find port data for this sensor's port index."""
-        device_data = (
-            self.coordinator.data.get("devices", {})
-            .get(self._site_id, {})
-            .get(self._device_id, {})
-        )
-        if not device_data:
-            return None
+    def _find_port(self, device_data: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Return the port entry for this sensor's port index.
+
+        Uses the coordinator's port index when available, otherwise scans the
+        device's ports. Port data can come from:
+        1. device_data["ports"] - merged from legacy port_table by coordinator
+        2. device_data["interfaces"]["ports"] - new API format (dict)
+        """
+        port_index = self.coordinator.data.get("port_index")
+        if isinstance(port_index, dict):
+            return port_index.get((self._site_id, self._device_id, self._port_idx))
+
         ports = device_data.get("ports", [])
         if not ports:
             interfaces = device_data.get("interfaces", {})
             if isinstance(interfaces, dict):
                 ports = interfaces.get("ports", [])
+        if not isinstance(ports, list):
+            return None
         for port in ports:
             idx = port.get("idx") or port.get("port_idx")
             if idx == self._port_idx:
-                return dict(port)
+                return port
         return None
 
+    def _find_port_data(self) -> dict[str, Any] | None:
+        """Find port data for this sensor's port index."""
+        try:
+            device_data = self.coordinator.data["devices"][self._site_id][
+                self._device_id
+            ]
+        except (KeyError, TypeError):
+            return None
+        if not device_data:
+            return None
+        port = self._find_port(device_data)
+        return dict(port) if port else None
+
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return port type attributes."""
@@ -1810,55 +1855,56 @@ class UnifiProtectSensor(UnifiProtectEntity, SensorEntity):
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
-        device_data = self.coordinator.data["protect"][
-            f"{self.entity_description.device_type}s"
-        ].get(self._device_id)
+        device_data = self.coordinator.data["protect"][self._protect_bucket].get(
+            self._device_id
+        )
         if not device_data:
             return None
 
         value = self.entity_description.value_fn(device_data)  # type: ignore[misc]
 
-        _LOGGER.debug(
-            "Sensor %s for %s device %s updated to %s %s",
-            self.entity_description.key,
-            self.entity_description.device_type,
-            self._device_id,
-            value,
-            self.native_unit_of_measurement or "",
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Sensor %s for %s device %s updated to %s %s",
+                self.entity_description.key,
+                self.entity_description.device_type,
+                self._device_id,
+                value,
+                self.native_unit_of_measurement or "",
+            )
 
         return value
 
     def _update_from_data(self) -> None:
         """Update entity from data."""
-        device_data = self.coordinator.data["protect"][
-            f"{self.entity_description.device_type}s"
-        ].get(self._device_id, {})
+        device_data = self.coordinator.data["protect"][self._protect_bucket].get(
+            self._device_id, {}
+        )
 
         # Set attributes based on sensor type
         if self.entity_description.key == "temperature":
             self._attr_extra_state_attributes = {
                 ATTR_SENSOR_ID: self._device_id,
                 ATTR_SENSOR_NAME: device_data.get("name"),
-                ATTR_SENSOR_TEMPERATURE_VALUE: device_data.get("stats", {})
-                .get("temperature", {})
-                .get("value"),
+                ATTR_SENSOR_TEMPERATURE_VALUE: _get_protect_stat_value(
+                    device_data, "temperature"
+                ),
             }
         elif self.entity_description.key == "humidity":
             self._attr_extra_state_attributes = {
                 ATTR_SENSOR_ID: self._device_id,
                 ATTR_SENSOR_NAME: device_data.get("name"),
-                ATTR_SENSOR_HUMIDITY_VALUE: device_data.get("stats", {})
-                .get("humidity", {})
-                .get("value"),
+                ATTR_SENSOR_HUMIDITY_VALUE: _get_protect_stat_value(
+                    device_data, "humidity"
+                ),
             }
         elif self.entity_description.key == "light":
             self._attr_extra_state_attributes = {
                 ATTR_SENSOR_ID: self._device_id,
                 ATTR_SENSOR_NAME: device_data.get("name"),
-                ATTR_SENSOR_LIGHT_VALUE: device_data.get("stats", {})
-                .get("light", {})
-                .get("value"),
+                ATTR_SENSOR_LIGHT_VALUE: _get_protect_stat_value(
+                    device_data, "light"
+                ),
             }
         elif self.entity_description.key == "battery":
             self._attr_extra_state_attributes = {
@@ -1942,19 +1988,22 @@ class UnifiProtectNVRSensor(UnifiProtectEntity, SensorEntity):
 
         value = self.entity_description.value_fn(nvr_data)  # type: ignore[misc]
 
-        _LOGGER.debug(
-            "NVR sensor %s for device %s updated to %s %s",
-            self.entity_description.key,
-            self._device_id,
-            value,
-            self.native_unit_of_measurement or "",
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "NVR sensor %s for device %s updated to %s %s",
+                self.entity_description.key,
+                self._device_id,
+                value,
+                self.native_unit_of_measurement or "",
+            )
 
         return value
 
     def _update_from_data(self) -> None:
         """Update entity from data."""
-        nvr_data = self.coordinator.data["protect"]["nvrs"].get(self._device_id, {})
+        nvr_data = self.coordinator.data["protect"]["nvrs"].get(
+            self._device_id, EMPTY_DICT
+        )
 
         # Get storage values
         storage_used = nvr_data.get("storageUsedBytes") or nvr_data.get(
@@ -2044,7 +2093,9 @@ class UnifiSiteClientSensor(CoordinatorEntity[UnifiFacadeCoordinator], SensorEnt
     @property
     def native_value(self) -> StateType:
         """Return the client count."""
-        clients = self.coordinator.data.get("clients", {}).get(self._site_id, {})
+        clients = self.coordinator.data.get("clients", EMPTY_DICT).get(
+            self._site_id, EMPTY_DICT
+        )
         if not isinstance(clients, dict):
             return 0
         return self.entity_description.value_fn(clients)  # type: ignore[misc]
@@ -2085,8 +2136,8 @@ class UnifiWifiClientCountSensor(
     def _get_wifi_data(self) -> dict[str, Any]:
         """Get WiFi data for this network from the coordinator."""
         result: dict[str, Any] = (
-            self.coordinator.data.get("wifi", {})
-            .get(self._site_id, {})
+            self.coordinator.data.get("wifi", EMPTY_DICT)
+            .get(self._site_id, EMPTY_DICT)
             .get(self._wifi_id, {})
         )
         return result
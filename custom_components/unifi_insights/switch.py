@@ -6,6 +6,7 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchEntity
+from homeassistant.core import callback
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
@@ -22,6 +23,7 @@ from .const import (
     DEFAULT_CLIENT_CONTROL,
     DEVICE_TYPE_CAMERA,
     DOMAIN,
+    EMPTY_DICT,
     MANUFACTURER,
     VIDEO_MODE_DEFAULT,
     VIDEO_MODE_HIGH_FPS,
@@ -53,6 +55,24 @@ def _device_has_feature(device_data: dict[str, Any], *features_to_match: str) ->
     return False
 
 
+def _find_gateway_device_id(site_devices: Any) -> str | None:
+    """Return the gateway-like device ID among a site's devices, if any."""
+    if not isinstance(site_devices, dict):
+        return None
+
+    for device_id, device_data in site_devices.items():
+        if not isinstance(device_data, dict):
+            continue
+
+        model = str(device_data.get("model", "")).upper()
+        if _device_has_feature(device_data, "gateway", "router") or model.startswith(
+            ("UDM", "USG", "UXG", "UCG")
+        ):
+            return str(device_id)
+
+    return None
+
+
 def _get_firewall_rule_action(rule_data: dict[str, Any]) -> str | None:
     """Return the firewall rule action regardless of payload shape."""
     action = rule_data.get("action")
@@ -110,25 +130,13 @@ async def async_setup_entry(
                 "Adding camera switches for camera %s",
                 camera_name,
             )
-            # Microphone switch
-            entities.append(
-                UnifiProtectMicrophoneSwitch(
-                    coordinator=coordinator,
-                    camera_id=camera_id,
-                )
-            )
-            # Privacy mode switch
-            entities.append(
-                UnifiProtectPrivacySwitch(
-                    coordinator=coordinator,
-                    camera_id=camera_id,
-                )
-            )
-            # Status light switch
-            entities.append(
-                UnifiProtectStatusLightSwitch(
-                    coordinator=coordinator,
-                    camera_id=camera_id,
+            # Microphone, privacy mode and status light switches
+            entities.extend(
+                switch_class(coordinator=coordinator, camera_id=camera_id)
+                for switch_class in (
+                    UnifiProtectMicrophoneSwitch,
+                    UnifiProtectPrivacySwitch,
+                    UnifiProtectStatusLightSwitch,
                 )
             )
             # High FPS mode switch (only for cameras that support it).
@@ -188,7 +196,10 @@ async def async_setup_entry(
     # System-defined rules (auto-generated by UniFi features like port forwarding
     # or mDNS) cannot be toggled via the Integration API and are excluded.
     skipped_system_rules = 0
+    site_devices_by_id = coordinator.data.get("devices", {})
     for site_id, firewall_rules in coordinator.data.get("firewall_rules", {}).items():
+        # Resolve the site's gateway once rather than once per rule
+        gateway_device_id = _find_gateway_device_id(site_devices_by_id.get(site_id))
         for rule_id, rule_data in firewall_rules.items():
             if not isinstance(rule_data, dict):
                 continue
@@ -213,6 +224,7 @@ async def async_setup_entry(
                     coordinator=coordinator,
                     site_id=site_id,
                     rule_id=rule_id,
+                    gateway_device_id=gateway_device_id,
                 )
             )
 
@@ -240,6 +252,7 @@ class UnifiFirewallRuleSwitch(
         coordinator: UnifiFacadeCoordinator,
         site_id: str,
         rule_id: str,
+        gateway_device_id: str | None = None,
     ) -> None:
         """Initialize the firewall rule switch."""
         super().__init__(coordinator)
@@ -251,38 +264,27 @@ class UnifiFirewallRuleSwitch(
 
         self._attr_unique_id = f"{site_id}_{rule_id}_firewall_rule"
         self._attr_name = str(rule_name)
-        self._attr_device_info = self._build_device_info()
+        self._attr_device_info = self._build_device_info(gateway_device_id)
 
     def _get_rule_data(self) -> dict[str, Any]:
         """Get firewall rule data from the coordinator."""
         result: dict[str, Any] = (
-            self.coordinator.data.get("firewall_rules", {})
-            .get(self._site_id, {})
+            self.coordinator.data.get("firewall_rules", EMPTY_DICT)
+            .get(self._site_id, EMPTY_DICT)
             .get(self._rule_id, {})
         )
         return result
 
     def _find_gateway_device_id(self) -> str | None:
         """Return the gateway-like device ID for the site if one exists."""
-        site_devices = self.coordinator.data.get("devices", {}).get(self._site_id, {})
-        if not isinstance(site_devices, dict):
-            return None
-
-        for device_id, device_data in site_devices.items():
-            if not isinstance(device_data, dict):
-                continue
-
-            model = str(device_data.get("model", "")).upper()
-            if _device_has_feature(
-                device_data, "gateway", "router"
-            ) or model.startswith(("UDM", "USG", "UXG", "UCG")):
-                return str(device_id)
-
-        return None
+        return _find_gateway_device_id(
+            self.coordinator.data.get("devices", {}).get(self._site_id, {})
+        )
 
-    def _build_device_info(self) -> DeviceInfo:
+    def _build_device_info(self, gateway_device_id: str | None = None) -> DeviceInfo:
         """Build device info for firewall rule grouping."""
-        gateway_device_id = self._find_gateway_device_id()
+        if gateway_device_id is None:
+            gateway_device_id = self._find_gateway_device_id()
         if gateway_device_id is not None:
             return DeviceInfo(
                 identifiers={(DOMAIN, f"{self._site_id}_{gateway_device_id}")}
@@ -381,11 +383,15 @@ class UnifiFirewallRuleSwitch(
         await self._async_set_enabled(enabled=False)
 
 
-class UnifiProtectMicrophoneSwitch(UnifiProtectEntity, SwitchEntity):
-    """Representation of a UniFi Protect Camera Microphone Switch."""
+class _UnifiProtectCameraSwitch(UnifiProtectEntity, SwitchEntity):
+    """Shared behaviour for UniFi Protect camera setting switches."""
 
     _attr_has_entity_name = True
-    _attr_translation_key = "microphone"
+    _attr_entity_category = EntityCategory.CONFIG
+    # Entity key used for the unique ID, set by subclasses
+    _entity_key: str
+    # Coordinator method used to push the setting change
+    _update_method = "async_update_camera_settings"
 
     def __init__(
         self,
@@ -393,14 +399,39 @@ class UnifiProtectMicrophoneSwitch(UnifiProtectEntity, SwitchEntity):
         camera_id: str,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator, DEVICE_TYPE_CAMERA, camera_id, "microphone")
-
-        # Set entity category
-        self._attr_entity_category = EntityCategory.CONFIG
+        super().__init__(coordinator, DEVICE_TYPE_CAMERA, camera_id, self._entity_key)
 
         # Set initial state
         self._update_from_data()
 
+    async def _async_update_camera(
+        self, error_message: str, *, is_on: bool, **settings: Any
+    ) -> None:
+        """Push a camera setting change and apply the new state locally."""
+        await async_call_coordinator_action(
+            self.coordinator,
+            self._update_method,
+            error_message,
+            self._device_id,
+            fallback_factory=lambda: self.coordinator.protect_client.cameras.update(  # type: ignore[union-attr]
+                self._device_id,
+                **settings,
+            ),
+            **settings,
+        )
+        self._attr_is_on = is_on
+        self.async_write_ha_state()
+
+
+class UnifiProtectMicrophoneSwitch(_UnifiProtectCameraSwitch):
+    """Representation of a UniFi Protect Camera Microphone Switch."""
+
+    _attr_translation_key = "microphone"
+    _entity_key = "microphone"
+    _update_method = "async_update_camera"
+    # Values the current extra state attributes were built from
+    _attributes_source: tuple[Any, ...] | None = None
+
     def _update_from_data(self) -> None:
         """Update entity from data."""
         camera_data = self.coordinator.data["protect"]["cameras"].get(
@@ -414,73 +445,47 @@ class UnifiProtectMicrophoneSwitch(UnifiProtectEntity, SwitchEntity):
             mic_val = camera_data.get("micEnabled", False)
         self._attr_is_on = bool(mic_val)
 
-        # Set attributes
-        self._attr_extra_state_attributes = {
-            ATTR_CAMERA_ID: self._device_id,
-            ATTR_CAMERA_NAME: camera_data.get("name"),
-            ATTR_MIC_ENABLED: self._attr_is_on,
-        }
+        # Set attributes, reusing the current dict when nothing changed
+        camera_name = camera_data.get("name")
+        attributes_source = (camera_name, self._attr_is_on)
+        if attributes_source != self._attributes_source:
+            self._attributes_source = attributes_source
+            self._attr_extra_state_attributes = {
+                ATTR_CAMERA_ID: self._device_id,
+                ATTR_CAMERA_NAME: camera_name,
+                ATTR_MIC_ENABLED: self._attr_is_on,
+            }
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the microphone on."""
         _ = kwargs
         _LOGGER.debug("Turning on microphone for camera %s", self._device_id)
 
-        await async_call_coordinator_action(
-            self.coordinator,
-            "async_update_camera",
+        await self._async_update_camera(
             f"Unable to turn on microphone for camera {self._device_id}",
-            self._device_id,
-            fallback_factory=lambda: self.coordinator.protect_client.cameras.update(  # type: ignore[union-attr]
-                self._device_id,
-                isMicEnabled=True,
-            ),
+            is_on=True,
             isMicEnabled=True,
         )
-        self._attr_is_on = True
-        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the microphone off."""
         _ = kwargs
         _LOGGER.debug("Turning off microphone for camera %s", self._device_id)
 
-        await async_call_coordinator_action(
-            self.coordinator,
-            "async_update_camera",
+        await self._async_update_camera(
             f"Unable to turn off microphone for camera {self._device_id}",
-            self._device_id,
-            fallback_factory=lambda: self.coordinator.protect_client.cameras.update(  # type: ignore[union-attr]
-                self._device_id,
-                isMicEnabled=False,
-            ),
+            is_on=False,
             isMicEnabled=False,
         )
-        self._attr_is_on = False
-        self.async_write_ha_state()
 
 
-class UnifiProtectPrivacySwitch(UnifiProtectEntity, SwitchEntity):
+class UnifiProtectPrivacySwitch(_UnifiProtectCameraSwitch):
     """Representation of a UniFi Protect Camera Privacy Mode Switch."""
 
-    _attr_has_entity_name = True
     _attr_translation_key = "privacy_mode"
+    _entity_key = "privacy_mode"
     _attr_icon = "mdi:eye-off"
 
-    def __init__(
-        self,
-        coordinator: UnifiFacadeCoordinator,
-        camera_id: str,
-    ) -> None:
-        """Initialize the switch."""
-        super().__init__(coordinator, DEVICE_TYPE_CAMERA, camera_id, "privacy_mode")
-
-        # Set entity category
-        self._attr_entity_category = EntityCategory.CONFIG
-
-        # Set initial state
-        self._update_from_data()
-
     def _update_from_data(self) -> None:
         """Update entity from data."""
         camera_data = self.coordinator.data["protect"]["cameras"].get(
@@ -510,61 +515,31 @@ class UnifiProtectPrivacySwitch(UnifiProtectEntity, SwitchEntity):
         _ = kwargs
         _LOGGER.debug("Enabling privacy mode for camera %s", self._device_id)
 
-        await async_call_coordinator_action(
-            self.coordinator,
-            "async_update_camera_settings",
+        await self._async_update_camera(
             f"Unable to enable privacy mode for camera {self._device_id}",
-            self._device_id,
-            fallback_factory=lambda: self.coordinator.protect_client.cameras.update(  # type: ignore[union-attr]
-                self._device_id,
-                is_privacy_mode_enabled=True,
-            ),
+            is_on=True,
             is_privacy_mode_enabled=True,
         )
-        self._attr_is_on = True
-        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn privacy mode off."""
         _ = kwargs
         _LOGGER.debug("Disabling privacy mode for camera %s", self._device_id)
 
-        await async_call_coordinator_action(
-            self.coordinator,
-            "async_update_camera_settings",
+        await self._async_update_camera(
             f"Unable to disable privacy mode for camera {self._device_id}",
-            self._device_id,
-            fallback_factory=lambda: self.coordinator.protect_client.cameras.update(  # type: ignore[union-attr]
-                self._device_id,
-                is_privacy_mode_enabled=False,
-            ),
+            is_on=False,
             is_privacy_mode_enabled=False,
         )
-        self._attr_is_on = False
-        self.async_write_ha_state()
 
 
-class UnifiProtectStatusLightSwitch(UnifiProtectEntity, SwitchEntity):
+class UnifiProtectStatusLightSwitch(_UnifiProtectCameraSwitch):
     """Representation of a UniFi Protect Camera Status Light Switch."""
 
-    _attr_has_entity_name = True
     _attr_translation_key = "status_light"
+    _entity_key = "status_light"
     _attr_icon = "mdi:led-on"
 
-    def __init__(
-        self,
-        coordinator: UnifiFacadeCoordinator,
-        camera_id: str,
-    ) -> None:
-        """Initialize the switch."""
-        super().__init__(coordinator, DEVICE_TYPE_CAMERA, camera_id, "status_light")
-
-        # Set entity category
-        self._attr_entity_category = EntityCategory.CONFIG
-
-        # Set initial state
-        self._update_from_data()
-
     def _update_from_data(self) -> None:
         """Update entity from data."""
         camera_data = self.coordinator.data["protect"]["cameras"].get(
@@ -588,61 +563,31 @@ class UnifiProtectStatusLightSwitch(UnifiProtectEntity, SwitchEntity):
         _ = kwargs
         _LOGGER.debug("Turning on status light for camera %s", self._device_id)
 
-        await async_call_coordinator_action(
-            self.coordinator,
-            "async_update_camera_settings",
+        await self._async_update_camera(
             f"Unable to turn on status light for camera {self._device_id}",
-            self._device_id,
-            fallback_factory=lambda: self.coordinator.protect_client.cameras.update(  # type: ignore[union-attr]
-                self._device_id,
-                led_settings={"isEnabled": True},
-            ),
+            is_on=True,
             led_settings={"isEnabled": True},
         )
-        self._attr_is_on = True
-        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the status light off."""
         _ = kwargs
         _LOGGER.debug("Turning off status light for camera %s", self._device_id)
 
-        await async_call_coordinator_action(
-            self.coordinator,
-            "async_update_camera_settings",
+        await self._async_update_camera(
             f"Unable to turn off status light for camera {self._device_id}",
-            self._device_id,
-            fallback_factory=lambda: self.coordinator.protect_client.cameras.update(  # type: ignore[union-attr]
-                self._device_id,
-                led_settings={"isEnabled": False},
-            ),
+            is_on=False,
             led_settings={"isEnabled": False},
         )
-        self._attr_is_on = False
-        self.async_write_ha_state()
 
 
-class UnifiProtectHighFPSSwitch(UnifiProtectEntity, SwitchEntity):
+class UnifiProtectHighFPSSwitch(_UnifiProtectCameraSwitch):
     """Representation of a UniFi Protect Camera High FPS Mode Switch."""
 
-    _attr_has_entity_name = True
     _attr_translation_key = "high_fps_mode"
+    _entity_key = "high_fps"
     _attr_icon = "mdi:fast-forward"
 
-    def __init__(
-        self,
-        coordinator: UnifiFacadeCoordinator,
-        camera_id: str,
-    ) -> None:
-        """Initialize the switch."""
-        super().__init__(coordinator, DEVICE_TYPE_CAMERA, camera_id, "high_fps")
-
-        # Set entity category
-        self._attr_entity_category = EntityCategory.CONFIG
-
-        # Set initial state
-        self._update_from_data()
-
     def _update_from_data(self) -> None:
         """Update entity from data."""
         camera_data = self.coordinator.data["protect"]["cameras"].get(
@@ -665,38 +610,22 @@ class UnifiProtectHighFPSSwitch(UnifiProtectEntity, SwitchEntity):
         _ = kwargs
         _LOGGER.debug("Enabling high FPS mode for camera %s", self._device_id)
 
-        await async_call_coordinator_action(
-            self.coordinator,
-            "async_update_camera_settings",
+        await self._async_update_camera(
             f"Unable to enable high FPS mode for camera {self._device_id}",
-            self._device_id,
-            fallback_factory=lambda: self.coordinator.protect_client.cameras.update(  # type: ignore[union-attr]
-                self._device_id,
-                video_mode=VIDEO_MODE_HIGH_FPS,
-            ),
+            is_on=True,
             video_mode=VIDEO_MODE_HIGH_FPS,
         )
-        self._attr_is_on = True
-        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Disable high FPS mode (return to default)."""
         _ = kwargs
         _LOGGER.debug("Disabling high FPS mode for camera %s", self._device_id)
 
-        await async_call_coordinator_action(
-            self.coordinator,
-            "async_update_camera_settings",
+        await self._async_update_camera(
             f"Unable to disable high FPS mode for camera {self._device_id}",
-            self._device_id,
-            fallback_factory=lambda: self.coordinator.protect_client.cameras.update(  # type: ignore[union-attr]
-                self._device_id,
-                video_mode=VIDEO_MODE_DEFAULT,
-            ),
+            is_on=False,
             video_mode=VIDEO_MODE_DEFAULT,
         )
-        self._attr_is_on = False
-        self.async_write_ha_state()
 
 
 class UnifiClientBlockSwitch(CoordinatorEntity["UnifiFacadeCoordinator"], SwitchEntity):
@@ -755,8 +684,8 @@ class UnifiClientBlockSwitch(CoordinatorEntity["UnifiFacadeCoordinator"], Switch
     def _get_client_data(self) -> dict[str, Any]:
         """Get client data from coordinator."""
         result: dict[str, Any] = (
-            self.coordinator.data.get("clients", {})
-            .get(self._site_id, {})
+            self.coordinator.data.get("clients", EMPTY_DICT)
+            .get(self._site_id, EMPTY_DICT)
             .get(self._client_id, {})
         )
         return result
@@ -821,6 +750,8 @@ class UnifiWifiSwitch(CoordinatorEntity["UnifiFacadeCoordinator"], SwitchEntity)
     _attr_has_entity_name = True
     _attr_icon = "mdi:wifi"
     _attr_entity_category = EntityCategory.CONFIG
+    # Values the current extra state attributes were built from
+    _attributes_source: tuple[Any, ...] | None = None
 
     def __init__(
         self,
@@ -849,38 +780,55 @@ class UnifiWifiSwitch(CoordinatorEntity["UnifiFacadeCoordinator"], SwitchEntity)
             model="WiFi Network",
         )
 
+        # Set initial state
+        self._update_from_data()
+
     def _get_wifi_data(self) -> dict[str, Any]:
         """Get WiFi data from coordinator."""
         result: dict[str, Any] = (
-            self.coordinator.data.get("wifi", {})
-            .get(self._site_id, {})
+            self.coordinator.data.get("wifi", EMPTY_DICT)
+            .get(self._site_id, EMPTY_DICT)
             .get(self._wifi_id, {})
         )
         return result or self._wifi_data
 
+    def _update_from_data(self) -> None:
+        """Update entity from data."""
+        wifi_data = self._get_wifi_data()
+        self._attr_is_on = bool(wifi_data.get("enabled", True))
+
+        # Only rebuild the attributes dict when one of its values changed
+        ssid = wifi_data.get("ssid")
+        security = wifi_data.get("security")
+        hidden = wifi_data.get("hidden", False)
+        is_guest = wifi_data.get("isGuest", False)
+        attributes_source = (ssid, security, hidden, is_guest)
+        if attributes_source != self._attributes_source:
+            self._attributes_source = attributes_source
+            self._attr_extra_state_attributes = {
+                "wifi_id": self._wifi_id,
+                "ssid": ssid,
+                "security": security,
+                "hidden": hidden,
+                "is_guest": is_guest,
+            }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_data()
+        self.async_write_ha_state()
+
+    def _update_local_state(self, *, enabled: bool) -> None:
+        """Update the cached WiFi data and notify listeners without a refetch."""
+        self._get_wifi_data()["enabled"] = enabled
+        self.coordinator.async_set_updated_data(self.coordinator.data)
+
     @property
     def available(self) -> bool:
         """Return if switch is available."""
         return bool(self.coordinator.last_update_success and self._get_wifi_data())
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if WiFi is enabled."""
-        wifi_data = self._get_wifi_data()
-        return bool(wifi_data.get("enabled", True))
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        wifi_data = self._get_wifi_data()
-        return {
-            "wifi_id": self._wifi_id,
-            "ssid": wifi_data.get("ssid"),
-            "security": wifi_data.get("security"),
-            "hidden": wifi_data.get("hidden", False),
-            "is_guest": wifi_data.get("isGuest", False),
-        }
-
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable the WiFi network."""
         _ = kwargs
@@ -906,7 +854,7 @@ class UnifiWifiSwitch(CoordinatorEntity["UnifiFacadeCoordinator"], SwitchEntity)
             self._wifi_id,
             self._site_id,
         )
-        await self.coordinator.async_request_refresh()
+        self._update_local_state(enabled=True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Disable the WiFi network."""
@@ -933,4 +881,4 @@ class UnifiWifiSwitch(CoordinatorEntity["UnifiFacadeCoordinator"], SwitchEntity)
             self._wifi_id,
             self._site_id,
         )
-        await self.coordinator.async_request_refresh()
+        self._update_local_state(enabled=False)
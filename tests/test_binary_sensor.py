@@ -934,6 +934,31 @@ class TestUnifiPortBinarySensor:
         )
         assert sensor.is_on is False
 
+    async def test_sfp_uses_coordinator_port_index(
+        self, hass: HomeAssistant, mock_coordinator
+    ):
+        """Test SFP binary sensor reads its port from the coordinator index."""
+        mock_coordinator.data["port_index"] = {
+            ("site1", "device1", 25): {"idx": 25, "sfp_found": False}
+        }
+        sensor = UnifiPortBinarySensor(
+            coordinator=mock_coordinator,
+            site_id="site1",
+            device_id="device1",
+            port_idx=25,
+            port_label="SFP+ 1",
+        )
+        assert sensor.is_on is False
+
+        sensor_missing = UnifiPortBinarySensor(
+            coordinator=mock_coordinator,
+            site_id="site1",
+            device_id="device1",
+            port_idx=26,
+            port_label="SFP+ 2",
+        )
+        assert sensor_missing.is_on is None
+
     async def test_sfp_extra_attributes_when_present(
         self, hass: HomeAssistant, mock_coordinator
     ):
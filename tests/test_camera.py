@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from homeassistant.components.camera import CameraEntityFeature
+from yarl import URL
 
 from custom_components.unifi_insights.camera import (
     PARALLEL_UPDATES,
@@ -129,7 +130,7 @@ class TestUnifiProtectCamera:
         """Create mock coordinator."""
         coordinator = MagicMock()
         coordinator.protect_client = MagicMock()
-        coordinator.protect_client.base_url = "https://192.168.1.1"
+        coordinator.protect_client.base_url = URL("https://192.168.1.1")
         coordinator.protect_client.cameras = MagicMock()
         coordinator.protect_client.cameras.get_snapshot = AsyncMock(
             return_value=b"image_data"
@@ -189,6 +189,47 @@ async def test_local_flow_auth_error(hass: HomeAssistant) -> None:
         assert result["errors"] == {CONF_API_KEY: "invalid_auth"}
 
 
+async def test_local_flow_uses_shared_session(hass: HomeAssistant) -> None:
+    """Test local flow validates through Home Assistant's shared session."""
+    session = MagicMock()
+    async_cm = _make_client_context(sites=[MagicMock(id="default")])
+
+    with (
+        patch(
+            "custom_components.unifi_insights.config_flow.UniFiNetworkClient",
+            return_value=async_cm,
+        ) as mock_client_cls,
+        patch(
+            "custom_components.unifi_insights.config_flow.async_get_clientsession",
+            return_value=session,
+        ) as mock_get_session,
+        patch("custom_components.unifi_insights.config_flow.LocalAuth"),
+        patch(
+            "custom_components.unifi_insights.async_setup_entry",
+            return_value=True,
+        ),
+    ):
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            user_input={CONF_CONNECTION_TYPE: CONNECTION_TYPE_LOCAL},
+        )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            user_input={
+                CONF_HOST: "https://192.168.1.1",
+                CONF_API_KEY: "test_api_key",
+                CONF_VERIFY_SSL: True,
+            },
+        )
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    mock_get_session.assert_called_once_with(hass, verify_ssl=True)
+    assert mock_client_cls.call_args.kwargs["session"] is session
+
+
 async def test_local_flow_connection_error(hass: HomeAssistant) -> None:
     """Test local flow with connection error."""
     async_cm = MagicMock()
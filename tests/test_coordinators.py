@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any
@@ -16,6 +17,7 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from custom_components.unifi_insights.api import (
     UniFiAuthenticationError,
     UniFiConnectionError,
+    UniFiRateLimitError,
     UniFiResponseError,
     UniFiTimeoutError,
 )
@@ -23,9 +25,12 @@ from custom_components.unifi_insights.const import (
     CONF_CONNECTION_TYPE,
     CONNECTION_TYPE_LOCAL,
     DOMAIN,
+    MAX_CONCURRENT_DEVICE_REQUESTS,
+    MAX_STORED_EVENTS_PER_TYPE,
     SCAN_INTERVAL_CONFIG,
     SCAN_INTERVAL_DEVICE,
     SCAN_INTERVAL_PROTECT,
+    STORED_EVENT_TTL,
 )
 from custom_components.unifi_insights.coordinators.base import UnifiBaseCoordinator
 from custom_components.unifi_insights.coordinators.config import UnifiConfigCoordinator
@@ -418,6 +423,45 @@ class TestUnifiBaseCoordinator:
             for record in caplog.records
         )
 
+    def test_handle_connection_error_backs_off_exponentially(
+        self, coordinator: UnifiBaseCoordinator
+    ):
+        """Test consecutive connection errors double the jittered retry delay."""
+        err = UniFiConnectionError("Connection refused")
+        interval = coordinator.update_interval.total_seconds()
+
+        with pytest.raises(UpdateFailed) as first:
+            coordinator._handle_connection_error(err)
+        assert interval <= first.value.retry_after <= interval * 1.5
+
+        coordinator.last_update_success = False
+        with pytest.raises(UpdateFailed) as second:
+            coordinator._handle_connection_error(err)
+        assert interval * 2 <= second.value.retry_after <= interval * 3
+
+    def test_handle_rate_limit_error_honors_retry_after(
+        self, coordinator: UnifiBaseCoordinator
+    ):
+        """Test a 429 schedules the retry no sooner than Retry-After."""
+        err = UniFiRateLimitError("Rate limited", status_code=429, retry_after=60)
+
+        with pytest.raises(UpdateFailed, match="API error") as exc_info:
+            coordinator._handle_response_error(err)
+
+        assert 60 <= exc_info.value.retry_after <= 90
+        assert coordinator._available is False
+
+    def test_handle_client_error_does_not_set_retry_after(
+        self, coordinator: UnifiBaseCoordinator
+    ):
+        """Test non-retryable 4xx errors keep the normal update interval."""
+        err = UniFiResponseError("Bad response", status_code=400)
+
+        with pytest.raises(UpdateFailed) as exc_info:
+            coordinator._handle_response_error(err)
+
+        assert exc_info.value.retry_after is None
+
     def test_handle_generic_error(self, coordinator: UnifiBaseCoordinator):
         """Test handling generic error."""
         err = Exception("Something went wrong")
@@ -759,6 +803,35 @@ class TestUnifiDeviceCoordinator:
         assert "device1" in result["devices"]["default"]
         assert "generalTemperature" not in result["devices"]["default"]["device1"]
 
+    @pytest.mark.asyncio
+    async def test_fetch_legacy_site_devices_without_legacy_site(
+        self, coordinator: UnifiDeviceCoordinator
+    ):
+        """Test legacy device fetch is skipped when no legacy site is mapped."""
+        get_legacy = coordinator.network_client.devices.get_legacy_site_devices
+
+        assert await coordinator._fetch_legacy_site_devices("default", None) == []
+        get_legacy.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_legacy_site_names_reused_until_expiry(
+        self, coordinator: UnifiDeviceCoordinator
+    ):
+        """Test the legacy site mapping is only refetched when stale or changed."""
+        get_legacy_all = coordinator.network_client.sites.get_legacy_all
+
+        first = await coordinator._async_get_legacy_site_names(["default"])
+        second = await coordinator._async_get_legacy_site_names(["default"])
+        assert second is first
+        assert get_legacy_all.await_count == 1
+
+        await coordinator._async_get_legacy_site_names(["default", "site2"])
+        assert get_legacy_all.await_count == 2
+
+        coordinator._legacy_site_names_expiry = 0.0
+        await coordinator._async_get_legacy_site_names(["default", "site2"])
+        assert get_legacy_all.await_count == 3
+
     @pytest.mark.asyncio
     async def test_async_update_data_no_sites(
         self, coordinator: UnifiDeviceCoordinator
@@ -786,6 +859,37 @@ class TestUnifiDeviceCoordinator:
         assert "devices" in result
         assert "default" in result["devices"]
 
+    @pytest.mark.asyncio
+    async def test_process_device_concurrency_is_bounded(
+        self, coordinator: UnifiDeviceCoordinator
+    ):
+        """Test per-device stats fetches are capped at the concurrency limit."""
+        active = 0
+        peak = 0
+
+        async def _process(
+            site_id: str, device: dict[str, Any], *_args: Any
+        ) -> tuple[str, dict[str, Any], dict[str, Any]]:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return device["id"], device, {}
+
+        coordinator._process_device = _process
+        devices = [{"id": f"device{idx}"} for idx in range(20)]
+
+        results = await asyncio.gather(
+            *(
+                coordinator._process_device_bounded("default", device, [])
+                for device in devices
+            )
+        )
+
+        assert len(results) == 20
+        assert peak == MAX_CONCURRENT_DEVICE_REQUESTS
+
     @pytest.mark.asyncio
     async def test_process_site_error(self, coordinator: UnifiDeviceCoordinator):
         """Test site processing with error."""
@@ -932,6 +1036,42 @@ class TestUnifiDeviceCoordinator:
             # device2 should be marked for removal
             mock_registry.return_value.async_update_device.assert_called()
 
+    def test_index_ports(self, coordinator: UnifiDeviceCoordinator):
+        """Test ports are indexed by key and UP ports are marked available."""
+        coordinator.data["devices"] = {
+            "default": {
+                "switch1": {
+                    "ports": [
+                        {"idx": 1, "port_idx": 1, "state": "UP"},
+                        {"idx": 2, "port_idx": 2, "state": "DOWN"},
+                    ]
+                },
+                "switch2": {
+                    "interfaces": {
+                        "ports": [
+                            {"idx": 5, "state": "UP"},
+                            {"state": "UP"},
+                        ]
+                    }
+                },
+                "broken": "not-a-dict",
+            }
+        }
+
+        coordinator._index_ports()
+
+        port_index = coordinator.data["port_index"]
+        assert set(port_index) == {
+            ("default", "switch1", 1),
+            ("default", "switch1", 2),
+            ("default", "switch2", 5),
+        }
+        assert port_index[("default", "switch1", 2)]["state"] == "DOWN"
+        assert coordinator.data["available_port_keys"] == {
+            ("default", "switch1", 1),
+            ("default", "switch2", 5),
+        }
+
     @pytest.mark.asyncio
     async def test_process_site_empty_devices(
         self, coordinator: UnifiDeviceCoordinator
@@ -1318,6 +1458,33 @@ class TestUnifiProtectCoordinator:
         with pytest.raises(UpdateFailed):
             await coordinator._async_update_data()
 
+    @pytest.mark.asyncio
+    async def test_async_update_data_fetches_concurrently(
+        self, coordinator: UnifiProtectCoordinator
+    ):
+        """Test the Protect endpoint fetches overlap instead of running in turn."""
+        lights = coordinator.protect_client.lights.get_all.return_value
+        lights_started = asyncio.Event()
+
+        async def _get_lights() -> list[Any]:
+            lights_started.set()
+            return lights
+
+        async def _get_cameras() -> list[Any]:
+            # Only completes if the lights request starts while this one waits
+            await asyncio.wait_for(lights_started.wait(), timeout=1)
+            return []
+
+        coordinator.protect_client.cameras.get_all = AsyncMock(
+            side_effect=_get_cameras
+        )
+        coordinator.protect_client.lights.get_all = AsyncMock(side_effect=_get_lights)
+
+        result = await coordinator._async_update_data()
+
+        assert "light1" in result["lights"]
+        assert coordinator._available is True
+
     def test_handle_device_update_camera(self, coordinator: UnifiProtectCoordinator):
         """Test handling camera device update."""
         coordinator._handle_device_update(
@@ -1357,6 +1524,26 @@ class TestUnifiProtectCoordinator:
 
         assert "viewer2" in coordinator.data["viewers"]
 
+    async def test_handle_updates_notify_listeners_once_per_burst(
+        self, hass: HomeAssistant, coordinator: UnifiProtectCoordinator
+    ):
+        """Test a burst of WebSocket updates triggers a single listener update."""
+        listener = MagicMock()
+        coordinator.async_add_listener(listener)
+
+        coordinator._handle_device_update("light", {"id": "light2", "name": "A"})
+        coordinator._handle_device_update("light", {"id": "light2", "name": "B"})
+        coordinator._handle_event_update("motion", {"id": "event1"})
+        listener.assert_not_called()
+
+        await hass.async_block_till_done()
+        listener.assert_called_once()
+        assert coordinator.data["lights"]["light2"]["name"] == "B"
+
+        coordinator._handle_device_update("light", {"id": "light2", "name": "C"})
+        await hass.async_block_till_done()
+        assert listener.call_count == 2
+
     def test_handle_device_update_chime(self, coordinator: UnifiProtectCoordinator):
         """Test handling chime device update."""
         coordinator._handle_device_update("chime", {"id": "chime2", "name": "Chime 2"})
@@ -1459,6 +1646,38 @@ class TestUnifiProtectCoordinator:
         # Events should not change without event ID
         assert coordinator.data["events"] == initial_events
 
+    def test_handle_event_update_evicts_oldest_events(
+        self, coordinator: UnifiProtectCoordinator
+    ):
+        """Test the per-type event store keeps only the most recent events."""
+        for idx in range(MAX_STORED_EVENTS_PER_TYPE + 5):
+            coordinator._handle_event_update("motion", {"id": f"event{idx}"})
+        # An update to a stored event refreshes its position
+        coordinator._handle_event_update("motion", {"id": "event5", "end": 1})
+        coordinator._handle_event_update("motion", {"id": "new"})
+
+        events = coordinator.data["events"]["motion"]
+        assert len(events) == MAX_STORED_EVENTS_PER_TYPE
+        assert "event5" in events
+        assert "event6" not in events
+        assert list(events)[-2:] == ["event5", "new"]
+
+    def test_handle_event_update_expires_stale_events(
+        self, coordinator: UnifiProtectCoordinator
+    ):
+        """Test events not updated within the TTL are dropped."""
+        coordinator._handle_event_update("motion", {"id": "old"})
+        coordinator._handle_event_update("ring", {"id": "recent"})
+        # Age the first event past the TTL
+        coordinator._event_updated_at[("motion", "old")] -= (
+            STORED_EVENT_TTL.total_seconds() + 1
+        )
+
+        coordinator._handle_event_update("motion", {"id": "new"})
+
+        assert list(coordinator.data["events"]["motion"]) == ["new"]
+        assert list(coordinator.data["events"]["ring"]) == ["recent"]
+
     def test_get_camera_existing(self, coordinator: UnifiProtectCoordinator):
         """Test getting existing camera."""
         coordinator.data["cameras"] = {"camera1": {"id": "camera1", "name": "Test"}}
@@ -1729,6 +1948,23 @@ class TestUnifiProtectCoordinator:
         assert "camera3" in coordinator.data["cameras"]
         assert coordinator.data["cameras"]["camera3"]["smartDetectTypes"] == []
 
+    @pytest.mark.asyncio
+    async def test_fetch_cameras_normalizes_dumped_dict_in_place(
+        self, coordinator: UnifiProtectCoordinator
+    ):
+        """Test camera fetch stores the dumped dict without copying it again."""
+        dumped = {"id": "camera4", "name": "Camera 4"}
+        mock_camera = MagicMock()
+        mock_camera.model_dump = MagicMock(return_value=dumped)
+        coordinator.protect_client.cameras.get_all = AsyncMock(
+            return_value=[mock_camera]
+        )
+
+        await coordinator._fetch_cameras()
+
+        assert coordinator.data["cameras"]["camera4"] is dumped
+        assert dumped["lastMotion"] == 0
+
     @pytest.mark.asyncio
     async def test_async_update_data_response_error(
         self, coordinator: UnifiProtectCoordinator
@@ -2206,6 +2442,22 @@ class TestUnifiFacadeCoordinator:
         with pytest.raises(HomeAssistantError, match="test error"):
             await facade_coordinator._async_execute_api_action("test error", action)
 
+    @pytest.mark.asyncio
+    async def test_async_execute_api_action_api_error_logs_warning(
+        self,
+        facade_coordinator: UnifiFacadeCoordinator,
+        caplog: pytest.LogCaptureFixture,
+    ):
+        """Test expected API errors are logged without a traceback."""
+        action = AsyncMock(side_effect=UniFiConnectionError("unreachable"))
+        with pytest.raises(HomeAssistantError, match="test error"):
+            await facade_coordinator._async_execute_api_action("test error", action)
+
+        records = [r for r in caplog.records if "test error" in r.getMessage()]
+        assert records
+        assert all(r.levelno == logging.WARNING for r in records)
+        assert all(r.exc_info is None for r in records)
+
     @pytest.mark.asyncio
     async def test_async_restart_device(
         self, facade_coordinator: UnifiFacadeCoordinator
@@ -1,6 +1,7 @@
 """Tests for the UniFi Insights integration initialization."""
 
-from typing import TYPE_CHECKING
+import asyncio
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -109,6 +110,39 @@ async def test_setup_entry_protect_unavailable(
     assert mock_config_entry.state == ConfigEntryState.LOADED
 
 
+async def test_setup_entry_validates_apis_concurrently(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_network_client,
+    mock_protect_client,
+    mock_local_auth,
+    enable_custom_integrations,
+) -> None:
+    """Test the Network and Protect checks overlap instead of running in turn."""
+    sites = mock_network_client.sites.get_all.return_value
+    cameras = mock_protect_client.cameras.get_all.return_value
+    protect_started = asyncio.Event()
+
+    async def _get_cameras(*args: Any, **kwargs: Any) -> list[Any]:
+        protect_started.set()
+        return cameras
+
+    async def _get_sites(*args: Any, **kwargs: Any) -> list[Any]:
+        # Only completes if Protect validation starts while this one waits
+        await asyncio.wait_for(protect_started.wait(), timeout=1)
+        return sites
+
+    mock_protect_client.cameras.get_all.side_effect = _get_cameras
+    mock_network_client.sites.get_all.side_effect = _get_sites
+
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert mock_config_entry.state == ConfigEntryState.LOADED
+    assert mock_config_entry.runtime_data.protect_client is mock_protect_client
+
+
 async def test_unload_entry(
     hass: HomeAssistant,
     init_integration: MockConfigEntry,
@@ -227,12 +261,14 @@ async def test_unload_entry_protect_close_error(
         runtime_data.protect_client.close = AsyncMock(
             side_effect=Exception("Close error")
         )
+    runtime_data.network_client.close = AsyncMock()
 
     # Should still unload successfully
     assert await hass.config_entries.async_unload(init_integration.entry_id)
     await hass.async_block_till_done()
 
     assert init_integration.state == ConfigEntryState.NOT_LOADED
+    runtime_data.network_client.close.assert_awaited_once()
 
 
 async def test_unload_entry_network_close_error(
@@ -23,6 +23,7 @@ from custom_components.unifi_insights.sensor import (
     UnifiProtectSensor,
     UnifiProtectSensorEntityDescription,
     UnifiSiteClientSensor,
+    _build_port_specs,
     _bytes_to_gb,
     _calculate_storage_available,
     _calculate_storage_percent,
@@ -548,6 +549,51 @@ class TestUnifiPortSensor:
 
         assert sensor.available is False
 
+    async def test_port_sensor_available_uses_port_index(
+        self, hass: HomeAssistant, mock_coordinator
+    ):
+        """Test port sensor availability is read from the coordinator port index."""
+        description = next(s for s in PORT_SENSOR_TYPES if s.key == "port_speed")
+
+        sensor = UnifiPortSensor(
+            coordinator=mock_coordinator,
+            description=description,
+            site_id="site1",
+            device_id="device1",
+            port_idx=2,  # Port 2 is DOWN in test data
+        )
+        assert sensor.available is False
+
+        # The coordinator index takes precedence over scanning the port list
+        mock_coordinator.data["available_port_keys"] = {("site1", "device1", 2)}
+        assert sensor.available is True
+
+        mock_coordinator.data["available_port_keys"] = set()
+        assert sensor.available is False
+
+    async def test_port_sensor_uses_coordinator_port_index(
+        self, hass: HomeAssistant, mock_coordinator
+    ):
+        """Test port data is looked up in the coordinator port index."""
+        description = next(s for s in PORT_SENSOR_TYPES if s.key == "port_speed")
+
+        sensor = UnifiPortSensor(
+            coordinator=mock_coordinator,
+            description=description,
+            site_id="site1",
+            device_id="device1",
+            port_idx=1,
+        )
+
+        mock_coordinator.data["port_index"] = {
+            ("site1", "device1", 1): {"idx": 1, "state": "UP", "speedMbps": 2500}
+        }
+
+        assert sensor.native_value == 2500
+
+        mock_coordinator.data["port_index"] = {}
+        assert sensor.native_value is None
+
     async def test_port_sensor_no_device_data(
         self, hass: HomeAssistant, mock_coordinator
     ):
@@ -599,6 +645,38 @@ class TestGetPortLabel:
         assert _get_port_label(port, 25) == "SFP+ 25"
 
 
+class TestBuildPortSpecs:
+    """Tests for _build_port_specs helper."""
+
+    def test_build_port_specs(self):
+        """Test only active ports are flattened with their PoE and SFP flags."""
+        devices = {
+            "site1": {
+                "switch1": {
+                    "ports": [
+                        {"idx": 1, "state": "UP", "poe": {"good": True}},
+                        {"idx": 2, "state": "DOWN"},
+                        {
+                            "idx": 25,
+                            "state": "UP",
+                            "media": "SFP+",
+                            "sfp_found": True,
+                        },
+                        {"state": "UP"},
+                    ]
+                },
+                "ap1": {"name": "AP"},
+            }
+        }
+
+        assert _build_port_specs(devices) == {
+            ("site1", "switch1"): [
+                (1, "Port 1", True, False),
+                (25, "SFP+ 25", False, True),
+            ]
+        }
+
+
 class TestSFPPortSensors:
     """Tests for SFP port sensor features."""
 
@@ -750,6 +828,26 @@ class TestSFPPortSensors:
         # Regular port without media/is_uplink/etc. has no attributes
         assert attrs is None
 
+    async def test_setup_adds_entities_per_site(
+        self, hass: HomeAssistant, mock_coordinator, mock_config_entry
+    ):
+        """Test async_setup_entry hands device sensors to HA one site at a time."""
+        mock_config_entry.runtime_data.coordinator = mock_coordinator
+
+        batches: list[list] = []
+
+        def add_entities(new_entities, **kwargs):
+            batches.append(list(new_entities))
+
+        await async_setup_entry(hass, mock_config_entry, add_entities)
+
+        # One batch for site1 devices, then one for site/Protect level sensors
+        assert len(batches) == 2
+        assert all(
+            isinstance(e, (UnifiInsightsSensor, UnifiPortSensor)) for e in batches[0]
+        )
+        assert not any(isinstance(e, UnifiPortSensor) for e in batches[1])
+
     async def test_setup_creates_sfp_sensors(
         self, hass: HomeAssistant, mock_coordinator, mock_config_entry
     ):
@@ -909,6 +1007,43 @@ class TestAsyncSetupEntry:
         port_sensors = [e for e in added_entities if isinstance(e, UnifiPortSensor)]
         assert len(port_sensors) > 0
 
+    async def test_setup_entry_shares_device_info_per_device(
+        self, hass: HomeAssistant, mock_coordinator, mock_config_entry
+    ):
+        """Test that sensors of one device share a single device info."""
+        mock_config_entry.runtime_data.coordinator = mock_coordinator
+
+        added_entities: list = []
+
+        def add_entities(new_entities, **kwargs):
+            added_entities.extend(new_entities)
+
+        await async_setup_entry(hass, mock_config_entry, add_entities)
+
+        device_sensors = [
+            e
+            for e in added_entities
+            if isinstance(e, (UnifiInsightsSensor, UnifiPortSensor))
+            and e._device_id == "device1"
+        ]
+        assert len(device_sensors) > 1
+        assert all(
+            e._attr_device_info is device_sensors[0]._attr_device_info
+            for e in device_sensors
+        )
+
+        port_sensors = [
+            e
+            for e in device_sensors
+            if isinstance(e, UnifiPortSensor) and e._port_idx == 1
+        ]
+        assert len(port_sensors) > 1
+        assert all(
+            e._attr_translation_placeholders
+            is port_sensors[0]._attr_translation_placeholders
+            for e in port_sensors
+        )
+
     async def test_setup_entry_creates_network_temperature_sensor(
         self, hass: HomeAssistant, mock_coordinator, mock_config_entry
     ):
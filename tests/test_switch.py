@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.exceptions import HomeAssistantError
@@ -232,6 +232,24 @@ class TestUnifiProtectMicrophoneSwitch:
         assert attrs[ATTR_CAMERA_NAME] == "Test Camera"
         assert attrs[ATTR_MIC_ENABLED] is True
 
+    def test_extra_state_attributes_reused_when_unchanged(
+        self, mock_coordinator
+    ) -> None:
+        """Test attributes are only rebuilt when their source values change."""
+        switch = UnifiProtectMicrophoneSwitch(
+            coordinator=mock_coordinator,
+            camera_id="camera1",
+        )
+        attrs = switch._attr_extra_state_attributes
+
+        switch._update_from_data()
+        assert switch._attr_extra_state_attributes is attrs
+
+        mock_coordinator.data["protect"]["cameras"]["camera1"]["isMicEnabled"] = False
+        switch._update_from_data()
+        assert switch._attr_extra_state_attributes is not attrs
+        assert switch._attr_extra_state_attributes[ATTR_MIC_ENABLED] is False
+
     @pytest.mark.asyncio
     async def test_async_turn_on_success(self, mock_coordinator) -> None:
         """Test turning microphone on successfully."""
@@ -639,6 +657,29 @@ class TestUnifiWifiSwitch:
         assert attrs["hidden"] is False
         assert attrs["is_guest"] is False
 
+    def test_state_refreshed_on_coordinator_update(self, mock_coordinator) -> None:
+        """Test state and attributes are recomputed on coordinator updates."""
+        wifi_data = mock_coordinator.data["wifi"]["site1"]["wifi1"]
+        switch = UnifiWifiSwitch(
+            coordinator=mock_coordinator,
+            site_id="site1",
+            wifi_id="wifi1",
+            wifi_data=wifi_data,
+        )
+        switch.async_write_ha_state = MagicMock()
+        assert switch.is_on is True
+
+        mock_coordinator.data["wifi"]["site1"]["wifi1"] = {
+            **wifi_data,
+            "enabled": False,
+            "hidden": True,
+        }
+        switch._handle_coordinator_update()
+
+        assert switch.is_on is False
+        assert switch.extra_state_attributes["hidden"] is True
+        switch.async_write_ha_state.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_turn_on_enables_wifi(self, mock_coordinator) -> None:
         """Test turning ON enables the WiFi network."""
@@ -657,7 +698,11 @@ class TestUnifiWifiSwitch:
         mock_coordinator.network_client.wifi.update.assert_called_once_with(
             "site1", "wifi1", enabled=True
         )
-        mock_coordinator.async_request_refresh.assert_called_once()
+        assert mock_coordinator.data["wifi"]["site1"]["wifi1"]["enabled"] is True
+        mock_coordinator.async_set_updated_data.assert_called_once_with(
+            mock_coordinator.data
+        )
+        mock_coordinator.async_request_refresh.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_turn_off_disables_wifi(self, mock_coordinator) -> None:
@@ -676,7 +721,11 @@ class TestUnifiWifiSwitch:
         mock_coordinator.network_client.wifi.update.assert_called_once_with(
             "site1", "wifi1", enabled=False
         )
-        mock_coordinator.async_request_refresh.assert_called_once()
+        assert mock_coordinator.data["wifi"]["site1"]["wifi1"]["enabled"] is False
+        mock_coordinator.async_set_updated_data.assert_called_once_with(
+            mock_coordinator.data
+        )
+        mock_coordinator.async_request_refresh.assert_not_called()
 
     def test_available_when_wifi_data_exists(self, mock_coordinator) -> None:
         """Test switch is available when WiFi data exists."""
@@ -987,6 +1036,27 @@ class TestAsyncSetupEntryFirewallRules:
         ]
         assert len(firewall_switches) == 2
         assert {entity._rule_id for entity in firewall_switches} == {"rule1", "rule2"}
+        assert all(
+            entity._attr_device_info["identifiers"] == {(DOMAIN, "site1_gateway1")}
+            for entity in firewall_switches
+        )
+
+    @pytest.mark.asyncio
+    async def test_setup_entry_resolves_gateway_once_per_site(
+        self, hass, mock_coordinator
+    ) -> None:
+        """Test the site gateway lookup is shared by all firewall rule switches."""
+        mock_entry = MagicMock()
+        mock_entry.runtime_data = MagicMock()
+        mock_entry.runtime_data.coordinator = mock_coordinator
+
+        with patch(
+            "custom_components.unifi_insights.switch._find_gateway_device_id",
+            return_value="gateway1",
+        ) as mock_find:
+            await async_setup_entry(hass, mock_entry, MagicMock())
+
+        mock_find.assert_called_once()
 
 
 class TestUnifiProtectPrivacySwitch:
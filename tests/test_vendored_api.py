@@ -2,12 +2,35 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import aiohttp
 import pytest
 
-from custom_components.unifi_insights.api import ApiKeyAuth, ConnectionType
+from custom_components.unifi_insights.api import (
+    ApiKeyAuth,
+    ConnectionType,
+    UniFiAuthenticationError,
+    UniFiConnectionError,
+    UniFiNotFoundError,
+    UniFiRateLimitError,
+    UniFiResponseError,
+    UniFiTimeoutError,
+)
+from custom_components.unifi_insights.api.base import _redact
+from custom_components.unifi_insights.api.const import (
+    CIRCUIT_BREAKER_THRESHOLD,
+    ETAG_CACHE_MAX_ENTRIES,
+    WS_RECONNECT_MAX_DELAY,
+)
 from custom_components.unifi_insights.api.network import UniFiNetworkClient
+from custom_components.unifi_insights.api.protect import UniFiProtectClient
+from custom_components.unifi_insights.api.protect.websocket import (
+    _iter_messages,
+    _reconnect_delay,
+)
 
 
 def test_build_legacy_api_path_local() -> None:
@@ -39,6 +62,26 @@ def test_build_legacy_api_path_remote() -> None:
     )
 
 
+def test_build_api_path_uses_connection_prefix() -> None:
+    """Test integration API paths use the prefix for the connection type."""
+    local = UniFiNetworkClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        base_url="https://192.168.1.1",
+        connection_type=ConnectionType.LOCAL,
+    )
+    remote = UniFiNetworkClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        connection_type=ConnectionType.REMOTE,
+        console_id="console-id",
+    )
+
+    assert local.build_api_path("sites") == "/proxy/network/integration/v1/sites"
+    assert (
+        remote.build_api_path("/sites")
+        == "/v1/connector/consoles/console-id/network/integration/v1/sites"
+    )
+
+
 def test_build_api_path_remote_requires_console_id() -> None:
     """Test proxied remote API paths require a console ID."""
     client = UniFiNetworkClient(
@@ -64,6 +107,29 @@ def test_build_legacy_global_api_path_remote() -> None:
     )
 
 
+def test_protect_build_api_path_uses_connection_prefix() -> None:
+    """Test Protect API paths use the prefix for the connection type."""
+    local = UniFiProtectClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        base_url="https://192.168.1.1",
+        connection_type=ConnectionType.LOCAL,
+    )
+    remote = UniFiProtectClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        connection_type=ConnectionType.REMOTE,
+        console_id="console-id",
+    )
+
+    assert (
+        local.build_api_path("cameras/cam-1")
+        == "/proxy/protect/integration/v1/cameras/cam-1"
+    )
+    assert (
+        remote.build_api_path("/cameras/cam-1", "site-id")
+        == "/v1/connector/consoles/console-id/protect/integration/v1/cameras/cam-1"
+    )
+
+
 async def test_get_hosts_remote_without_console_id() -> None:
     """Test remote host discovery works before a console ID is selected."""
     client = UniFiNetworkClient(
@@ -391,6 +457,41 @@ async def test_clients_get_all_paginates_automatically() -> None:
     assert client._get.await_count == 2
 
 
+async def test_clients_get_all_fetches_remaining_pages_concurrently() -> None:
+    """Test that pages after the first are requested by offset in one wave."""
+    client = UniFiNetworkClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        base_url="https://192.168.1.1",
+        connection_type=ConnectionType.LOCAL,
+    )
+
+    async def get_page(path: str, *, params: dict[str, Any]) -> dict[str, Any]:
+        offset = params["offset"]
+        return {
+            "offset": offset,
+            "limit": 100,
+            "count": 2,
+            "totalCount": 5,
+            "data": [
+                {
+                    "id": f"c{i}",
+                    "macAddress": f"aa:bb:cc:dd:ee:{i:02d}",
+                    "type": "WIRED",
+                    "name": f"Client {i}",
+                }
+                for i in range(offset, min(offset + 2, 5))
+            ],
+        }
+
+    client._get = AsyncMock(side_effect=get_page)
+
+    result = await client.clients.get_all("site-1")
+
+    assert [c.name for c in result] == [f"Client {i}" for i in range(5)]
+    offsets = [call.kwargs["params"]["offset"] for call in client._get.await_args_list]
+    assert offsets == [0, 2, 4]
+
+
 async def test_clients_get_all_single_page() -> None:
     """Test that get_all stops after one page when all clients fit."""
     client = UniFiNetworkClient(
@@ -456,3 +557,456 @@ async def test_clients_get_all_explicit_limit_no_pagination() -> None:
 
     assert len(result) == 5
     assert client._get.await_count == 1
+
+
+async def test_handle_response_parses_body_once() -> None:
+    """Test JSON responses are parsed from the raw body bytes only once."""
+    client = UniFiNetworkClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        base_url="https://192.168.1.1",
+        connection_type=ConnectionType.LOCAL,
+    )
+    response = MagicMock()
+    response.status = 200
+    response.read = AsyncMock(return_value=b'{"data": [{"id": "site-1"}]}')
+    response.text = AsyncMock()
+    response.json = AsyncMock()
+
+    result = await client._handle_response(response)
+
+    assert result == {"data": [{"id": "site-1"}]}
+    response.text.assert_not_awaited()
+    response.json.assert_not_awaited()
+
+
+async def test_handle_response_non_json_body_returns_none() -> None:
+    """Test a non-JSON success body is logged and returned as None."""
+    client = UniFiNetworkClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        base_url="https://192.168.1.1",
+        connection_type=ConnectionType.LOCAL,
+    )
+    response = MagicMock()
+    response.status = 200
+    response.read = AsyncMock(return_value=b"<html>OK</html>")
+
+    assert await client._handle_response(response) is None
+
+
+@pytest.mark.parametrize(
+    ("status", "error"),
+    [
+        (401, UniFiAuthenticationError),
+        (403, UniFiAuthenticationError),
+        (404, UniFiNotFoundError),
+        (429, UniFiRateLimitError),
+        (500, UniFiResponseError),
+    ],
+)
+async def test_handle_response_maps_error_statuses(
+    status: int, error: type[Exception]
+) -> None:
+    """Test error statuses raise the matching exception type."""
+    client = UniFiNetworkClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        base_url="https://192.168.1.1",
+        connection_type=ConnectionType.LOCAL,
+    )
+    response = MagicMock(status=status, headers={"Retry-After": "5"})
+    response.read = AsyncMock(return_value=b'{"error": "nope"}')
+
+    with pytest.raises(error) as exc_info:
+        await client._handle_response(response)
+
+    if status == 429:
+        assert exc_info.value.retry_after == 5
+
+
+@pytest.mark.parametrize(
+    ("response", "expected"),
+    [
+        ({"data": [{"id": "a"}]}, [{"id": "a"}]),
+        ([{"id": "b"}], [{"id": "b"}]),
+        ({"data": {"id": "c"}}, []),
+        ({"id": "d"}, []),
+        (None, []),
+    ],
+)
+def test_unwrap_list_handles_response_shapes(
+    response: dict[str, Any] | list[Any] | None, expected: list[Any]
+) -> None:
+    """Test list payloads are unwrapped and anything else yields an empty list."""
+    assert UniFiNetworkClient._unwrap_list(response) == expected
+
+
+async def test_firewall_list_rules_unwraps_paginated_responses() -> None:
+    """Test list_rules unwraps every page into FirewallRule models."""
+    client = UniFiNetworkClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        base_url="https://192.168.1.1",
+        connection_type=ConnectionType.LOCAL,
+    )
+
+    async def get_page(path: str, *, params: dict[str, Any]) -> dict[str, Any]:
+        offset = params["offset"]
+        return {
+            "offset": offset,
+            "limit": 200,
+            "totalCount": 201,
+            "data": [{"id": f"rule-{offset}", "name": f"Rule {offset}"}],
+        }
+
+    client._get = AsyncMock(side_effect=get_page)
+
+    rules = await client.firewall.list_rules("site-1")
+
+    assert [rule.id for rule in rules] == ["rule-0", "rule-200"]
+    assert client._get.await_count == 2
+
+
+async def test_firewall_list_rules_explicit_limit_no_pagination() -> None:
+    """Test list_rules with an explicit limit parses a single bare list."""
+    client = UniFiNetworkClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        base_url="https://192.168.1.1",
+        connection_type=ConnectionType.LOCAL,
+    )
+    client._get = AsyncMock(return_value=[{"id": "rule-1", "name": "Block IoT"}])
+
+    rules = await client.firewall.list_rules("site-1", limit=1)
+
+    assert len(rules) == 1
+    assert rules[0].name == "Block IoT"
+    client._get.assert_awaited_once()
+
+
+def test_redact_masks_whole_sensitive_values() -> None:
+    """Test sensitive values are masked even when they contain a colon."""
+    text = '{"token" : "abc:def", "name": "Office", "Password":"p"}'
+
+    assert _redact(text) == (
+        '{"token" : "**REDACTED**", "name": "Office", "Password": "**REDACTED**"}'
+    )
+
+
+def test_get_headers_returns_independent_copy() -> None:
+    """Test callers can modify returned headers without affecting defaults."""
+    client = UniFiNetworkClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        base_url="https://192.168.1.1",
+        connection_type=ConnectionType.LOCAL,
+    )
+
+    headers = client._get_headers()
+    assert headers["X-API-Key"] == "test-key"
+
+    headers.pop("Content-Type")
+    assert client._get_headers()["Content-Type"] == "application/json"
+
+
+async def test_request_coalesces_concurrent_identical_gets() -> None:
+    """Test concurrent identical GETs share one request but writes do not."""
+    client = UniFiNetworkClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        base_url="https://192.168.1.1",
+        connection_type=ConnectionType.LOCAL,
+    )
+    release = asyncio.Event()
+
+    async def _send(*_args: Any, **_kwargs: Any) -> dict[str, Any]:
+        await release.wait()
+        return {"data": []}
+
+    client._send_request = AsyncMock(side_effect=_send)
+
+    gets = [
+        asyncio.ensure_future(client._request("GET", "/sites", params={"limit": 1}))
+        for _ in range(3)
+    ]
+    other = asyncio.ensure_future(client._request("GET", "/sites", params={"limit": 2}))
+    post = asyncio.ensure_future(client._request("POST", "/sites", json_data={}))
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*gets, other, post)
+
+    assert results == [{"data": []}] * 5
+    assert client._send_request.await_count == 3
+    assert client._inflight == {}
+    cache_keys = {
+        call.kwargs.get("cache_key") for call in client._send_request.await_args_list
+    }
+    assert cache_keys == {
+        client._request_key("/sites", {"limit": 1}),
+        client._request_key("/sites", {"limit": 2}),
+        None,
+    }
+
+
+async def test_handle_response_reuses_body_on_not_modified() -> None:
+    """Test a 304 reply is served from the body stored with its ETag."""
+    client = UniFiNetworkClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        base_url="https://192.168.1.1",
+        connection_type=ConnectionType.LOCAL,
+    )
+    cache_key = client._request_key("/sites", None)
+
+    first = MagicMock()
+    first.status = 200
+    first.headers = {"ETag": '"abc"'}
+    first.read = AsyncMock(return_value=b'{"data": [{"id": "site-1"}]}')
+    assert await client._handle_response(first, cache_key=cache_key) == {
+        "data": [{"id": "site-1"}]
+    }
+    assert client._etag_cache[cache_key][0] == '"abc"'
+
+    not_modified = MagicMock()
+    not_modified.status = 304
+    not_modified.headers = {"ETag": '"abc"'}
+    not_modified.read = AsyncMock(return_value=b"")
+
+    result = await client._handle_response(not_modified, cache_key=cache_key)
+
+    assert result == {"data": [{"id": "site-1"}]}
+    not_modified.read.assert_not_awaited()
+
+
+async def test_etag_cache_evicts_least_recently_used() -> None:
+    """Test the ETag cache stays bounded and drops the stalest entry first."""
+    client = UniFiNetworkClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        base_url="https://192.168.1.1",
+        connection_type=ConnectionType.LOCAL,
+    )
+
+    async def _store(path: str) -> None:
+        response = MagicMock(status=200, headers={"ETag": f'"{path}"'})
+        response.read = AsyncMock(return_value=b'{"data": []}')
+        await client._handle_response(
+            response, cache_key=client._request_key(path, None)
+        )
+
+    for index in range(ETAG_CACHE_MAX_ENTRIES):
+        await _store(f"/path/{index}")
+    # Refreshing the oldest entry makes the second oldest the next to go
+    await _store("/path/0")
+    await _store("/path/new")
+
+    assert len(client._etag_cache) == ETAG_CACHE_MAX_ENTRIES
+    assert client._request_key("/path/0", None) in client._etag_cache
+    assert client._request_key("/path/1", None) not in client._etag_cache
+    assert client._request_key("/path/new", None) in client._etag_cache
+
+
+async def test_vouchers_create_sends_only_provided_options() -> None:
+    """Test voucher creation omits options that were not provided."""
+    client = UniFiNetworkClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        base_url="https://192.168.1.1",
+        connection_type=ConnectionType.LOCAL,
+    )
+    client._post = AsyncMock(return_value={"data": [{"id": "v1", "code": "12345"}]})
+
+    vouchers = await client.vouchers.create(
+        "site-1", count=2, name="Lobby", time_limit_minutes=60
+    )
+
+    assert [voucher.id for voucher in vouchers] == ["v1"]
+    assert client._post.await_args.kwargs["json_data"] == {
+        "count": 2,
+        "name": "Lobby",
+        "timeLimitMinutes": 60,
+    }
+
+
+async def test_request_circuit_opens_after_consecutive_failures() -> None:
+    """Test requests fail fast once the controller keeps failing to respond."""
+    client = UniFiNetworkClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        base_url="https://192.168.1.1",
+        connection_type=ConnectionType.LOCAL,
+    )
+    session = MagicMock()
+    session.request = MagicMock(side_effect=aiohttp.ClientError("unreachable"))
+    client._ensure_session = AsyncMock(return_value=session)
+
+    for _ in range(CIRCUIT_BREAKER_THRESHOLD):
+        with pytest.raises(UniFiConnectionError, match="failed"):
+            await client._request("POST", "/sites")
+
+    with pytest.raises(UniFiConnectionError, match="Skipping request"):
+        await client._request("POST", "/sites")
+    assert session.request.call_count == CIRCUIT_BREAKER_THRESHOLD
+
+    # After the cooldown a single probe is let through and resets on success
+    client._breaker_open_until = 0.0
+    client._handle_response = AsyncMock(return_value={"data": []})
+    session.request = MagicMock()
+    session.request.return_value.__aenter__ = AsyncMock()
+    session.request.return_value.__aexit__ = AsyncMock(return_value=None)
+
+    assert await client._request("POST", "/sites") == {"data": []}
+    assert client._breaker_failures == 0
+
+
+async def test_protect_websocket_connect_shares_circuit_breaker() -> None:
+    """Test WebSocket handshakes count failures and respect an open circuit."""
+    client = UniFiProtectClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        base_url="https://192.168.1.1",
+        connection_type=ConnectionType.LOCAL,
+    )
+    session = MagicMock()
+    session.ws_connect = AsyncMock(side_effect=aiohttp.ClientConnectionError())
+    client._ensure_session = AsyncMock(return_value=session)
+
+    for _ in range(CIRCUIT_BREAKER_THRESHOLD):
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await client.websocket._connect("/subscribe/devices")
+
+    with pytest.raises(UniFiConnectionError, match="Skipping request"):
+        await client.websocket._connect("/subscribe/devices")
+    assert session.ws_connect.await_count == CIRCUIT_BREAKER_THRESHOLD
+
+    # Once the cooldown passes, a successful handshake closes the circuit
+    client._breaker_open_until = 0.0
+    session.ws_connect = AsyncMock(return_value=MagicMock())
+    await client.websocket._connect("/subscribe/devices")
+    assert client._breaker_failures == 0
+    assert session.ws_connect.await_args.args[0].startswith("wss://")
+
+
+def test_protect_binary_headers_built_once() -> None:
+    """Test binary downloads use prebuilt headers without a JSON content type."""
+    client = UniFiProtectClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        base_url="https://192.168.1.1",
+        connection_type=ConnectionType.LOCAL,
+    )
+
+    assert client._binary_headers["X-API-Key"] == "test-key"
+    assert client._binary_headers["Accept"] == "*/*"
+    assert "Content-Type" not in client._binary_headers
+    # The JSON defaults are left untouched
+    assert client._get_headers()["Accept"] == "application/json"
+
+
+async def test_protect_get_binary_shares_request_error_handling() -> None:
+    """Test binary downloads go through the shared transport error handling."""
+    client = UniFiProtectClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        base_url="https://192.168.1.1",
+        connection_type=ConnectionType.LOCAL,
+    )
+    response = MagicMock(status=200)
+    response.read = AsyncMock(return_value=b"\xff\xd8jpeg")
+    session = MagicMock()
+    session.request.return_value.__aenter__ = AsyncMock(return_value=response)
+    session.request.return_value.__aexit__ = AsyncMock(return_value=None)
+    client._ensure_session = AsyncMock(return_value=session)
+
+    assert await client._get_binary("/cameras/cam-1/snapshot") == b"\xff\xd8jpeg"
+    assert session.request.call_args.kwargs["headers"] is client._binary_headers
+    # The client's timeouts apply even when it runs on a shared session
+    assert session.request.call_args.kwargs["timeout"] is client._timeout
+
+    session.request = MagicMock(side_effect=aiohttp.ClientError("unreachable"))
+    with pytest.raises(UniFiConnectionError, match="failed"):
+        await client._get_binary("/cameras/cam-1/snapshot")
+    assert client._breaker_failures == 1
+
+
+async def test_send_request_retries_transient_get_failures() -> None:
+    """Test GETs are retried on transient errors while other methods are not."""
+    client = UniFiNetworkClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        base_url="https://192.168.1.1",
+        connection_type=ConnectionType.LOCAL,
+    )
+    client._raw_request = AsyncMock(
+        side_effect=[
+            UniFiTimeoutError("timed out"),
+            UniFiResponseError("Bad gateway", status_code=502),
+            {"data": []},
+        ]
+    )
+
+    with patch(
+        "custom_components.unifi_insights.api.base.REQUEST_RETRY_BASE_DELAY", 0
+    ):
+        assert await client._send_request("GET", "/sites") == {"data": []}
+        assert client._raw_request.await_count == 3
+
+        client._raw_request = AsyncMock(side_effect=UniFiTimeoutError("timed out"))
+        with pytest.raises(UniFiTimeoutError):
+            await client._send_request("POST", "/sites")
+        assert client._raw_request.await_count == 1
+
+        client._raw_request = AsyncMock(
+            side_effect=UniFiResponseError("Bad request", status_code=400)
+        )
+        with pytest.raises(UniFiResponseError):
+            await client._send_request("GET", "/sites")
+        assert client._raw_request.await_count == 1
+
+
+async def test_protect_websocket_rejects_unknown_subscription_type() -> None:
+    """Test callback subscriptions only accept the known channels."""
+    client = UniFiProtectClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        base_url="https://192.168.1.1",
+        connection_type=ConnectionType.LOCAL,
+    )
+
+    with pytest.raises(ValueError, match="subscription_type"):
+        await client.websocket.subscribe_with_callback(
+            "host-id", "default", "cameras", lambda _: None
+        )
+
+
+async def test_protect_get_snapshot_quality_params() -> None:
+    """Test snapshots only send the highQuality flag when requested."""
+    client = UniFiProtectClient(
+        auth=ApiKeyAuth(api_key="test-key"),
+        base_url="https://192.168.1.1",
+        connection_type=ConnectionType.LOCAL,
+    )
+    client._get_binary = AsyncMock(return_value=b"jpeg")
+
+    await client.cameras.get_snapshot("cam-1")
+    assert client._get_binary.await_args.kwargs["params"] is None
+
+    await client.cameras.get_snapshot("cam-1", high_quality=True)
+    assert client._get_binary.await_args.args == (
+        "/proxy/protect/integration/v1/cameras/cam-1/snapshot",
+    )
+    assert client._get_binary.await_args.kwargs["params"] == {"highQuality": "true"}
+
+
+def test_protect_websocket_reconnect_delay_uses_decorrelated_jitter() -> None:
+    """Test reconnect delays stay between the base and triple the last delay."""
+    delay = 0.0
+    for _ in range(100):
+        previous = delay
+        delay = _reconnect_delay(5.0, previous)
+        assert 5.0 <= delay <= min(max(5.0, previous * 3), WS_RECONNECT_MAX_DELAY)
+
+    assert _reconnect_delay(5.0, 0.0) == 5.0
+    assert _reconnect_delay(5.0, WS_RECONNECT_MAX_DELAY) <= WS_RECONNECT_MAX_DELAY
+
+
+async def test_protect_websocket_iter_messages_decodes_until_close() -> None:
+    """Test text frames are decoded, bad JSON skipped and a close ends the stream."""
+
+    async def _frames() -> Any:
+        yield MagicMock(type=aiohttp.WSMsgType.TEXT, data='{"type": "add"}')
+        yield MagicMock(type=aiohttp.WSMsgType.TEXT, data="not json")
+        yield MagicMock(type=aiohttp.WSMsgType.BINARY, data=b"")
+        yield MagicMock(type=aiohttp.WSMsgType.TEXT, data='{"type": "update"}')
+        yield MagicMock(type=aiohttp.WSMsgType.CLOSED, data=None)
+        yield MagicMock(type=aiohttp.WSMsgType.TEXT, data='{"type": "late"}')
+
+    messages = [message async for message in _iter_messages(_frames())]
+
+    assert messages == [{"type": "add"}, {"type": "update"}]